@@ -7,7 +7,7 @@ from deephaven.plugin.object_type import BidirectionalObjectType, MessageStream
 from plotly.graph_objs import Figure
 
 from .communication.DeephavenFigureConnection import DeephavenFigureConnection
-from .deephaven_figure import DeephavenFigure
+from .deephaven_figure import DeephavenFigure, export_images, ImageExportResult
 
 from .plots import (
     area,
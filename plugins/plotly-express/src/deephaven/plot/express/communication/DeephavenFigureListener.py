@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from functools import partial
 from typing import Any
 import io
@@ -10,16 +11,34 @@ from deephaven.table_listener import listen, TableUpdate
 from deephaven.liveness_scope import LivenessScope
 
 from ..exporter import Exporter
-from ..deephaven_figure import DeephavenFigure, DeephavenFigureNode, RevisionManager
+from ..deephaven_figure import (
+    DeephavenFigure,
+    DeephavenFigureNode,
+    RevisionManager,
+    recreate_nodes,
+)
+from .FigureUpdateCoalescer import FigureUpdateCoalescer
+from .SharedFigureGraph import SharedFigureGraph
+
+# How long to wait for viewport changes to settle before rebinning, in seconds
+VIEWPORT_DEBOUNCE_SECONDS = 0.1
 
 
 class DeephavenFigureListener:
     """
     Listener for DeephavenFigure
 
+    Connections start on a figure graph that is shared with every other connection
+    to the same figure, so updates are only recreated once regardless of the
+    number of viewers. A connection splits into its own copy of the figure once
+    it sends state that only applies to itself, such as filters.
+
     Attributes:
         _connection: MessageStream: The connection to send messages to
-        _figure: DeephavenFigure: The figure to listen to
+        _source_figure: DeephavenFigure: The figure the connection was created for
+        _figure: DeephavenFigure | None: This connection's own copy of the figure,
+            None while the shared graph is used
+        _shared_graph: SharedFigureGraph | None: The shared graph, None once split
         _exporter: Exporter: The exporter to use for exporting the figure
         _liveness_scope: Any: The liveness scope to use for the listeners
         _listeners: list[Any]: The listeners for the partitioned tables
@@ -27,6 +46,18 @@ class DeephavenFigureListener:
             The partitioned tables to listen to
         _revision_manager: RevisionManager: The revision manager to use for the figure
         _handles: list[Any]: The handles for the listeners
+        _lock: threading.Lock: The lock guarding which graph is used and the
+            messages sent from it
+        _split_lock: threading.Lock: The lock preventing the connection from splitting twice
+        _graph_lock: threading.Lock: The lock serializing changes to this connection's
+            own copy of the figure, such as partition, filter and viewport updates,
+            which run on different threads
+        _viewport_lock: threading.Lock: The lock guarding the pending viewport
+        _viewport_timer: threading.Timer | None: The timer that applies the pending viewport
+        _pending_viewport: dict[str, list[float] | None] | None: The most recent viewport
+            sent by the client that has not been applied yet
+        _coalescer: FigureUpdateCoalescer: Recreates this connection's own copy of the
+            figure off the listener thread, once per burst of partition updates
     """
 
     def __init__(
@@ -43,25 +74,53 @@ class DeephavenFigureListener:
         """
         self._connection = connection
 
-        # copy the figure so only this session's figure is updated
-        # the liveness scope is needed to keep any tables alive
-        self._figure = figure.copy()
+        self._source_figure = figure
+        self._figure = None
         self._exporter = Exporter()
+        # the liveness scope is needed to keep any tables alive
         self._liveness_scope = LivenessScope()
         # store hard references to the handles so they don't get garbage collected
         self._handles = []
         self._listeners = []
+        self._partitioned_tables = {}
         self._revision_manager = RevisionManager()
+        self._lock = threading.Lock()
+        self._split_lock = threading.Lock()
+        self._graph_lock = threading.Lock()
+        self._viewport_lock = threading.Lock()
+        self._viewport_timer = None
+        self._pending_viewport = None
+        self._coalescer = FigureUpdateCoalescer(self._recreate)
 
-        head_node = self._figure.get_head_node()
-        self._partitioned_tables = head_node.partitioned_tables
+        self._shared_graph = SharedFigureGraph.acquire(figure, self)
 
-        self._setup_listeners()
+    def _split(self) -> None:
+        """
+        Split from the shared graph into a copy of the figure only used by this
+        connection. Nothing is done if the connection already has its own copy.
+        """
+        with self._split_lock:
+            if self._figure is not None or self._shared_graph is None:
+                return
 
-        # force figure to be recreated after listeners are setup
-        # this ensures the figures are created correctly
-        # such as when partitions have been added but no listeners have been running
-        self._figure.recreate_figure()
+            # copy the figure so only this session's figure is updated
+            figure = self._source_figure.copy()
+            self._partitioned_tables = figure.get_head_node().partitioned_tables
+
+            self._setup_listeners()
+
+            # force figure to be recreated after listeners are setup
+            # this ensures the figures are created correctly
+            # such as when partitions have been added but no listeners have been running
+            figure.recreate_figure()
+
+            with self._lock:
+                shared_graph = self._shared_graph
+                self._figure = figure
+                self._shared_graph = None
+
+        if shared_graph is not None:
+            shared_graph.release(self)
 
     def _setup_listeners(self) -> None:
         """
@@ -78,6 +137,17 @@ class DeephavenFigureListener:
                 self._handles.append(handle)
                 self._liveness_scope.manage(handle)
 
+    def _current_figure(self) -> DeephavenFigure:
+        """
+        Get the figure graph this connection currently uses
+
+        Returns:
+            Either this connection's own copy of the figure or the shared figure
+        """
+        if self._figure is not None:
+            return self._figure
+        return self._shared_graph.figure  # type: ignore
+
     def _get_figure(self) -> DeephavenFigure | None:
         """
         Get the current figure
@@ -85,13 +155,41 @@ class DeephavenFigureListener:
         Returns:
             The current figure
         """
-        return self._figure.get_figure()
+        return self._current_figure().get_figure()
+
+    def _send_figure(self, revision: int | None = None) -> None:
+        """
+        Send the current figure to the client
+
+        Args:
+            revision: The revision to send. A new revision is used if None.
+        """
+        if revision is None:
+            revision = self._revision_manager.get_revision()
+        figure = self._get_figure()
+        try:
+            self._connection.on_data(*self._build_figure_message(figure, revision))
+        except RuntimeError:
+            # trying to send data when the connection is closed, ignore
+            pass
+
+    def on_shared_update(self, shared_graph: SharedFigureGraph) -> None:
+        """
+        Send the figure after the shared graph has been updated.
+
+        Args:
+            shared_graph: The shared graph that was updated
+        """
+        with self._lock:
+            # the connection may have split from the shared graph since the update started
+            if self._connection and self._shared_graph is shared_graph:
+                self._send_figure()
 
     def _on_update(
         self, node: DeephavenFigureNode, update: TableUpdate, is_replay: bool
     ) -> None:
         """
-        Update the figure. Because this is called when the PartitionedTable
+        Queue the node to be recreated. Because this is called when the PartitionedTable
         meta table is updated, it will always trigger a rerender.
 
         Args:
@@ -101,19 +199,31 @@ class DeephavenFigureListener:
                 snapshot. Replays only update the cached figure to make sure nothing is
                 missed. It's assumed the retrieve message sends the figure later.
         """
-        if self._connection:
-            revision = self._revision_manager.get_revision()
-            node.recreate_figure()
+        if not self._connection:
+            return
+        if is_replay:
             # Replays only update the cached figure to make sure nothing is
             # missed. It's assumed the retrieve message sends the figure later.
-            if is_replay:
-                return
-            figure = self._get_figure()
-            try:
-                self._connection.on_data(*self._build_figure_message(figure, revision))
-            except RuntimeError:
-                # trying to send data when the connection is closed, ignore
-                pass
+            node.recreate_figure()
+            return
+        # recreate on a worker so the update graph is not held up
+        self._coalescer.add(node)
+
+    def _recreate(self, nodes: list[DeephavenFigureNode]) -> None:
+        """
+        Recreate the figure from the nodes updated during an update window, and
+        send it to the client
+
+        Args:
+            nodes: The updated nodes
+        """
+        if not self._connection:
+            return
+        revision = self._revision_manager.get_revision()
+        with self._graph_lock:
+            recreate_nodes(nodes)
+            with self._lock:
+                self._send_figure(revision)
 
     def _handle_retrieve_figure(self) -> tuple[bytes, list[Any]]:
         """
@@ -150,6 +260,10 @@ class DeephavenFigureListener:
 
             new_figure = figure.to_dict(exporter=exporter)
 
+            if self._current_figure().supports_viewport:
+                # the client only sends the visible ranges if they are used
+                new_figure["deephaven"]["supports_viewport"] = True
+
             new_objects, new_references, removed_references = exporter.references()
 
             message = {
@@ -163,6 +277,62 @@ class DeephavenFigureListener:
             # otherwise, don't need to send anything, as a newer revision has
             # already been sent
 
+    def _handle_viewport(self, viewport: dict[str, list[float] | None] | None) -> None:
+        """
+        Handle a viewport message. Viewport changes come in bursts while the user
+        zooms or pans, so only the latest viewport within the debounce window is applied.
+
+        Args:
+            viewport: A dict mapping axis (x or y, or lat or lon for maps) to the
+                visible [min, max] range
+        """
+        with self._viewport_lock:
+            self._pending_viewport = viewport
+            if self._viewport_timer is not None:
+                self._viewport_timer.cancel()
+            self._viewport_timer = threading.Timer(
+                VIEWPORT_DEBOUNCE_SECONDS, self._apply_viewport
+            )
+            self._viewport_timer.daemon = True
+            self._viewport_timer.start()
+
+    def _apply_viewport(self) -> None:
+        """
+        Apply the pending viewport and send the rebinned figure to the client
+        """
+        with self._viewport_lock:
+            viewport = self._pending_viewport
+            self._viewport_timer = None
+
+        with self._graph_lock:
+            # the viewport only applies to this connection
+            self._split()
+            self._figure.update_viewport(viewport)  # type: ignore
+            with self._lock:
+                self._send_figure()
+
+    def close(self) -> None:
+        """
+        Cancel any pending work for the connection and stop using the shared graph
+        """
+        if not hasattr(self, "_shared_graph"):
+            # __init__ failed before the connection was set up, so there is nothing to cancel
+            return
+
+        self._coalescer.cancel()
+
+        with self._viewport_lock:
+            if self._viewport_timer is not None:
+                self._viewport_timer.cancel()
+                self._viewport_timer = None
+
+        with self._lock:
+            shared_graph = self._shared_graph
+            self._shared_graph = None
+
+        if shared_graph is not None:
+            shared_graph.release(self)
+
     def process_message(
         self, payload: bytes, references: list[Any]
     ) -> tuple[bytes, list[Any]]:
@@ -183,16 +353,21 @@ class DeephavenFigureListener:
         if message["type"] == "RETRIEVE":
             return self._handle_retrieve_figure()
         elif message["type"] == "FILTER":
-            self._figure.update_filters(message["filterMap"])
-            revision = self._revision_manager.get_revision()
-            # updating the filters automatically recreates the figure, so it's ready to send
-            figure = self._get_figure()
-            try:
-                self._connection.on_data(*self._build_figure_message(figure, revision))
-            except RuntimeError:
-                # trying to send data when the connection is closed, ignore
-                pass
+            with self._graph_lock:
+                # filters only apply to this connection
+                self._split()
+                self._figure.update_filters(message["filterMap"])  # type: ignore
+                # updating the filters automatically recreates the figure, so it's ready to send
+                with self._lock:
+                    self._send_figure()
+        elif message["type"] == "VIEWPORT":
+            # viewports of figures that are not rebinned don't need their own copy
+            if self._current_figure().supports_viewport:
+                self._handle_viewport(message.get("viewport"))
         return b"", []
 
     def __del__(self):
-        self._liveness_scope.release()
+        self.close()
+        # __init__ may have failed partway, before the liveness scope was created
+        if hasattr(self, "_liveness_scope"):
+            self._liveness_scope.release()
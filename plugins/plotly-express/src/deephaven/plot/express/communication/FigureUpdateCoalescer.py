@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable
+
+from ..deephaven_figure import DeephavenFigureNode
+
+logger = logging.getLogger(__name__)
+
+# How long to collect partition updates before recreating the figure, in seconds
+# Set this before a figure is opened to change the window of its connections
+UPDATE_WINDOW_SECONDS = 0.1
+
+
+class FigureUpdateCoalescer:
+    """
+    Collects the nodes of a figure graph updated by partition table listeners,
+    and recreates them together on a worker thread once the update window ends.
+    This keeps recreation off the update graph thread, and a burst of updates,
+    such as many partitions appearing at once or several quick update cycles,
+    results in one recreation and one message per window.
+
+    Attributes:
+        _recreate: Callable[[list[DeephavenFigureNode]], None]: Recreates the figure
+            from the updated nodes, and sends it
+        _window: float: The length of the update window in seconds
+        _pending: dict[int, DeephavenFigureNode]: The nodes updated since the last
+            recreation, by id
+        _timer: threading.Timer | None: The timer that ends the current window,
+            None if no updates are pending
+        _lock: threading.Lock: The lock guarding the pending nodes and the timer
+        _recreate_lock: threading.Lock: The lock ensuring only one recreation runs
+            at a time, as a recreation may take longer than a window
+    """
+
+    def __init__(
+        self,
+        recreate: Callable[[list[DeephavenFigureNode]], None],
+        window: float | None = None,
+    ):
+        """
+        Create a new coalescer
+
+        Args:
+            recreate: Recreates the figure from the updated nodes, and sends it.
+                Called on a worker thread.
+            window: The length of the update window in seconds.
+                Defaults to UPDATE_WINDOW_SECONDS.
+        """
+        self._recreate = recreate
+        self._window = UPDATE_WINDOW_SECONDS if window is None else window
+        self._pending = {}
+        self._timer = None
+        self._lock = threading.Lock()
+        self._recreate_lock = threading.Lock()
+
+    def add(self, node: DeephavenFigureNode) -> None:
+        """
+        Add an updated node, starting a new window if none is open
+
+        Args:
+            node: The node that was updated
+        """
+        with self._lock:
+            self._pending[id(node)] = node
+            if self._timer is None:
+                self._timer = threading.Timer(self._window, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush(self) -> None:
+        """
+        Recreate the figure from the nodes updated during the window
+        """
+        with self._recreate_lock:
+            with self._lock:
+                if self._timer is not threading.current_thread():
+                    # cancelled after the timer fired
+                    return
+                nodes = list(self._pending.values())
+                self._pending = {}
+                self._timer = None
+
+            try:
+                self._recreate(nodes)
+            except Exception:
+                # nothing else would see the error on the worker thread
+                logger.exception("Failed to recreate figure after partition update")
+
+    def cancel(self) -> None:
+        """
+        Cancel the pending recreation, if any
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending = {}
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from concurrent.futures import Future
+from functools import partial
+from typing import TYPE_CHECKING
+
+from deephaven.table_listener import listen, TableUpdate
+from deephaven.liveness_scope import LivenessScope
+
+from ..deephaven_figure import DeephavenFigure, DeephavenFigureNode, recreate_nodes
+from .FigureUpdateCoalescer import FigureUpdateCoalescer
+
+if TYPE_CHECKING:
+    from .DeephavenFigureListener import DeephavenFigureListener
+
+
+class SharedFigureGraph:
+    """
+    A figure graph shared by every connection to a figure that has not been
+    filtered. The figure is recreated once per window of partition updates,
+    regardless of the number of connections, and each subscribed listener then
+    sends the result to its own client.
+
+    Graphs are reference counted by their subscribers and released once the
+    last subscriber unsubscribes.
+
+    Graphs are registered as futures, so the graph is built and its listeners are
+    registered without holding the lock on the registry. Registering a listener
+    takes the update graph lock, which must not be waited on while other
+    connections are blocked on the registry.
+
+    Attributes:
+        _source_figure: DeephavenFigure: The figure the graph was copied from.
+            Kept so the id used as the key is not reused while the graph is alive.
+        figure: DeephavenFigure: The shared copy of the figure
+        _subscribers: weakref.WeakSet[DeephavenFigureListener]: The listeners to send updates to
+        _liveness_scope: LivenessScope: The liveness scope to use for the listeners
+        _handles: list[Any]: The handles for the listeners
+        _lock: threading.Lock: The lock guarding the subscribers
+        _released: bool: Whether the last subscriber has unsubscribed
+        _coalescer: FigureUpdateCoalescer: Recreates the figure off the listener
+            thread, once per burst of partition updates
+    """
+
+    _graphs: dict[int, Future[SharedFigureGraph]] = {}
+    _graphs_lock = threading.Lock()
+
+    def __init__(self, figure: DeephavenFigure):
+        """
+        Create a new shared figure graph
+
+        Args:
+            figure: The figure to share
+        """
+        self._source_figure = figure
+        self.figure = figure.copy()
+        self._subscribers = weakref.WeakSet()
+        self._liveness_scope = LivenessScope()
+        # store hard references to the handles so they don't get garbage collected
+        self._handles = []
+        self._lock = threading.Lock()
+        self._released = False
+        self._coalescer = FigureUpdateCoalescer(self._recreate)
+
+        self._setup_listeners()
+
+        # force figure to be recreated after listeners are setup
+        # this ensures the figures are created correctly
+        # such as when partitions have been added but no listeners have been running
+        self.figure.recreate_figure()
+
+    @classmethod
+    def acquire(
+        cls, figure: DeephavenFigure, listener: DeephavenFigureListener
+    ) -> SharedFigureGraph:
+        """
+        Get the shared graph for a figure, creating it if needed, and subscribe
+        the listener to it
+
+        Args:
+            figure: The figure to get the shared graph for
+            listener: The listener to subscribe
+
+        Returns:
+            The shared graph
+        """
+        while True:
+            with cls._graphs_lock:
+                future = cls._graphs.get(id(figure))
+                create = future is None
+                if create:
+                    future = cls._graphs[id(figure)] = Future()
+
+            if create:
+                try:
+                    future.set_result(cls(figure))
+                except BaseException as e:
+                    with cls._graphs_lock:
+                        if cls._graphs.get(id(figure)) is future:
+                            cls._graphs.pop(id(figure))
+                    future.set_exception(e)
+                    raise
+
+            # raises if the graph could not be created
+            graph = future.result()
+            with graph._lock:
+                if not graph._released:
+                    graph._subscribers.add(listener)
+                    return graph
+            # the last subscriber released the graph before this one subscribed
+
+    @classmethod
+    def _is_registered(cls, graph: SharedFigureGraph) -> bool:
+        """
+        Check if a graph is the one registered for its figure.
+        Must be called with the registry lock held.
+
+        Args:
+            graph: The graph to check
+
+        Returns:
+            True if the graph is registered
+        """
+        future = cls._graphs.get(id(graph._source_figure))
+        return (
+            future is not None
+            and future.done()
+            and future.exception() is None
+            and future.result() is graph
+        )
+
+    def release(self, listener: DeephavenFigureListener) -> None:
+        """
+        Unsubscribe a listener, releasing the graph if it was the last subscriber
+
+        Args:
+            listener: The listener to unsubscribe
+        """
+        with SharedFigureGraph._graphs_lock:
+            with self._lock:
+                self._subscribers.discard(listener)
+                if len(self._subscribers) > 0 or self._released:
+                    return
+                self._released = True
+            if SharedFigureGraph._is_registered(self):
+                SharedFigureGraph._graphs.pop(id(self._source_figure))
+
+        self._coalescer.cancel()
+
+        for handle in self._handles:
+            handle.stop()
+        self._handles = []
+        self._liveness_scope.release()
+
+    def _setup_listeners(self) -> None:
+        """
+        Setup listeners for the partitioned tables
+        """
+        partitioned_tables = self.figure.get_head_node().partitioned_tables
+        for table, node in partitioned_tables.values():
+            listen_func = partial(self._on_update, node)
+            # if a table is not refreshing, it will never update, so no need to listen
+            if table.is_refreshing:
+                # do_replay=True atomically replays existing state and registers
+                # for future updates under the UG lock, preventing a race where
+                # partitions that appear before registration are missed entirely.
+                handle = listen(table, listen_func, do_replay=True)
+                self._handles.append(handle)
+                self._liveness_scope.manage(handle)
+
+    def _on_update(
+        self, node: DeephavenFigureNode, update: TableUpdate, is_replay: bool
+    ) -> None:
+        """
+        Queue the node to be recreated once for every subscriber.
+
+        Args:
+            node: The node to update. Changes will propagate up from this node.
+            update: Not used. Required for the listener.
+            is_replay: Whether this update is a replay of the table's initial
+                snapshot. Replays only update the cached figure to make sure nothing is
+                missed. It's assumed the retrieve message sends the figure later.
+        """
+        if is_replay:
+            node.recreate_figure()
+            return
+        # recreate on a worker so the update graph is not held up
+        self._coalescer.add(node)
+
+    def _recreate(self, nodes: list[DeephavenFigureNode]) -> None:
+        """
+        Recreate the figure once from the nodes updated during an update window,
+        and notify every subscriber.
+
+        Args:
+            nodes: The updated nodes
+        """
+        recreate_nodes(nodes)
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for listener in subscribers:
+            listener.on_shared_update(self)
@@ -1,2 +1,3 @@
 from .DeephavenFigureListener import DeephavenFigureListener
 from .DeephavenFigureConnection import DeephavenFigureConnection
+from .SharedFigureGraph import SharedFigureGraph
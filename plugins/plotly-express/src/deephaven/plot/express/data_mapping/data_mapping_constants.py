@@ -18,6 +18,13 @@ CUSTOM_DATA_ARGS = {
     "attached_color_marker": "marker/color",
     "attached_color_markers": "marker/colors",
     "attached_pattern_shape_markers": "marker/pattern/shape",
+    "box_q1": "q1",
+    "box_median": "median",
+    "box_q3": "q3",
+    "box_lowerfence": "lowerfence",
+    "box_upperfence": "upperfence",
+    "box_mean": "mean",
+    "box_notchspan": "notchspan",
 }
 
 # override these data columns with different names
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import json
+import threading
+import weakref
+from collections import OrderedDict
 from collections.abc import Generator
 from pathlib import Path
-from typing import Callable, Any
+from typing import Callable, Any, Iterable
 from plotly.graph_objects import Figure
 from abc import abstractmethod
+from contextlib import nullcontext
 from copy import copy
 
+import numpy as np
+import pandas as pd
 from deephaven.table import PartitionedTable, Table
 from deephaven.execution_context import ExecutionContext, get_exec_ctx
 from deephaven.liveness_scope import LivenessScope
@@ -16,6 +22,7 @@ import deephaven.pandas as dhpd
 from ..shared import args_copy
 from ..data_mapping import DataMapping
 from ..exporter import Exporter
+from ..preprocess.utilities import RangeTableProvider
 from .RevisionManager import RevisionManager
 from .FigureCalendar import FigureCalendar, Calendar
 from ..types import FilterColumn
@@ -24,6 +31,12 @@ SINGLE_VALUE_REPLACEMENTS = {
     "indicator": {"value", "delta/reference", "title/text"},
 }
 
+# The number of recently viewed viewports to keep rebinned figures for
+VIEWPORT_CACHE_SIZE = 8
+
+# The number of recently selected filter sets to keep filtered figures for
+FILTER_CACHE_SIZE = 8
+
 
 def is_single_value_replacement(
     figure_type: str,
@@ -49,6 +62,115 @@ def is_single_value_replacement(
     return is_single_value
 
 
+def column_to_array(column: pd.Series) -> np.ndarray:
+    """
+    Convert a column of a table snapshot to a NumPy array that plotly can encode directly.
+    Numeric columns keep their NumPy dtype so plotly can send them as typed arrays.
+    Nulls in numeric columns become NaN, or None in boolean columns.
+
+    Args:
+        column: The column to convert
+
+    Returns:
+        The column as a NumPy array
+    """
+    numpy_dtype = getattr(column.dtype, "numpy_dtype", None)
+    if numpy_dtype is None or numpy_dtype.kind not in "iufb":
+        return column.to_numpy()
+    if not column.hasnans:
+        return column.to_numpy(dtype=numpy_dtype)
+    if numpy_dtype.kind == "b":
+        return column.to_numpy(dtype=object, na_value=None)
+    return column.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def get_table_columns(mappings: list[dict[str, Any]]) -> dict[int, set[str]]:
+    """
+    Get the columns needed from each referenced table to hydrate a figure
+
+    Args:
+        mappings: The data mappings of the figure
+
+    Returns:
+        The names of the needed columns, by the index of the table reference
+    """
+    table_columns: dict[int, set[str]] = {}
+    for mapping in mappings:
+        table_columns.setdefault(mapping["table"], set()).update(
+            mapping["data_columns"]
+        )
+    return table_columns
+
+
+def table_to_arrays(table: Table, columns: set[str]) -> dict[str, np.ndarray]:
+    """
+    Convert columns of a table to NumPy arrays
+
+    Args:
+        table: The table to convert. Refreshing tables are snapshot first.
+        columns: The names of the columns to convert
+
+    Returns:
+        The arrays, by column name
+    """
+    data = dhpd.to_pandas(table, cols=sorted(columns))
+    return {column: column_to_array(data[column]) for column in columns}
+
+
+def hydrate_figure(
+    figure: dict[str, Any],
+    column_arrays: dict[int, dict[str, np.ndarray]],
+    template: str | dict | None = None,
+) -> Figure:
+    """
+    Replace all placeholder data within the traces of a figure dict with the actual data
+
+    Args:
+        figure: The figure dict, as created by DeephavenFigure.to_dict
+        column_arrays: The column arrays of each table, by the index of the table reference
+        template: The theme to use for the figure
+
+    Returns:
+        The hydrated plotly figure
+    """
+    for mapping in figure["deephaven"]["mappings"]:
+        arrays = column_arrays[mapping["table"]]
+
+        for column, paths in mapping["data_columns"].items():
+            column_data = arrays[column]
+            for path in paths:
+                split_path = path.split("/")
+                # remove empty str, "plotly", and "data"
+                split_path = split_path[3:]
+                figure_update = figure["plotly"]["data"]
+
+                # next should always be an index within the data
+                index = int(split_path.pop(0))
+                figure_update = figure_update[index]
+
+                # at this point, the figure_update is a figure trace with a specific type
+                figure_type = figure_update["type"]
+
+                is_single_value = is_single_value_replacement(figure_type, split_path)
+
+                while len(split_path) > 1:
+                    item = split_path.pop(0)
+                    figure_update = figure_update[item]
+
+                # the arrays are shared between traces, plotly copies them when validating
+                figure_update[split_path[0]] = (
+                    column_data[:1].tolist()[0] if is_single_value else column_data
+                )
+
+    if template:
+        remove_data_colors(figure["plotly"])
+        figure["plotly"]["layout"].update(template=template)
+
+    new_figure = Figure(figure["plotly"])
+
+    return new_figure
+
+
 def color_in_colorway(trace_element: dict, colorway: list[str]) -> bool:
     """
     Check if the color in the trace element is in the colorway.
@@ -193,6 +315,100 @@ def get_matching_filters(
     }
 
 
+def get_viewport_axis_args(
+    groups: set[str] | str | None,
+    args: dict[str, Any],
+) -> dict[str, str]:
+    """
+    Get the mapping of axis to the range bin arg that controls the binning on that axis.
+    Only plots that bin their data on the server can be rebinned for a viewport.
+
+    Args:
+        groups: The groups the figure was created with
+        args: The args the figure was created with
+
+    Returns:
+        A mapping of axis (x or y, or lat or lon for maps) to the range bin arg
+        for that axis
+    """
+    groups = groups if isinstance(groups, set) else {groups}
+
+    if "preprocess_heatmap" in groups:
+        return {"x": "range_bins_x", "y": "range_bins_y"}
+
+    if "preprocess_hist" in groups:
+        # this mirrors the orientation logic in UnivariateAwarePreprocessor
+        orientation = args.get("orientation")
+        if orientation:
+            return {"x" if orientation == "v" else "y": "range_bins"}
+        return {"x" if args.get("x") else "y": "range_bins"}
+
+    if "preprocess_spatial" in groups:
+        return {"lat": "spatial_range_lat", "lon": "spatial_range_lon"}
+
+    return {}
+
+
+def get_viewport_range_args(
+    groups: set[str] | str | None,
+    args: dict[str, Any],
+    viewport: dict[str, list[float] | None] | None,
+) -> dict[str, list[float]]:
+    """
+    Get the range bin args that rebin a figure over the given viewport.
+    Axes without a valid numeric range are left as they were originally specified.
+
+    Args:
+        groups: The groups the figure was created with
+        args: The args the figure was created with
+        viewport: A dict mapping axis (x or y, or lat or lon for maps) to the
+            visible [min, max] range
+
+    Returns:
+        The args to update the figure args with
+    """
+    if not viewport:
+        return {}
+
+    range_args = {}
+    for axis, arg in get_viewport_axis_args(groups, args).items():
+        range_ = viewport.get(axis)
+        if (
+            isinstance(range_, (list, tuple))
+            and len(range_) == 2
+            and all(
+                isinstance(bound, (int, float)) and not isinstance(bound, bool)
+                for bound in range_
+            )
+            and range_[0] < range_[1]
+        ):
+            range_args[arg] = [float(range_[0]), float(range_[1])]
+
+    return range_args
+
+
+def get_viewport_key(
+    viewport: dict[str, list[float] | None] | None,
+) -> tuple[tuple[str, tuple[float, ...] | None], ...] | None:
+    """
+    Get a hashable key for the viewport
+
+    Args:
+        viewport: A dict mapping axis (x or y) to the visible [min, max] range
+
+    Returns:
+        The key for the viewport
+    """
+    if not viewport:
+        return None
+    return tuple(
+        sorted(
+            (axis, tuple(range_) if range_ is not None else None)
+            for axis, range_ in viewport.items()
+        )
+    )
+
+
 class DeephavenNode:
     """
     A node in the DeephavenFigure graph. This is an abstract class that
@@ -203,6 +419,20 @@ class DeephavenNode:
         self.cached_figure = None
         self.parent = None
 
+    def get_range_table_provider(self) -> RangeTableProvider | None:
+        """
+        Get the range table provider of the graph this node is in
+
+        Returns:
+            The provider of the head node, or None if the node is not in a graph
+        """
+        parent = self.parent
+        while isinstance(parent, DeephavenNode):
+            parent = parent.parent
+        if isinstance(parent, DeephavenHeadNode):
+            return parent.range_table_provider
+        return None
+
     @abstractmethod
     def recreate_figure(self, update_parent: bool = True) -> None:
         """
@@ -250,6 +480,26 @@ class DeephavenNode:
         """
         pass
 
+    @abstractmethod
+    def update_viewport(self, viewport: dict[str, list[float] | None] | None) -> None:
+        """
+        Update the viewport on the node.
+
+        Args:
+            viewport: A dict mapping axis (x or y) to the visible [min, max] range
+        """
+        pass
+
+    @property
+    def supports_viewport(self) -> bool:
+        """
+        Check if the viewport affects this node
+
+        Returns:
+            True if the figure is rebinned when the viewport changes
+        """
+        return False
+
     @property
     @abstractmethod
     def filter_columns(self) -> set[FilterColumn]:
@@ -274,6 +524,12 @@ class DeephavenFigureNode(DeephavenNode):
         func: Callable: The function to call
         cached_figure: DeephavenFigure: The cached figure
         revision_manager: RevisionManager: The revision manager to use for the figure node
+        viewport: dict[str, list[float] | None] | None: The viewport the figure is binned over
+        viewport_cache: OrderedDict[Any, DeephavenFigure | None]: Recently built figures
+            keyed by viewport, most recently used last
+        filter_cache: OrderedDict[Any, DeephavenFigure | None]: Recently built figures
+            keyed by filter set and viewport, most recently used last
+        filter_cache_lock: threading.Lock: The lock guarding the filter cache
     """
 
     def __init__(
@@ -305,12 +561,64 @@ class DeephavenFigureNode(DeephavenNode):
         self._filter_columns = filter_columns if filter_columns else set()
         self.filters = None
         self.prev_filter_set = None
+        self.viewport = None
+        self.prev_viewport = None
+        self.viewport_cache = OrderedDict()
+        self.filter_cache = OrderedDict()
+        self.filter_cache_lock = threading.Lock()
 
     def recreate_figure(self, update_parent: bool = True) -> None:
         """
         Recreate the figure. This is called when the underlying partition
         changes
 
+        Args:
+            update_parent: If the parent should be updated
+        """
+        # figures built for previous viewports are stale once partitions or filters change
+        self.viewport_cache.clear()
+        self.build_figure(update_parent)
+
+    def get_filtered_figure(self, copied_args: dict[str, Any]) -> DeephavenFigure:
+        """
+        Get the figure for the current filters and viewport, building it only if it
+        is not cached. Recently selected filter sets are cached, so switching back to a
+        recent filter value does not filter the table and build the figure again.
+        The tables of an evicted figure are released once the figure is no longer used.
+
+        Args:
+            copied_args: The args to build the figure with
+
+        Returns:
+            The figure
+        """
+        key = (
+            frozenset(get_filter_set(self.filter_columns, self.filters)),
+            get_viewport_key(self.viewport),
+        )
+
+        with self.filter_cache_lock:
+            if key in self.filter_cache:
+                self.filter_cache.move_to_end(key)
+                return self.filter_cache[key]
+
+        copied_args["args"]["filters"] = get_matching_filters(
+            self.filter_columns, self.filters
+        )
+        new_figure = self.func(**copied_args)
+
+        with self.filter_cache_lock:
+            self.filter_cache[key] = new_figure
+            self.filter_cache.move_to_end(key)
+            while len(self.filter_cache) > FILTER_CACHE_SIZE:
+                self.filter_cache.popitem(last=False)
+
+        return new_figure
+
+    def build_figure(self, update_parent: bool = True) -> None:
+        """
+        Build the figure with the current filters and viewport
+
         Args:
             update_parent: If the parent should be updated
         """
@@ -319,20 +627,28 @@ class DeephavenFigureNode(DeephavenNode):
         # release the lock to ensure there is no deadlock
         # as for some table operations an exclusive lock is required
         new_figure = None
-        with self.exec_ctx:
+        # range tables are shared by every figure built within the graph
+        provider = self.get_range_table_provider()
+        with self.exec_ctx, provider if provider is not None else nullcontext():
             copied_args = args_copy(self.args)
             copied_args["args"]["table"] = self.table
+            copied_args["args"].update(
+                get_viewport_range_args(
+                    copied_args.get("groups"), copied_args["args"], self.viewport
+                )
+            )
             if self.filters is not None:
                 filter_set = get_filter_set(self.filter_columns, self.filters)
 
-                if filter_set != self.prev_filter_set:
+                if (
+                    filter_set != self.prev_filter_set
+                    or self.viewport != self.prev_viewport
+                ):
                     # when filters are passed in, only update the chart when the filters change
                     # otherwise, subplots would be recreated unnecessarily
                     self.prev_filter_set = filter_set
-                    copied_args["args"]["filters"] = get_matching_filters(
-                        self.filter_columns, self.filters
-                    )
-                    new_figure = self.func(**copied_args)
+                    self.prev_viewport = self.viewport
+                    new_figure = self.get_filtered_figure(copied_args)
                 else:
                     # if the filters haven't changed, just use the cached figure
                     new_figure = self.cached_figure
@@ -402,8 +718,54 @@ class DeephavenFigureNode(DeephavenNode):
             filters: A dict with column name keys and values that are categories within the columns
         """
         self.filters = filters
+        # figures built for previous viewports are stale once filters change,
+        # but figures built for previous filters are kept
+        self.viewport_cache.clear()
         # don't update the parent as it will be updated after the figure is recreated
-        self.recreate_figure(update_parent=False)
+        self.build_figure(update_parent=False)
+
+    def update_viewport(self, viewport: dict[str, list[float] | None] | None) -> None:
+        """
+        Update the viewport on the node. If the figure bins its data, the bins are
+        recalculated over the visible range. Recently viewed viewports are cached.
+
+        Args:
+            viewport: A dict mapping axis (x or y) to the visible [min, max] range
+        """
+        if not self.supports_viewport:
+            # nothing to rebin, so the viewport does not affect this figure
+            return
+
+        self.viewport = viewport
+        key = get_viewport_key(viewport)
+
+        if key in self.viewport_cache:
+            self.viewport_cache.move_to_end(key)
+            revision = self.revision_manager.get_revision()
+            with self.revision_manager:
+                if self.revision_manager.updated_revision(revision):
+                    self.cached_figure = self.viewport_cache[key]
+            self.prev_viewport = viewport
+            return
+
+        # don't update the parent as it will be updated after the figure is rebuilt
+        self.build_figure(update_parent=False)
+
+        self.viewport_cache[key] = self.cached_figure
+        while len(self.viewport_cache) > VIEWPORT_CACHE_SIZE:
+            self.viewport_cache.popitem(last=False)
+
+    @property
+    def supports_viewport(self) -> bool:
+        """
+        Check if the viewport affects this node
+
+        Returns:
+            True if the figure is rebinned when the viewport changes
+        """
+        return bool(
+            get_viewport_axis_args(self.args.get("groups"), self.args.get("args", {}))
+        )
 
     @property
     def filter_columns(self) -> set[FilterColumn]:
@@ -428,6 +790,8 @@ class DeephavenLayerNode(DeephavenNode):
         cached_figure: DeephavenFigure: The cached figure
         exec_ctx: ExecutionContext: The execution context
         revision_manager: RevisionManager: The revision manager to use for the layer node
+        layer_cache: dict[int, Any]: The data and layout each child contributed to the
+            cached figure, so only changed children are resized when the layer is recreated
     """
 
     def __init__(
@@ -453,6 +817,7 @@ class DeephavenLayerNode(DeephavenNode):
         self.cached_figure = cached_figure
         self.exec_ctx = exec_ctx
         self.revision_manager = RevisionManager()
+        self.layer_cache = {}
 
     def recreate_figure(self, update_parent: bool = True) -> None:
         """
@@ -469,7 +834,10 @@ class DeephavenLayerNode(DeephavenNode):
         # as for some table operations an exclusive lock is required
         with self.exec_ctx:
             figs = [node.cached_figure for node in self.nodes]
-            new_figure = self.layer_func(*figs, **self.args)
+            # children that have not changed since the last layering are reused from the cache
+            new_figure = self.layer_func(
+                *figs, layer_cache=self.layer_cache, **self.args
+            )
 
         with self.revision_manager:
             if self.revision_manager.updated_revision(revision):
@@ -529,6 +897,17 @@ class DeephavenLayerNode(DeephavenNode):
 
         self.recreate_figure(update_parent=False)
 
+    def update_viewport(self, viewport: dict[str, list[float] | None] | None) -> None:
+        """
+        Update the viewport on the node.
+        Layered figures are not rebinned, as the axes of the children do not
+        necessarily match the axes of the layered figure.
+
+        Args:
+            viewport: A dict mapping axis (x or y) to the visible [min, max] range
+        """
+        pass
+
     @property
     def filter_columns(self) -> set[FilterColumn]:
         """
@@ -554,25 +933,38 @@ class DeephavenHeadNode:
             A dictionary mapping node ids to partitioned table and nodes that
             need to be updated
         cached_figure: The cached figure
+        range_table_provider: RangeTableProvider | None: The provider of the range
+            tables shared by the figures in the graph
     """
 
-    def __init__(self):
+    def __init__(self, range_table_provider: RangeTableProvider | None = None):
         """
         Create a new DeephavenHeadNode
+
+        Args:
+            range_table_provider: The provider of the range tables shared by the
+                figures in the graph
         """
         # there is only one child node of the head, either a layer or a figure
         self.node: DeephavenNode | None = None
         self.partitioned_tables = {}
         self.cached_figure = None
+        self.range_table_provider = range_table_provider
 
-    def copy_graph(self) -> DeephavenHeadNode:
+    def copy_graph(
+        self, range_table_provider: RangeTableProvider | None = None
+    ) -> DeephavenHeadNode:
         """
         Copy this node and all children nodes
 
+        Args:
+            range_table_provider: The provider of the range tables shared by the
+                figures in the new graph
+
         Returns:
             The new head node
         """
-        new_head = DeephavenHeadNode()
+        new_head = DeephavenHeadNode(range_table_provider)
         new_partitioned_tables = copy(self.partitioned_tables)
         if self.node:
             new_head.node = self.node.copy(new_head, new_partitioned_tables)
@@ -611,6 +1003,27 @@ class DeephavenHeadNode:
 
         self.recreate_figure()
 
+    def update_viewport(self, viewport: dict[str, list[float] | None] | None) -> None:
+        """
+        Update the viewport on the node.
+
+        Args:
+            viewport: A dict mapping axis (x or y) to the visible [min, max] range
+        """
+        if self.node:
+            self.node.update_viewport(viewport)
+            self.cached_figure = self.node.cached_figure
+
+    @property
+    def supports_viewport(self) -> bool:
+        """
+        Check if the viewport affects this figure
+
+        Returns:
+            True if the figure is rebinned when the viewport changes
+        """
+        return self.node is not None and self.node.supports_viewport
+
     @property
     def filter_columns(self) -> set[FilterColumn]:
         """
@@ -624,6 +1037,37 @@ class DeephavenHeadNode:
         return set()
 
 
+def recreate_nodes(nodes: Iterable[DeephavenNode]) -> None:
+    """
+    Recreate a batch of updated nodes of the same graph, then each of their
+    ancestors once, deepest first. When several partitions update together,
+    the layers they share are only recreated once instead of once per partition.
+
+    Args:
+        nodes: The updated nodes
+    """
+    depths: dict[int, tuple[int, DeephavenNode]] = {}
+    head = None
+    for node in nodes:
+        path = []
+        current = node
+        while isinstance(current, DeephavenNode):
+            path.append(current)
+            current = current.parent
+        if isinstance(current, DeephavenHeadNode):
+            head = current
+        for depth, path_node in enumerate(reversed(path)):
+            depths[id(path_node)] = (depth, path_node)
+
+    # the head recreates its own child, so skip the top node here
+    for depth, node in sorted(depths.values(), key=lambda item: -item[0]):
+        if depth > 0 or head is None:
+            node.recreate_figure(update_parent=False)
+
+    if head is not None:
+        head.recreate_figure()
+
+
 class DeephavenFigure:
     """A DeephavenFigure that contains a plotly figure and mapping from Deephaven
     data tables to the plotly figure
@@ -637,6 +1081,8 @@ class DeephavenFigure:
         _data_mappings: list[DataMapping]: The data mappings
         _has_subplots: bool: If this figure has subplots
         _liveness_scope: LivenessScope: The liveness scope to use for the figure
+        _range_table_provider: RangeTableProvider: The provider of the range tables
+            shared by the figures in the graph, released with the figure
     """
 
     def __init__(
@@ -666,8 +1112,10 @@ class DeephavenFigure:
             has_subplots: If this figure has subplots
             is_plotly_fig: If this is a plotly figure
         """
+        self._range_table_provider = RangeTableProvider()
+
         # keep track of function that called this, and it's args
-        self._head_node = DeephavenHeadNode()
+        self._head_node = DeephavenHeadNode(self._range_table_provider)
 
         # note: these variables might not be up-to-date with the latest
         # figure if the figure is updated
@@ -694,11 +1142,13 @@ class DeephavenFigure:
 
         self._figure_calendar = FigureCalendar(calendar)
 
-        self._sent_calendar = False
+        # the same figure can be sent over multiple connections, so track
+        # which exporters have been sent the calendar and filter columns
+        self._sent_calendar: weakref.WeakSet[Exporter] = weakref.WeakSet()
 
         self._filter_columns = filter_columns if filter_columns else set()
 
-        self._sent_filter_columns = False
+        self._sent_filter_columns: weakref.WeakSet[Exporter] = weakref.WeakSet()
 
     def copy_mappings(self: DeephavenFigure, offset: int = 0) -> list[DataMapping]:
         """Copy all DataMappings within this figure, adding a specific offset
@@ -765,14 +1215,18 @@ class DeephavenFigure:
         }
 
         # currently, there is one calendar and it only needs to be sent once
-        if not self._sent_calendar and (
+        # per connection
+        if exporter not in self._sent_calendar and (
             calendar_dict := self._figure_calendar.to_dict()
         ):
             deephaven["calendar"] = calendar_dict
-            self._sent_calendar = True
+            self._sent_calendar.add(exporter)
 
         # the input filters do not update so they only need to be sent once
-        if not self._sent_filter_columns and (filter_columns := self.filter_columns):
+        # per connection
+        if exporter not in self._sent_filter_columns and (
+            filter_columns := self.filter_columns
+        ):
             deephaven["filterColumns"] = {
                 "columns": [
                     # _asdict is not actually protected, it is just given an underscore
@@ -781,7 +1235,7 @@ class DeephavenFigure:
                     for filter_column in filter_columns
                 ],
             }
-            self._sent_filter_columns = True
+            self._sent_filter_columns.add(exporter)
 
         payload = {"plotly": plotly, "deephaven": deephaven}
         return json.dumps(payload)
@@ -798,7 +1252,7 @@ class DeephavenFigure:
             exec_ctx: The execution context
         """
 
-        new_head = DeephavenHeadNode()
+        new_head = DeephavenHeadNode(self._range_table_provider)
         self._head_node = new_head
 
         layer_node = DeephavenLayerNode(layer_func, args, exec_ctx)
@@ -836,6 +1290,7 @@ class DeephavenFigure:
         key_column_table: Table | None,
         func: Callable,
         filter_columns: set[FilterColumn] | None = None,
+        range_table_provider: RangeTableProvider | None = None,
     ) -> None:
         """
         Add a figure to the graph. It is assumed that this is the first figure
@@ -847,8 +1302,15 @@ class DeephavenFigure:
             key_column_table: The table with partitions, used by the DeephavenFigureListener
             func: The function to call
             filter_columns: The filter columns to use for this figure node
+            range_table_provider: The provider the figure was first built with,
+                so its range tables are reused when the figure is recreated
 
         """
+        if range_table_provider is not None:
+            self._range_table_provider.release()
+            self._range_table_provider = range_table_provider
+            self._head_node.range_table_provider = range_table_provider
+
         if isinstance(table, Table) and not table.is_refreshing:
             # static tables should not be managed
             # check because it doesn't throw an error on first manage attempt, but leads to errors later
@@ -983,6 +1445,7 @@ class DeephavenFigure:
 
     def __del__(self):
         self._liveness_scope.release()
+        self._range_table_provider.release()
 
     def copy(self) -> DeephavenFigure:
         """
@@ -1003,7 +1466,9 @@ class DeephavenFigure:
             self._calendar,
             self._filter_columns,
         )
-        new_figure._head_node = self._head_node.copy_graph()
+        new_figure._head_node = self._head_node.copy_graph(
+            new_figure._range_table_provider
+        )
         return new_figure
 
     def recreate_figure(self) -> None:
@@ -1052,44 +1517,15 @@ class DeephavenFigure:
         figure = self.to_dict(exporter)
         tables, _, _ = exporter.references()
 
-        for mapping in figure["deephaven"]["mappings"]:
-            table = tables[mapping["table"]]
-            data = dhpd.to_pandas(table)
-
-            for column, paths in mapping["data_columns"].items():
-                for path in paths:
-                    split_path = path.split("/")
-                    # remove empty str, "plotly", and "data"
-                    split_path = split_path[3:]
-                    figure_update = figure["plotly"]["data"]
-
-                    # next should always be an index within the data
-                    index = int(split_path.pop(0))
-                    figure_update = figure_update[index]
-
-                    # at this point, the figure_update is a figure trace with a specific type
-                    figure_type = figure_update["type"]
-
-                    is_single_value = is_single_value_replacement(
-                        figure_type, split_path
-                    )
-
-                    while len(split_path) > 1:
-                        item = split_path.pop(0)
-                        figure_update = figure_update[item]
-
-                    column_data = data[column].tolist()
-                    if is_single_value:
-                        column_data = column_data[0]
-                    figure_update[split_path[0]] = column_data
-
-        if template:
-            remove_data_colors(figure["plotly"])
-            figure["plotly"]["layout"].update(template=template)
-
-        new_figure = Figure(figure["plotly"])
+        # snapshot each referenced table once, with only the columns any trace needs
+        column_arrays = {
+            table_index: table_to_arrays(tables[table_index], columns)
+            for table_index, columns in get_table_columns(
+                figure["deephaven"]["mappings"]
+            ).items()
+        }
 
-        return new_figure
+        return hydrate_figure(figure, column_arrays, template)
 
     def to_image(
         self,
@@ -1171,6 +1607,30 @@ class DeephavenFigure:
         """
         self._head_node.update_filters(filters)
 
+    def update_viewport(
+        self,
+        viewport: dict[str, list[float] | None] | None,
+    ) -> None:
+        """
+        Update the viewport on the chart. Histograms and density heatmaps are rebinned
+        over the visible range so that zooming in shows more detail.
+
+        Args:
+            viewport: A dict mapping axis (x or y) to the visible [min, max] range.
+                None resets the bins to the originally specified range.
+        """
+        self._head_node.update_viewport(viewport)
+
+    @property
+    def supports_viewport(self) -> bool:
+        """
+        Check if the viewport affects this figure
+
+        Returns:
+            True if the figure is rebinned when the viewport changes
+        """
+        return self._head_node.supports_viewport
+
     @property
     def filter_columns(self) -> set[FilterColumn]:
         """
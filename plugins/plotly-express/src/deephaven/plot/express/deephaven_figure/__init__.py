@@ -1,6 +1,7 @@
 from .DeephavenFigure import (
     DeephavenFigure,
     DeephavenFigureNode,
+    recreate_nodes,
 )
 from .generate import generate_figure, update_traces
 from .custom_draw import (
@@ -9,5 +10,6 @@ from .custom_draw import (
     draw_density_heatmap,
     draw_indicator,
 )
+from .image_export import export_images, ImageExportResult
 from .RevisionManager import RevisionManager
 from .FigureCalendar import Calendar
@@ -145,8 +145,18 @@ ATTACHED_UPDATE_MAP = {
     "attached_color_marker": "marker_color",
     "attached_color_markers": "marker_colors",
     "attached_pattern_shape_markers": "marker_pattern_shape",
+    "box_q1": "q1",
+    "box_median": "median",
+    "box_q3": "q3",
+    "box_lowerfence": "lowerfence",
+    "box_upperfence": "upperfence",
+    "box_mean": "mean",
+    "box_notchspan": "notchspan",
 }
 
+# precomputed box statistics are shown in the box hover, so they are not added to the hovertext
+BOX_STAT_VARS = {"q1", "median", "q3", "lowerfence", "upperfence", "mean", "notchspan"}
+
 
 def col_null_mapping(
     table: Table, cols: set[str]
@@ -787,6 +797,8 @@ def get_hover_body(
         elif var.startswith("error"):
             # error bars are automatically displayed with the associated variable
             continue
+        elif var in BOX_STAT_VARS:
+            continue
         else:
             # "plural" vars ending with s need the s removed in the hover mapping
             var = var[:-1] if var.endswith("s") else var
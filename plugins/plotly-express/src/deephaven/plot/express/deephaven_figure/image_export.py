@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import multiprocessing
+import multiprocessing.spawn
+import os
+import time
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+import numpy as np
+import plotly.io as pio
+from deephaven.table import Table
+from deephaven.update_graph import shared_lock
+
+from ..exporter import Exporter
+from .DeephavenFigure import (
+    DeephavenFigure,
+    get_table_columns,
+    hydrate_figure,
+    table_to_arrays,
+)
+
+
+class ImageExportResult:
+    """
+    The result of exporting a single figure with export_images
+
+    Attributes:
+        index: The index of the figure in the figures passed to export_images
+        image: The image bytes, or None if the image was written to a file or the export failed
+        file: The file the image was written to, or None if no files were passed
+        error: The error raised while exporting the figure, or None if the export succeeded
+        hydrate_time: Seconds spent replacing the placeholder data of the figure with table data
+        render_time: Seconds from sending the hydrated figure to a render process until the image was done
+    """
+
+    def __init__(
+        self,
+        index: int,
+        file: Path | None = None,
+    ):
+        self.index = index
+        self.image: bytes | None = None
+        self.file = file
+        self.error: Exception | None = None
+        self.hydrate_time = 0.0
+        self.render_time = 0.0
+
+
+class _ExportJob:
+    """
+    A figure waiting to be hydrated, with the tables it references
+    """
+
+    def __init__(
+        self,
+        result: ImageExportResult,
+        figure: dict[str, Any],
+        tables: dict[int, Table],
+    ):
+        self.result = result
+        self.figure = figure
+        self.tables = tables
+
+
+def _snapshot_tables(tables: dict[Table, set[str]]) -> dict[Table, Table]:
+    """
+    Snapshot the needed columns of all tables, holding the update graph locks so every
+    snapshot is taken from the same update cycle
+
+    Args:
+        tables: The needed column names, by table
+
+    Returns:
+        The static snapshots, by table
+    """
+    with ExitStack() as stack:
+        locked = set()
+        for table in tables:
+            if table.is_refreshing and table.update_graph not in locked:
+                locked.add(table.update_graph)
+                stack.enter_context(shared_lock(table.update_graph))
+
+        return {
+            table: (
+                table.view(sorted(columns)).snapshot() if table.is_refreshing else table
+            )
+            for table, columns in tables.items()
+        }
+
+
+def _can_spawn_processes() -> bool:
+    """
+    Check if render processes can be spawned.
+    Spawning starts a new interpreter from the executable of this one, which is not a
+    python interpreter when python is embedded in another process, such as a JVM.
+
+    Returns:
+        True if render processes can be spawned
+    """
+    executable = multiprocessing.spawn.get_executable()
+    if not executable or not os.path.isfile(executable):
+        return False
+    return os.path.basename(executable).lower().startswith("python")
+
+
+def _make_executor(max_workers: int) -> Executor:
+    """
+    Make the executor that renders the images
+
+    Args:
+        max_workers: The number of workers rendering images
+
+    Returns:
+        A process pool if render processes can be spawned, otherwise a thread pool
+    """
+    if _can_spawn_processes():
+        # spawn new processes instead of forking, as the server process holds a JVM
+        return ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def export_images(
+    figures: Sequence[DeephavenFigure],
+    files: Sequence[str | Path] | None = None,
+    format: str = "png",
+    width: int | None = None,
+    height: int | None = None,
+    scale: float | None = None,
+    validate: bool = True,
+    template: str | dict | None = None,
+    max_workers: int | None = None,
+    on_progress: Callable[[ImageExportResult], None] | None = None,
+    executor: Executor | None = None,
+) -> list[ImageExportResult]:
+    """
+    Export many figures to images at once.
+    The tables of all figures are snapshot together, so every image shows data from the same update cycle.
+    Only the columns used by the figures are snapshot, and each table is converted once even if
+    several figures use it.
+    Images are rendered in parallel in separate processes, or on threads if python is embedded in a
+    process that can't spawn interpreters. At most max_workers hydrated figures are held in memory
+    at once, and table data is released once every figure using it is hydrated.
+    This API is based off of Plotly's Figure.to_image and Figure.write_image
+
+    Args:
+        figures: The figures to export
+        files: The files to write the images to, one per figure.
+            If not provided, the image bytes are returned in the results instead.
+        format: The format of the images
+            One of png, jpg, jpeg, webp, svg, pdf
+        width: The width of the images in pixels
+        height: The height of the images in pixels
+        scale: The scale of the images
+            A scale of larger than one will increase the resolution of the images
+            A scale of less than one will decrease the resolution of the images
+        validate: If the images should be validated before being converted
+        template: The theme to use for the images
+        max_workers: The number of processes rendering images. Defaults to the number of CPUs.
+        on_progress: Called with the result of each figure once it is exported, in the order exports finish
+        executor: The executor rendering the images. It is not shut down once the images are exported.
+            Defaults to a new pool of max_workers processes, or threads if processes can't be spawned.
+
+    Returns:
+        The results of each figure, in the order of the figures
+    """
+    if files is not None and len(files) != len(figures):
+        raise ValueError("files must have the same length as figures")
+
+    max_workers = max_workers or os.cpu_count() or 1
+
+    jobs = []
+    table_columns: dict[Table, set[str]] = {}
+    table_uses: dict[Table, int] = {}
+    for index, figure in enumerate(figures):
+        exporter = Exporter()
+        figure_dict = figure.to_dict(exporter)
+        references, _, _ = exporter.references()
+        tables = {}
+        for table_index, columns in get_table_columns(
+            figure_dict["deephaven"]["mappings"]
+        ).items():
+            table = references[table_index]
+            tables[table_index] = table
+            table_columns.setdefault(table, set()).update(columns)
+            table_uses[table] = table_uses.get(table, 0) + 1
+        file = Path(files[index]) if files is not None else None
+        jobs.append(_ExportJob(ImageExportResult(index, file), figure_dict, tables))
+
+    snapshots = _snapshot_tables(table_columns)
+    table_arrays: dict[Table, dict[str, np.ndarray]] = {}
+
+    def get_arrays(table: Table) -> dict[str, np.ndarray]:
+        if table not in table_arrays:
+            table_arrays[table] = table_to_arrays(
+                snapshots[table], table_columns[table]
+            )
+        return table_arrays[table]
+
+    def release(table: Table) -> None:
+        table_uses[table] -= 1
+        if table_uses[table] == 0:
+            table_arrays.pop(table, None)
+            snapshots.pop(table)
+
+    results = []
+    pending: dict[Future, tuple[ImageExportResult, float]] = {}
+    done_times: dict[Future, float] = {}
+
+    def on_done(future: Future) -> None:
+        done_times[future] = time.perf_counter()
+
+    def finish(result: ImageExportResult) -> None:
+        results.append(result)
+        if on_progress:
+            on_progress(result)
+
+    def finish_done(return_when: str) -> None:
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            result, start = pending.pop(future)
+            result.render_time = done_times.pop(future, time.perf_counter()) - start
+            error = future.exception()
+            if error is not None:
+                result.error = error
+            elif result.file is None:
+                result.image = future.result()
+            finish(result)
+
+    with ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(_make_executor(max_workers))
+
+        for job in jobs:
+            # hold at most one hydrated figure per worker
+            if len(pending) >= max_workers:
+                finish_done(FIRST_COMPLETED)
+
+            result = job.result
+            start = time.perf_counter()
+            hydrated = None
+            try:
+                hydrated = hydrate_figure(
+                    job.figure,
+                    {
+                        table_index: get_arrays(table)
+                        for table_index, table in job.tables.items()
+                    },
+                    template,
+                ).to_plotly_json()
+            except Exception as e:
+                result.error = e
+            for table in job.tables.values():
+                release(table)
+            result.hydrate_time = time.perf_counter() - start
+
+            if hydrated is None:
+                finish(result)
+                continue
+
+            # the render processes only need plotly, so the hydrated figure is sent as a dict
+            if result.file is None:
+                args: tuple[Any, ...] = (pio.to_image, hydrated)
+            else:
+                args = (pio.write_image, hydrated, result.file)
+            future = executor.submit(
+                *args,
+                format=format,
+                width=width,
+                height=height,
+                scale=scale,
+                validate=validate,
+            )
+            pending[future] = (result, time.perf_counter())
+            future.add_done_callback(on_done)
+
+        if pending:
+            finish_done(ALL_COMPLETED)
+
+    results.sort(key=lambda result: result.index)
+    return results
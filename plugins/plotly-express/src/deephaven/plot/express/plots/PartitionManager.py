@@ -41,6 +41,11 @@ NUMERIC_TYPES = {
     "double",
 }
 
+FLOATING_TYPES = {
+    "float",
+    "double",
+}
+
 # color, symbol, line_dash and pattern_shape are plotly defaults
 STYLE_DEFAULTS = {
     "color": px.colors.qualitative.Plotly,
@@ -111,6 +116,48 @@ def numeric_column_set(
     return numeric_cols
 
 
+def melt(table: Table, cols: list[str], variable: str, value: str) -> Table:
+    """
+    Melt the columns of a table into a variable column that contains the column
+    names and a value column that contains the values.
+    Each column becomes its own constituent that is merged, so every row is only
+    touched once per column and the value does not need to be selected per row.
+
+    Args:
+        table: The table to melt
+        cols: The columns to melt
+        variable: The name of the new column that contains the column names
+        value: The name of the new column that contains the values
+
+    Returns:
+        The melted table
+    """
+    col_types = {
+        col.name: col.data_type.j_name for col in table.columns if col.name in cols
+    }
+
+    # merged constituents must have the same definition, so mixed numeric
+    # columns are widened to the smallest type that holds all of them
+    cast = ""
+    if len(set(col_types.values())) > 1 and all(
+        col_types[col] in NUMERIC_TYPES for col in cols
+    ):
+        floating = any(col_types[col] in FLOATING_TYPES for col in cols)
+        cast = "(double) " if floating else "(long) "
+
+    constituents = [
+        table.update_view(
+            [
+                f"{variable} = `{col}`",
+                f"{value} = {cast}{col}",
+            ]
+        ).drop_columns(cols)
+        for col in cols
+    ]
+
+    return merge(constituents)
+
+
 def is_single_numeric_col(val: str | list[str], numeric_cols: set[str]) -> bool:
     """
     Get whether the val is a single numeric column or not
@@ -591,26 +638,6 @@ class PartitionManager:
         args.pop("by_vars", None)
         return args["table"]
 
-    def build_ternary_chain(self, cols: list[str]) -> str:
-        """
-        Build a ternary chain that will collapse the columns into one
-
-        Args:
-            cols: the list of columns to collapse into one column
-
-        Returns:
-            The ternary string that builds the new column
-        """
-        ternary_string = f"{self.stacked_column_names['value']} = "
-        for i, col in enumerate(cols):
-            if i == len(cols) - 1:
-                ternary_string += f"{col}"
-            else:
-                ternary_string += (
-                    f"{self.stacked_column_names['variable']} == `{col}` ? {col} : "
-                )
-        return ternary_string
-
     def to_long_mode(self, table: Table, cols: list[str] | None) -> Table:
         """
         Convert a table to long mode. This will take the name of the columns,
@@ -625,18 +652,12 @@ class PartitionManager:
             The table converted to long mode
 
         """
-        cols = cols if cols else []
-        new_tables = []
-        for col in cols:
-            new_tables.append(
-                table.update_view(f"{self.stacked_column_names['variable']} = `{col}`")
-            )
-
-        merged = merge(new_tables)
-
-        transposed = merged.update_view(self.build_ternary_chain(cols))
-
-        return transposed.drop_columns(cols)
+        return melt(
+            table,
+            cols if cols else [],
+            self.stacked_column_names["variable"],
+            self.stacked_column_names["value"],
+        )
 
     def current_partition_generator(self) -> Generator[dict[str, str], None, None]:
         """
@@ -749,6 +770,50 @@ class PartitionManager:
         default_fig.update_layout(margin=None)
         return DeephavenFigure(default_fig)
 
+    def draw_outliers(
+        self, box_fig: DeephavenFigure, args: dict[str, Any], table: Table
+    ) -> DeephavenFigure:
+        """
+        Draw the sampled outliers of a precomputed box figure as a trace of points
+        that lines up with the box and shares its color
+
+        Args:
+            box_fig: The precomputed box figure
+            args: The args the box figure was drawn with
+            table: The outliers table
+
+        Returns:
+            The outliers figure
+        """
+        # the outliers are raw values, so the statistics are not mapped
+        outlier_args = {
+            arg: val for arg, val in args.items() if not arg.startswith("box_")
+        }
+        outlier_args.update(table=table, points="all", notched=False)
+
+        outlier_fig = self.draw_figure(call_args=outlier_args)
+
+        box_plotly_fig = box_fig.get_plotly_fig()
+        box_trace = box_plotly_fig.data[0]
+        # boxes without an offsetgroup each take their own slot, so the outliers
+        # need a shared offsetgroup to be drawn over the box
+        offsetgroup = box_trace.offsetgroup or "box"
+        box_plotly_fig.update_traces(offsetgroup=offsetgroup)
+
+        # only the points are shown, the same way as a strip plot
+        outlier_fig.get_plotly_fig().update_traces(
+            marker_color=box_trace.marker.color,
+            offsetgroup=offsetgroup,
+            legendgroup=box_trace.legendgroup,
+            showlegend=False,
+            fillcolor="rgba(255,255,255,0)",
+            line_color="rgba(255,255,255,0)",
+            hoveron="points",
+            pointpos=0,
+            jitter=0,
+        )
+        return outlier_fig
+
     def create_figure(self) -> DeephavenFigure:
         """
         Create a figure. This handles layering different partitions as necessary as well
@@ -775,6 +840,7 @@ class PartitionManager:
             )
 
             args = {**args, **title_update}
+            outliers_table = args.pop("outliers_table", None)
 
             fig = self.draw_figure(call_args=args, trace_generator=trace_generator)
             if not trace_generator:
@@ -812,6 +878,9 @@ class PartitionManager:
 
             figs.append(fig)
 
+            if outliers_table is not None:
+                figs.append(self.draw_outliers(fig, args, outliers_table))
+
         try:
             if self.indicator:
                 layered_fig = atomic_make_grid(
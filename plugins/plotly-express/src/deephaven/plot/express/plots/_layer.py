@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import partial
-from typing import Any, Callable, cast, Tuple, TypedDict
+from typing import Any, Callable, cast, Dict, Tuple, TypedDict
 from deephaven.execution_context import make_user_exec_ctx
 
 from plotly.graph_objs import Figure
@@ -392,7 +392,7 @@ def fig_data_and_layout(
     which_layout: int | None,
     new_axes_start: dict[str, int],
     matches_axes: dict[Any, dict[int, str]],
-) -> tuple[tuple | dict, dict]:
+) -> tuple[tuple | list, dict]:
     """Get new data and layout for the specified figure
 
     Args:
@@ -414,13 +414,15 @@ def fig_data_and_layout(
           The value is a dictionary that maps an axis index to a specific
 
     Returns:
-      tuple[tuple | dict, dict]: A tuple of figure data, figure layout
+      tuple[tuple | list, dict]: A tuple of figure data, figure layout
 
     """
     if specs:
+        # resizing modifies the data and layout, so work on a copy
+        fig_dict = fig.to_dict()
         return resize_fig(
-            fig.to_dict()["data"],
-            fig.to_dict()["layout"],
+            fig_dict["data"],
+            fig_dict["layout"],
             specs[i],
             new_axes_start,
             matches_axes,
@@ -428,11 +430,161 @@ def fig_data_and_layout(
 
     fig_layout = {}
     if which_layout is None or which_layout == i:
-        fig_layout.update(fig.to_dict()["layout"])
+        fig_layout.update(fig.layout.to_plotly_json())
 
     return cast(Tuple, fig.data), fig_layout
 
 
+class LayerCacheEntry:
+    """
+    The data and layout a figure contributed to a layered figure, and the axis
+    state before and after resizing it. Entries are not modified once created.
+
+    Attributes:
+      fig: The figure that was resized
+      axes_start: The start of new axes before resizing the figure
+      matches_axes: The axis match groups before resizing the figure
+      fig_data: The resized data of the figure
+      fig_layout: The resized layout of the figure
+      new_axes_start: The start of new axes after resizing the figure
+      new_matches_axes: The axis match groups after resizing the figure
+    """
+
+    def __init__(
+        self,
+        fig: Figure,
+        axes_start: dict[str, int],
+        matches_axes: dict[Any, dict[int, str]],
+        fig_data: tuple | list,
+        fig_layout: dict,
+        new_axes_start: dict[str, int],
+        new_matches_axes: dict[Any, dict[int, str]],
+    ):
+        self.fig = fig
+        self.axes_start = axes_start
+        self.matches_axes = matches_axes
+        self.fig_data = fig_data
+        self.fig_layout = fig_layout
+        self.new_axes_start = new_axes_start
+        self.new_matches_axes = new_matches_axes
+
+
+# A cache of the contribution of each figure to a layered figure, by the index of the figure
+LayerCache = Dict[int, LayerCacheEntry]
+
+
+def copy_matches_axes(
+    matches_axes: dict[Any, dict[int, str]]
+) -> dict[Any, dict[int, str]]:
+    """Copy axis match groups, so they can be modified without affecting the original
+
+    Args:
+      matches_axes: The axis match groups to copy
+
+    Returns:
+      The copied axis match groups
+
+    """
+    return {key: dict(axes) for key, axes in matches_axes.items()}
+
+
+def cached_fig_data_and_layout(
+    layer_cache: LayerCache | None,
+    fig: Figure,
+    i: int,
+    specs: list[LayerSpecDict] | None,
+    which_layout: int | None,
+    new_axes_start: dict[str, int],
+    matches_axes: dict[Any, dict[int, str]],
+) -> tuple[tuple | list, dict]:
+    """Get new data and layout for the specified figure, reusing the result of a
+    previous layering if the figure and the axes before it have not changed.
+    See fig_data_and_layout for the other arguments.
+
+    Args:
+      layer_cache: The cache of the previous layering, or None to not cache
+      fig: The current figure
+      i: The index of the figure
+      specs: See fig_data_and_layout
+      which_layout: See fig_data_and_layout
+      new_axes_start: See fig_data_and_layout
+      matches_axes: See fig_data_and_layout
+
+    Returns:
+      tuple[tuple | list, dict]: A tuple of figure data, figure layout
+
+    """
+    if layer_cache is None:
+        return fig_data_and_layout(
+            fig, i, specs, which_layout, new_axes_start, matches_axes
+        )
+
+    entry = layer_cache.get(i)
+    if (
+        entry is not None
+        and entry.fig is fig
+        and entry.axes_start == new_axes_start
+        and entry.matches_axes == matches_axes
+    ):
+        # the figure would be resized the same way, so skip resizing it again
+        new_axes_start.update(entry.new_axes_start)
+        matches_axes.clear()
+        matches_axes.update(copy_matches_axes(entry.new_matches_axes))
+        return entry.fig_data, entry.fig_layout
+
+    axes_start = dict(new_axes_start)
+    prev_matches_axes = copy_matches_axes(matches_axes)
+    fig_data, fig_layout = fig_data_and_layout(
+        fig, i, specs, which_layout, new_axes_start, matches_axes
+    )
+    layer_cache[i] = LayerCacheEntry(
+        fig,
+        axes_start,
+        prev_matches_axes,
+        fig_data,
+        fig_layout,
+        dict(new_axes_start),
+        copy_matches_axes(matches_axes),
+    )
+    return fig_data, fig_layout
+
+
+def needs_validation(
+    specs: list[LayerSpecDict] | None, unsafe_update_figure: Callable
+) -> bool:
+    """Check if the layered figure needs to be validated by plotly.
+    The figures being layered are already validated, so only axis updates from
+    the specs and changes made by unsafe_update_figure are new.
+
+    Args:
+      specs: The specs passed to layer
+      unsafe_update_figure: The update function passed to layer
+
+    Returns:
+      True if the figure should be validated
+
+    """
+    if unsafe_update_figure is not default_callback:
+        return True
+    return any(
+        spec.get("xaxis_update") or spec.get("yaxis_update") for spec in specs or []
+    )
+
+
+def remove_legend_title_text(layout: dict) -> None:
+    """Remove the legend title text from a layout dict, without modifying the
+    nested dicts, which may be shared with other figures
+
+    Args:
+      layout: The layout to remove the legend title text from
+
+    """
+    legend = layout.get("legend")
+    if legend and "text" in legend.get("title", {}):
+        title = {key: value for key, value in legend["title"].items() if key != "text"}
+        layout["legend"] = {**legend, "title": title}
+
+
 def atomic_layer(
     *figs: DeephavenFigure | Figure,
     which_layout: int | None = None,
@@ -441,6 +593,7 @@ def atomic_layer(
     remove_legend_title: bool = False,
     subplot_annotations: list[dict] | None = None,
     title: str | None = None,
+    layer_cache: LayerCache | None = None,
 ) -> DeephavenFigure:
     """
     Layers the provided figures. This is an atomic version of layer, so the
@@ -467,6 +620,10 @@ def atomic_layer(
         title:
             Title to set for the figure. If an empty string, no overall title is shown.
             If None, leaves the title as is.
+        layer_cache:
+            The cache of the previous layering of these figures. When layering is
+            repeated after some figures change, the unchanged figures are not
+            resized again. Passed by the layer node, which owns the cache.
 
     Returns:
         The layered chart
@@ -491,8 +648,8 @@ def atomic_layer(
             continue
 
         elif isinstance(arg, Figure):
-            fig_data, fig_layout = fig_data_and_layout(
-                arg, i, specs, which_layout, new_axes_start, matches_axes
+            fig_data, fig_layout = cached_fig_data_and_layout(
+                layer_cache, arg, i, specs, which_layout, new_axes_start, matches_axes
             )
 
         elif isinstance(arg, DeephavenFigure):
@@ -506,7 +663,8 @@ def atomic_layer(
             if plotly_fig is None:
                 raise ValueError("Figure does not have a plotly figure, cannot layer")
 
-            fig_data, fig_layout = fig_data_and_layout(
+            fig_data, fig_layout = cached_fig_data_and_layout(
+                layer_cache,
                 plotly_fig,
                 i,
                 specs,
@@ -529,23 +687,33 @@ def atomic_layer(
         new_data += fig_data
         new_layout.update(fig_layout)
 
-    new_fig = Figure(data=new_data, layout=new_layout)
+    if layer_cache is not None:
+        # drop figures that are no longer layered
+        for index in [index for index in list(layer_cache) if index >= len(figs)]:
+            layer_cache.pop(index)
 
     if remove_legend_title:
-        new_fig.update_layout(legend_title_text=None)
+        remove_legend_title_text(new_layout)
 
     # Add subplot annotations if provided
     if subplot_annotations:
-        existing_annotations = (
-            list(new_fig.layout.annotations) if new_fig.layout.annotations else []
+        new_layout["annotations"] = (
+            list(new_layout.get("annotations", [])) + subplot_annotations
         )
-        new_fig.update_layout(annotations=existing_annotations + subplot_annotations)
 
     # Add overall title if provided
     if isinstance(title, str) and title.strip() == "":
-        new_fig.update_layout(title=None)
+        new_layout.pop("title", None)
     elif isinstance(title, str):
-        new_fig.update_layout(title=title)
+        new_layout["title"] = {"text": title}
+
+    # the layout is assembled from already validated figures, so validating
+    # every property again is only needed for new user provided properties
+    new_fig = Figure(
+        data=new_data,
+        layout=new_layout,
+        _validate=needs_validation(specs, unsafe_update_figure),
+    )
 
     update_wrapper = partial(unsafe_figure_update_wrapper, unsafe_update_figure)
 
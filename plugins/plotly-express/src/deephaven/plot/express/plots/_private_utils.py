@@ -16,6 +16,7 @@ import deephaven.pandas as dhpd
 from ._layer import atomic_layer
 from .PartitionManager import PartitionManager
 from ..deephaven_figure import generate_figure, DeephavenFigure
+from ..preprocess.utilities import RangeTableProvider
 from ..shared import args_copy, unsafe_figure_update_wrapper
 from ..shared.distribution_args import (
     SHARED_DEFAULTS,
@@ -126,7 +127,7 @@ def apply_args_groups(args: dict[str, Any], possible_groups: set[str] | None) ->
 
     if "ecdf" in groups:
         # ecdf should be forced to lines even if both "lines" and "markers" are False
-        base_mode = "lines" if args["lines"] or not args["markers"] else "markers"
+        base_mode = "lines" if args.pop("lines") or not args["markers"] else "markers"
         args["mode"] = calculate_mode(base_mode, args)
         append_suffixes(
             ["color_discrete_sequence", "attached_color"], ["marker", "line"], sync_dict
@@ -444,7 +445,12 @@ def process_args(
     orig_process_args = args_copy(render_args)
     orig_process_func = lambda **local_args: create_deephaven_figure(**local_args)[0]
 
-    new_fig, table, key_column_table, update = create_deephaven_figure(**render_args)
+    # the range tables created while building are kept for when the figure is recreated
+    range_table_provider = RangeTableProvider()
+    with range_table_provider:
+        new_fig, table, key_column_table, update = create_deephaven_figure(
+            **render_args
+        )
 
     orig_process_args["args"].update(update)
 
@@ -458,6 +464,7 @@ def process_args(
         key_column_table,
         orig_process_func,
         filter_columns,
+        range_table_provider,
     )
 
     new_fig.calendar = calendar
@@ -600,6 +607,11 @@ def shared_box(is_marginal: bool = True, **args: Any) -> DeephavenFigure:
 
     func = px.box
     groups = SPREAD_GROUPS
+    if args.pop("precompute", False):
+        # only the statistics and a sample of the outliers are sent, never every value
+        if args.get("points") == "all":
+            raise ValueError("points cannot be 'all' when precompute is True")
+        groups = {*SPREAD_GROUPS, "preprocess_box"}
 
     return shared_marginal(is_marginal, func, groups, **args)
 
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import Callable
 
-from deephaven.table import Table
+import plotly.express as px
 
 from ._private_utils import (
+    process_args,
     shared_violin,
     shared_box,
     shared_strip,
@@ -133,6 +134,7 @@ def box(
     range_y: list[int] | None = None,
     points: bool | str = BOX_DEFAULTS["points"],
     notched: bool = False,
+    precompute: bool = False,
     title: str | None = None,
     template: str | None = None,
     unsafe_update_figure: Callable = BOX_DEFAULTS["unsafe_update_figure"],
@@ -185,7 +187,14 @@ def box(
       points: Default 'outliers', which draws points outside the whiskers.
         'suspectedoutliers' draws points below 4*Q1-3*Q3 and above 4*Q3-3*Q1.
         'all' draws all points and False draws no points.
+        Cannot be 'all' if precompute is True.
       notched: If True boxes are drawn with notches
+      precompute: If True, the box statistics are calculated on the server with
+        table aggregations, so only one row per box is sent to the client.
+        Use this for large tables. If both x and y are specified, y must be
+        numerical. The quartiles are percentile aggregations, which can differ
+        from plotly's default 'linear' quartile method by less than one rank.
+        Points are drawn from a sample of up to 1000 points per box.
       title: The title of the chart
       template: The template for the chart.
       unsafe_update_figure: An update function that takes a plotly figure
@@ -292,17 +301,30 @@ def strip(
 
 
 def _ecdf(
-    table: Table | None = None,
+    table: PartitionableTableLike,
     x: str | list[str] | None = None,
     y: str | list[str] | None = None,
+    by: str | list[str] | None = None,
+    by_vars: str | list[str] = "color",
+    filter_by: str | list[str] | bool | None = None,
+    required_filter_by: str | list[str] | bool | None = None,
+    color: str | list[str] | None = None,
+    line_dash: str | list[str] | None = None,
+    symbol: str | list[str] | None = None,
+    labels: dict[str, str] | None = None,
     markers: bool = False,
     lines: bool = True,
     color_discrete_sequence: list[str] | None = None,
+    color_discrete_map: dict[str | tuple[str], str] | None = None,
     line_dash_sequence: list[str] | None = None,
+    line_dash_map: dict[str | tuple[str], str] | None = None,
     symbol_sequence: list[str] | None = None,
+    symbol_map: dict[str | tuple[str], str] | None = None,
     opacity: float | None = None,
-    ecdfnorm: str = "probability",
+    orientation: Orientation | None = None,
+    ecdfnorm: str | None = "probability",
     ecdfmode: str = "standard",
+    npoints: int = 1000,
     log_x: bool = False,
     log_y: bool = False,
     range_x: list[int] | None = None,
@@ -311,32 +333,103 @@ def _ecdf(
     template: str | None = None,
     unsafe_update_figure: Callable = default_callback,
 ) -> DeephavenFigure:
-    """
+    """Returns an empirical cumulative distribution function (ECDF) chart.
+    The distribution is calculated on the server by counting values within
+    equal width bins and summing the counts cumulatively, so each line has at
+    most npoints points regardless of the size of the table.
 
     Args:
-      table: Table | None:  (Default value = None)
-      x: str | list[str] | None:  (Default value = None)
-      y: str | list[str] | None:  (Default value = None)
-      markers: bool:  (Default value = False)
-      lines: bool:  (Default value = True)
-      color_discrete_sequence: list[str] | None:  (Default value = None)
-      line_dash_sequence: list[str] | None:  (Default value = None)
-      symbol_sequence: list[str] | None:  (Default value = None)
-      opacity: float | None:  (Default value = None)
-      ecdfnorm: str:  (Default value = 'probability')
-      ecdfmode: str:  (Default value = 'standard')
-      log_x: bool:  (Default value = False)
-      log_y: bool:  (Default value = False)
-      range_x: list[int] | None:  (Default value = None)
-      range_y: list[int] | None:  (Default value = None)
-      title: str | None:  (Default value = None)
-      template: str | None:  (Default value = None)
-      unsafe_update_figure: Callable:  (Default value = default_callback)
+      table: A table to pull data from.
+      x: A column name or list of columns that contain x-axis values.
+        If only x is specified, the cumulative values are on the y-axis.
+        If both x and y are specified, the values in y are used as weights.
+      y: A column name or list of columns that contain y-axis values.
+        If only y is specified, the cumulative values are on the x-axis.
+      by: A column or list of columns that contain values to plot the figure traces by.
+        All values or combination of values map to a unique design. The variable
+        by_vars specifies which design elements are used.
+        This is overriden if any specialized design variables such as color are specified
+      by_vars: A string or list of string that contain design elements to plot by.
+        Can contain color, line_dash and symbol.
+        If associated maps or sequences are specified, they are used to map by column values
+        to designs. Otherwise, default values are used.
+      filter_by: A column or list of columns that contain values to filter the chart by.
+        If a boolean is passed and the table is partitioned, all partition key columns used to
+        create the partitions are used.
+        If no filters are specified, all partitions are shown on the chart.
+      required_filter_by: A column or list of columns that contain values to filter the chart by.
+        Values set in input filters or linkers for the relevant columns determine the exact values to display.
+        If a boolean is passed and the table is partitioned, all partition key columns used to
+        create the partitions are used.
+        All required input filters or linkers must be set for the chart to display any data.
+      color: A column or list of columns that contain color values.
+        The value is used for a plot by on color.
+        See color_discrete_map for additional behaviors.
+      line_dash: A column or list of columns that contain line_dash values.
+        The value is used for a plot by on line_dash.
+        See line_dash_map for additional behaviors.
+      symbol: A column or list of columns that contain symbol values.
+        The value is used for a plot by on symbol.
+        See symbol_map for additional behaviors.
+      labels: A dictionary of labels mapping columns to new labels.
+      markers: True to draw markers on the line, False to not.
+      lines: True to draw lines, False to draw only markers.
+        Lines are drawn if both lines and markers are False.
+      color_discrete_sequence: A list of colors to sequentially apply to
+        the series. The colors loop, so if there are more series than colors,
+        colors will be reused.
+      color_discrete_map: If dict, the keys should be strings of the column values (or a tuple
+        of combinations of column values) which map to colors.
+      line_dash_sequence: A list of line dashes to sequentially apply to
+        the series. The dashes loop, so if there are more series than dashes,
+        dashes will be reused.
+      line_dash_map: If dict, the keys should be strings of the column values (or a tuple
+        of combinations of column values) which map to line_dash.
+      symbol_sequence: A list of symbols to sequentially apply to the
+        markers in the series. The symbols loop, so if there are more series than
+        symbols, symbols will be reused.
+      symbol_map: If dict, the keys should be strings of the column values (or a tuple
+        of combinations of column values) which map to symbols.
+      opacity: Opacity to apply to all markers. 0 is completely transparent
+        and 1 is completely opaque.
+      orientation: The orientation of the chart.
+        If 'v', the cumulative values are on the y-axis.
+        If 'h', the cumulative values are on the x-axis.
+        Defaults to 'v' if `x` is specified.
+        Defaults to 'h' if only `y` is specified.
+      ecdfnorm: If 'probability', the cumulative values are the fraction of all values.
+        If 'percent', the result is the same but multiplied by 100.
+        If None, the cumulative values are counts, or sums of the weights.
+      ecdfmode: If 'standard', each point is the share of values at or below it.
+        If 'complementary', each point is the share of values above it.
+        If 'reversed', each point is the share of values at or above it.
+      npoints: The maximum number of points in each line.
+        Values are counted within this many equal width bins over the range of the table.
+      log_x: A boolean that specifies if the corresponding axis is a log
+        axis or not.
+      log_y: A boolean that specifies if the corresponding axis is a log
+        axis or not.
+      range_x: A list of two numbers that specify the range of the x-axis.
+      range_y: A list of two numbers that specify the range of the y-axis.
+      title: The title of the chart
+      template: The template for the chart.
+      unsafe_update_figure: An update function that takes a plotly figure
+        as an argument and optionally returns a plotly figure. If a figure is
+        not returned, the plotly figure passed will be assumed to be the return
+        value. Used to add any custom changes to the underlying plotly figure.
+        Note that the existing data traces should not be removed. This may lead
+        to unexpected behavior if traces are modified in a way that break data
+        mappings.
 
     Returns:
+      DeephavenFigure: A DeephavenFigure that contains the ECDF chart
 
     """
-    raise NotImplementedError("ecdf is not yet implemented")
+    args = locals()
+
+    return process_args(
+        args, {"ecdf", "preprocess_ecdf", "supports_lists"}, px_func=px.line
+    )
 
 
 def histogram(
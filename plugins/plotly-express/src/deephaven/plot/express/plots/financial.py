@@ -1,13 +1,49 @@
 from __future__ import annotations
 
-from typing import Callable
+from datetime import timedelta
+from typing import Any, Callable
 
-from ._private_utils import process_args
+from ._private_utils import process_args, convert_to_table
+from ..preprocess.utilities import create_bar_table
 from ..shared import default_callback
 from ..deephaven_figure import draw_ohlc, draw_candlestick, DeephavenFigure, Calendar
 from ..types import TableLike
 
 
+def apply_bar_interval(args: dict[str, Any]) -> None:
+    """
+    Replace the table with bars aggregated from ticks if a bar interval is set.
+    The open, high and low default to the close, so only the price column of the
+    ticks needs to be passed.
+
+    Args:
+        args: The args to update
+    """
+    bar_interval = args.pop("bar_interval")
+    bar_count = args.pop("bar_count")
+    if bar_interval is None:
+        return
+
+    close = args["close"]
+    open, high, low = (args[arg] or close for arg in ["open", "high", "low"])
+    if not all(isinstance(col, str) for col in [args["x"], open, high, low, close]):
+        raise ValueError(
+            "x and a single close column must be specified when bar_interval is set"
+        )
+
+    args["table"], columns = create_bar_table(
+        convert_to_table(args["table"]),
+        args["x"],
+        open,
+        high,
+        low,
+        close,
+        bar_interval,
+        bar_count,
+    )
+    args.update(columns)
+
+
 def ohlc(
     table: TableLike,
     x: str | None = None,
@@ -15,6 +51,8 @@ def ohlc(
     high: str | list[str] | None = None,
     low: str | list[str] | None = None,
     close: str | list[str] | None = None,
+    bar_interval: str | int | timedelta | None = None,
+    bar_count: int | None = None,
     increasing_color_sequence: list[str] | None = None,
     decreasing_color_sequence: list[str] | None = None,
     xaxis_sequence: list[int] | None = None,
@@ -33,6 +71,14 @@ def ohlc(
       high: The column containing the high data
       low: The column containing the low data
       close: The column containing the close data
+      bar_interval: If set, the table contains ticks that are aggregated into bars
+        of this length, such as 'PT1m'. Can also be a timedelta or an integer
+        number of nanoseconds. x must be a timestamp column, and the open, high
+        and low columns default to the close column, so passing the tick price
+        to close is enough. Each tick only updates the bar it falls in, and ticks
+        are expected in time order.
+      bar_count: If set with bar_interval, only the latest bar_count bars are
+        shown, which bounds the data sent for streaming ticks.
       increasing_color_sequence: A list of colors to sequentially apply to
         the series on increasing bars. The colors loop, so if there are
         more series than colors, colors will be reused.
@@ -75,6 +121,8 @@ def ohlc(
     #   fig.update(layout_xaxis_rangeslider_visible=False)
     args = locals()
 
+    apply_bar_interval(args)
+
     return process_args(args, set(), remap={"x": "x_finance"}, px_func=draw_ohlc)
 
 
@@ -85,6 +133,8 @@ def candlestick(
     high: str | list[str] | None = None,
     low: str | list[str] | None = None,
     close: str | list[str] | None = None,
+    bar_interval: str | int | timedelta | None = None,
+    bar_count: int | None = None,
     increasing_color_sequence: list[str] | None = None,
     decreasing_color_sequence: list[str] | None = None,
     xaxis_sequence: list[int] | None = None,
@@ -103,6 +153,14 @@ def candlestick(
       high: The column containing the high data
       low: The column containing the low data
       close: The column containing the close data
+      bar_interval: If set, the table contains ticks that are aggregated into bars
+        of this length, such as 'PT1m'. Can also be a timedelta or an integer
+        number of nanoseconds. x must be a timestamp column, and the open, high
+        and low columns default to the close column, so passing the tick price
+        to close is enough. Each tick only updates the bar it falls in, and ticks
+        are expected in time order.
+      bar_count: If set with bar_interval, only the latest bar_count bars are
+        shown, which bounds the data sent for streaming ticks.
       increasing_color_sequence: A list of colors to sequentially apply to
         the series on increasing bars. The colors loop, so if there are
         more series than colors, colors will be reused.
@@ -141,4 +199,6 @@ def candlestick(
     """
     args = locals()
 
+    apply_bar_interval(args)
+
     return process_args(args, set(), remap={"x": "x_finance"}, px_func=draw_candlestick)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, TypedDict
+from typing import Any, Callable, TypedDict
 import warnings
 
 from plotly import express as px
@@ -23,6 +23,24 @@ class MapCenter(TypedDict):
     lon: float
 
 
+def apply_spatial_bins(args: dict[str, Any], groups: set[str]) -> set[str]:
+    """
+    Get the groups for the plot, aggregating the points into cells on the server
+    if spatial bins are set
+
+    Args:
+        args: The args used to create the plot
+        groups: The groups of the plot
+
+    Returns:
+        The groups, with the spatial preprocessing group if spatial bins are set
+    """
+    if args["spatial_bins"] is None:
+        args.pop("spatial_bins")
+        return groups
+    return {*groups, "preprocess_spatial"}
+
+
 def scatter_geo(
     table: PartitionableTableLike,
     lat: str | None = None,
@@ -62,6 +80,7 @@ def scatter_geo(
     center: MapCenter | None = None,
     fitbounds: bool | str = False,
     basemap_visible: bool | None = None,
+    spatial_bins: int | None = None,
     title: str | None = None,
     template: str | None = None,
     unsafe_update_figure: Callable = default_callback,
@@ -154,6 +173,13 @@ def scatter_geo(
         If 'locations' or 'geojson', the map will zoom to the extent of the
         locations or geojson bounds respectively.
       basemap_visible: If True, the basemap layer is visible.
+      spatial_bins: If set, points are aggregated on the server into a grid of cells,
+        with about this many cells across the longitudes of the map. Each cell is
+        drawn as one point at the centroid of its points, and the other mapped
+        columns, such as hover_name and text, are taken from one of its points.
+        If size is not set, markers are sized by the number of points in each cell.
+        The grid covers the whole map and is not recalculated as the map is zoomed
+        and panned. Use this for tables with too many points to send to the browser.
       title: The title of the chart
       template: The template for the chart.
       unsafe_update_figure: An update function that takes a plotly figure
@@ -169,7 +195,9 @@ def scatter_geo(
     """
     args = locals()
 
-    return process_args(args, {"scatter"}, px_func=px.scatter_geo)
+    groups = apply_spatial_bins(args, {"scatter"})
+
+    return process_args(args, groups, px_func=px.scatter_geo)
 
 
 def scatter_mapbox(*args, **kwargs) -> DeephavenFigure:
@@ -253,6 +281,7 @@ def scatter_map(
     zoom: float | None = 0,
     center: MapCenter | None = None,
     map_style: str | None = None,
+    spatial_bins: int | None = None,
     title: str | None = None,
     template: str | None = None,
     unsafe_update_figure: Callable = default_callback,
@@ -328,6 +357,13 @@ def scatter_map(
         If a str, one of 'basic', 'carto-darkmatter', 'carto-darkmatter-nolabels', 'carto-positron',
         'carto-positron-nolabels', 'carto-voyager', 'carto-voyager-nolabels', 'dark', 'light',
         'open-street-map', 'outdoors', 'satellite', 'satellite-streets', 'streets', 'white-bg'.
+      spatial_bins: If set, points are aggregated on the server into a grid of cells,
+        with about this many cells across the visible longitudes. Each cell is drawn
+        as one point at the centroid of its points, and the other mapped columns,
+        such as hover_name and text, are taken from one of its points. If size is
+        not set, markers are sized by the number of points in each cell. The grid
+        is recalculated as the map is zoomed and panned. Use this for tables with
+        too many points to send to the browser.
       title: The title of the chart
       template: The template for the chart.
       unsafe_update_figure: An update function that takes a plotly figure
@@ -343,7 +379,9 @@ def scatter_map(
     """
     args = locals()
 
-    return process_args(args, {"scatter"}, px_func=px.scatter_map)
+    groups = apply_spatial_bins(args, {"scatter"})
+
+    return process_args(args, groups, px_func=px.scatter_map)
 
 
 def line_geo(
@@ -650,6 +688,7 @@ def density_map(
     zoom: float | None = 0,
     center: MapCenter | None = None,
     map_style: str | None = None,
+    spatial_bins: int | None = None,
     title: str | None = None,
     template: str | None = None,
     unsafe_update_figure: Callable = default_callback,
@@ -678,6 +717,12 @@ def density_map(
         If a str, one of 'basic', 'carto-darkmatter', 'carto-darkmatter-nolabels', 'carto-positron',
         'carto-positron-nolabels', 'carto-voyager', 'carto-voyager-nolabels', 'dark', 'light',
         'open-street-map', 'outdoors', 'satellite', 'satellite-streets', 'streets', 'white-bg'.
+      spatial_bins: If set, points are aggregated on the server into a grid of cells,
+        with about this many cells across the visible longitudes. Each cell is drawn
+        as one point at the centroid of its points, with z summed over the points,
+        or weighted by the number of points if z is not set. The grid is
+        recalculated as the map is zoomed and panned. Use this for tables with
+        too many points to send to the browser.
       title: The title of the chart
       template: The template for the chart.
       unsafe_update_figure: An update function that takes a plotly figure
@@ -693,4 +738,6 @@ def density_map(
     """
     args = locals()
 
-    return process_args(args, set(), px_func=px.density_map)
+    groups = apply_spatial_bins(args, set())
+
+    return process_args(args, groups, px_func=px.density_map)
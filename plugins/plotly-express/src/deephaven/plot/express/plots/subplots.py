@@ -5,7 +5,7 @@ from typing import Any, TypeVar, List, cast, TypedDict, Callable
 from deephaven.execution_context import make_user_exec_ctx
 from plotly.graph_objs import Figure
 
-from ._layer import layer, LayerSpecDict, atomic_layer
+from ._layer import layer, LayerCache, LayerSpecDict, atomic_layer
 from .. import DeephavenFigure
 from ..shared import default_callback
 
@@ -231,7 +231,7 @@ def extract_title_from_figure(fig: Figure | DeephavenFigure) -> str:
             return ""
         fig = plotly_fig
 
-    layout = fig.to_dict().get("layout", {})
+    layout = fig.layout.to_plotly_json()
     title = layout.get("title")
 
     if title is None:
@@ -382,6 +382,7 @@ def atomic_make_subplots(
     subplot_titles: list[str] | tuple[str, ...] | bool = False,
     title: str | None = None,
     unsafe_update_figure: Callable = default_callback,
+    layer_cache: LayerCache | None = None,
 ) -> DeephavenFigure:
     """Create subplots. Either figs and at least one of rows and cols or grid
     should be passed.
@@ -404,6 +405,7 @@ def atomic_make_subplots(
       Users should not be accessing this function directly.
       title: See make_subplots
       unsafe_update_figure: See make_subplots
+      layer_cache: See atomic_layer
 
     Returns:
       DeephavenFigure: The DeephavenFigure with subplots
@@ -496,6 +498,7 @@ def atomic_make_subplots(
         title=updated_title,
         # remove the legend title as it is likely incorrect
         remove_legend_title=True,
+        layer_cache=layer_cache,
     )
 
 
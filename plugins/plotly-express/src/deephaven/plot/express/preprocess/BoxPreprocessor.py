@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from typing import Any, Generator
+
+from deephaven import agg
+from deephaven.table import Table
+
+from ..shared import get_unique_names
+
+# the most points sent per box, so large tables with many outliers stay sized by box
+MAX_OUTLIERS = 1000
+
+
+class BoxPreprocessor:
+    """
+    Preprocessor for box plots that calculates the box statistics on the server.
+    Each table is aggregated into one row per box containing the quartiles, median,
+    mean and whiskers, so the client receives data sized by the number of boxes
+    rather than the number of rows.
+    The quartiles are percentile aggregations that average the two closest ranks when
+    the quartile falls between them, so they are updated incrementally rather than
+    sorting every box on each tick. They can differ from plotly's default "linear"
+    quartile method by less than one rank.
+    If points are drawn, a sample of up to MAX_OUTLIERS points outside of each box is
+    sent alongside the statistics.
+
+    Args:
+        args: Figure creation args
+        stacked_column_names: A dictionary that stores the "real" column
+            names if there is a list_param. This is needed in case the column names
+            used are already in the table.
+        list_param: The param that was passed in as a list
+
+    Attributes:
+        args: dict[str, Any]: Figure creation args
+        orientation: str: The orientation of the plot. Should be 'v' or 'h'.
+        value_var: str: The arg that holds the values the statistics are calculated
+            over. Should be y or x.
+        position_var: str: The arg that holds the box positions. Should be x or y.
+        value_col: str: The column that the statistics are calculated over
+        position_col: str | None: The column that the boxes are grouped by,
+            None if there is one box per table
+        notched: bool: If True, the notch span is calculated
+        points: str | bool | None: The points to sample, 'outliers' or
+            'suspectedoutliers'. No points are sampled if False or None.
+        names: dict[str, str]: A mapping of ideal name to unique names
+    """
+
+    def __init__(
+        self,
+        args: dict[str, Any],
+        stacked_column_names: dict[str, str] | None = None,
+        list_param: str | None = None,
+    ):
+        self.args = args
+        self.orientation = self.calculate_box_orientation()
+        self.args["orientation"] = self.orientation
+        self.value_var = "y" if self.orientation == "v" else "x"
+        self.position_var = "x" if self.value_var == "y" else "y"
+        self.value_col: str = (
+            stacked_column_names["value"]
+            if stacked_column_names and list_param == self.value_var
+            else args[self.value_var]
+        )
+        self.position_col: str | None = args.get(self.position_var)
+        if isinstance(self.position_col, list):
+            raise ValueError(
+                f"Only {self.value_var} can be a list when box statistics are precomputed"
+            )
+        self.notched = bool(args.get("notched"))
+        # the box traces only receive the statistics, so the points are drawn from
+        # the sampled outliers instead
+        self.points = args.get("points")
+        self.args["points"] = False
+        self.names = get_unique_names(
+            args["table"],
+            ["q1", "q3", "lowerfence", "upperfence", "mean", "notchspan", "count"],
+        )
+
+    def calculate_box_orientation(self) -> str:
+        """
+        Calculate the orientation of the plot.
+        If only x is specified the boxes are horizontal, otherwise they are vertical.
+        If both are specified, y should be numerical.
+
+        Returns:
+            The orientation
+        """
+        orientation = self.args.get("orientation")
+        x = self.args.get("x")
+        y = self.args.get("y")
+
+        if orientation:
+            return orientation
+        elif y:
+            return "v"
+        elif x:
+            return "h"
+
+        raise ValueError("Could not determine orientation")
+
+    def create_stats_table(self, table: Table, value_col: str) -> Table:
+        """
+        Create a table with one row per box containing the box statistics.
+        The median is stored in the value column.
+
+        Args:
+            table: The table to calculate the statistics over
+            value_col: The column to calculate the statistics over
+
+        Returns:
+            The statistics table
+        """
+        q1, q3, lowerfence, upperfence, mean, notchspan, count = (
+            self.names["q1"],
+            self.names["q3"],
+            self.names["lowerfence"],
+            self.names["upperfence"],
+            self.names["mean"],
+            self.names["notchspan"],
+            self.names["count"],
+        )
+        by = [self.position_col] if self.position_col else []
+
+        values = table.view([*by, value_col]).where(f"!isNull({value_col})")
+
+        stats = values.agg_by(
+            [
+                agg.pct(
+                    0.25, average_evenly_divided=True, cols=[f"{q1} = {value_col}"]
+                ),
+                agg.median(cols=[value_col]),
+                agg.pct(
+                    0.75, average_evenly_divided=True, cols=[f"{q3} = {value_col}"]
+                ),
+                agg.avg(cols=[f"{mean} = {value_col}"]),
+                agg.count_(count),
+            ],
+            by=by,
+        )
+
+        # the whiskers extend to the most extreme values within 1.5 IQR of the box
+        iqr = f"({q3} - {q1})"
+        whiskers = (
+            values.natural_join(stats, on=by, joins=[q1, q3])
+            .where(
+                [
+                    f"{value_col} >= {q1} - 1.5 * {iqr}",
+                    f"{value_col} <= {q3} + 1.5 * {iqr}",
+                ]
+            )
+            .agg_by(
+                [
+                    agg.min_(cols=[f"{lowerfence} = {value_col}"]),
+                    agg.max_(cols=[f"{upperfence} = {value_col}"]),
+                ],
+                by=by,
+            )
+        )
+
+        stats = stats.natural_join(whiskers, on=by, joins=[lowerfence, upperfence])
+
+        if self.notched:
+            # the same notch span plotly calculates from the sample
+            stats = stats.update_view(
+                f"{notchspan} = 1.57 * {iqr} / Math.sqrt({count})"
+            )
+
+        return stats.drop_columns(count)
+
+    def create_outliers_table(
+        self, table: Table, stats: Table, value_col: str
+    ) -> Table:
+        """
+        Create a table with a sample of the points outside of each box.
+        Outliers are outside of the whiskers, and suspected outliers are below
+        4*Q1-3*Q3 or above 4*Q3-3*Q1.
+
+        Args:
+            table: The table the statistics were calculated over
+            stats: The statistics table
+            value_col: The column the statistics were calculated over
+
+        Returns:
+            The outliers table, with up to MAX_OUTLIERS rows per box
+        """
+        q1, q3, lowerfence, upperfence = (
+            self.names["q1"],
+            self.names["q3"],
+            self.names["lowerfence"],
+            self.names["upperfence"],
+        )
+        by = [self.position_col] if self.position_col else []
+
+        if self.points == "suspectedoutliers":
+            lower, upper = f"4 * {q1} - 3 * {q3}", f"4 * {q3} - 3 * {q1}"
+        else:
+            lower, upper = lowerfence, upperfence
+
+        outliers = (
+            table.view([*by, value_col])
+            .where(f"!isNull({value_col})")
+            .natural_join(stats, on=by, joins=[q1, q3, lowerfence, upperfence])
+            .where(f"{value_col} < {lower} || {value_col} > {upper}")
+            .view([*by, value_col])
+        )
+
+        if by:
+            return outliers.head_by(MAX_OUTLIERS, by)
+        return outliers.head(MAX_OUTLIERS)
+
+    def preprocess_partitioned_tables(
+        self, tables: list[Table], column: str | None = None
+    ) -> Generator[tuple[Table, dict[str, Any]], None, None]:
+        """
+        Preprocess tables into box statistics tables
+
+        Args:
+            tables: List of tables to preprocess
+            column: the column used
+
+        Yields:
+            A tuple containing the table and a mapping of metadata. If points are
+            drawn, the mapping contains the outliers table as "outliers_table".
+        """
+        value_col = column if column else self.value_col
+
+        for table in tables:
+            update: dict[str, Any] = {
+                self.value_var: value_col,
+                "box_q1": self.names["q1"],
+                "box_median": value_col,
+                "box_q3": self.names["q3"],
+                "box_lowerfence": self.names["lowerfence"],
+                "box_upperfence": self.names["upperfence"],
+                "box_mean": self.names["mean"],
+            }
+            if self.notched:
+                update["box_notchspan"] = self.names["notchspan"]
+
+            stats = self.create_stats_table(table, value_col)
+            if self.points in ("outliers", "suspectedoutliers"):
+                update["outliers_table"] = self.create_outliers_table(
+                    table, stats, value_col
+                )
+
+            yield stats, update
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from typing import Any, Generator
+
+from deephaven import agg
+from deephaven.table import Table
+from deephaven.updateby import cum_sum
+
+from .UnivariateAwarePreprocessor import UnivariateAwarePreprocessor
+from ..shared import get_unique_names
+from .utilities import create_range_table
+
+ECDF_NORMS = {"probability", "percent", None}
+
+ECDF_MODES = {"standard", "reversed", "complementary"}
+
+
+class ECDFPreprocessor(UnivariateAwarePreprocessor):
+    """
+    Preprocessor for empirical cumulative distribution functions.
+    Values are counted within equal width bins over the range of the whole table,
+    then the counts are summed cumulatively, so each table is reduced to at most
+    npoints rows that update incrementally as the table ticks.
+
+    Attributes:
+        range_table: The range table, calculated over the whole original table
+        names: A mapping of ideal name to unique names
+        npoints: The maximum number of points in each line
+        ecdfnorm: The normalization of the cumulative values
+        ecdfmode: The direction the values are accumulated in
+    """
+
+    def __init__(
+        self,
+        args: dict[str, Any],
+        stacked_column_names: dict[str, str],
+        list_param: str | None = None,
+    ):
+        super().__init__(args, stacked_column_names, list_param)
+        self.range_table = None
+        self.names = {}
+        self.npoints = args.pop("npoints", 1000)
+        self.ecdfnorm = args.pop("ecdfnorm", "probability")
+        self.ecdfmode = args.pop("ecdfmode", "standard")
+
+        if self.ecdfnorm not in ECDF_NORMS:
+            raise ValueError(f"{self.ecdfnorm} is not a valid ecdfnorm")
+        if self.ecdfmode not in ECDF_MODES:
+            raise ValueError(f"{self.ecdfmode} is not a valid ecdfmode")
+
+        self.prepare_preprocess()
+
+    def prepare_preprocess(self) -> None:
+        """
+        Prepare for preprocessing by creating a range table over all values
+        """
+        self.names = get_unique_names(
+            self.args["table"],
+            [
+                "range_index",
+                "range",
+                "tmp_value",
+                "tmp_weight",
+                "bin_count",
+                "cum_count",
+                "total",
+                self.ecdfnorm or "count",
+            ],
+        )
+        self.range_table = create_range_table(
+            self.args["table"],
+            self.bin_col,
+            None,
+            self.npoints,
+            self.names["range"],
+        )
+
+    def create_ecdf_table(self, table: Table) -> Table:
+        """
+        Create the cumulative distribution of the values in the table
+
+        Args:
+            table: The table to calculate the distribution over
+
+        Returns:
+            A table with the bin edge and the cumulative value of each non-empty bin
+        """
+        range_index, range_, tmp_value, tmp_weight = (
+            self.names["range_index"],
+            self.names["range"],
+            self.names["tmp_value"],
+            self.names["tmp_weight"],
+        )
+        bin_count, cum_count, total = (
+            self.names["bin_count"],
+            self.names["cum_count"],
+            self.names["total"],
+        )
+        ecdf_col = self.names[self.ecdfnorm or "count"]
+
+        if not self.range_table:
+            raise ValueError("Range table not created")
+
+        # if both x and y are set, the values are weighted by the other column
+        weighted = self.agg_col != self.bin_col
+        view = [f"{tmp_value} = {self.bin_col}"]
+        if weighted:
+            view.append(f"{tmp_weight} = {self.agg_col}")
+
+        bin_counts = (
+            table.view(view)
+            .join(self.range_table)
+            .update_view(f"{range_index} = {range_}.index({tmp_value})")
+            .where(f"!isNull({range_index})")
+            .drop_columns(range_)
+            .agg_by(
+                [
+                    (
+                        agg.sum_(cols=[f"{bin_count} = {tmp_weight}"])
+                        if weighted
+                        else agg.count_(bin_count)
+                    )
+                ],
+                by=range_index,
+            )
+            .sort(range_index)
+            .update_by(cum_sum([f"{cum_count} = {bin_count}"]))
+        )
+
+        totals = bin_counts.agg_by([agg.sum_(cols=[f"{total} = {bin_count}"])])
+
+        if self.ecdfmode == "standard":
+            # the share of values at or below the end of the bin
+            edge = f"{range_}.binMax({range_index})"
+            value = cum_count
+        elif self.ecdfmode == "complementary":
+            # the share of values above the end of the bin
+            edge = f"{range_}.binMax({range_index})"
+            value = f"({total} - {cum_count})"
+        else:
+            # the share of values at or above the start of the bin
+            edge = f"{range_}.binMin({range_index})"
+            value = f"({total} - {cum_count} + {bin_count})"
+
+        if self.ecdfnorm == "probability":
+            value = f"{value} / (double) {total}"
+        elif self.ecdfnorm == "percent":
+            value = f"{value} * 100.0 / {total}"
+
+        return (
+            bin_counts.join(self.range_table)
+            .join(totals)
+            .view([f"{self.bin_col} = {edge}", f"{ecdf_col} = {value}"])
+        )
+
+    def preprocess_partitioned_tables(
+        self, tables: list[Table], column: str | None = None
+    ) -> Generator[tuple[Table, dict[str, str | None]], None, None]:
+        """
+        Preprocess tables into cumulative distribution tables
+
+        Args:
+            tables: List of tables to preprocess
+            column: the column used
+
+        Yields:
+            A tuple containing the table and a mapping of metadata
+        """
+        for table in tables:
+            yield self.create_ecdf_table(table), {
+                self.bin_var: self.bin_col,
+                self.agg_var: self.names[self.ecdfnorm or "count"],
+            }
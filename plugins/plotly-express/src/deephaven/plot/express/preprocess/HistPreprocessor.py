@@ -240,57 +240,63 @@ class HistPreprocessor(UnivariateAwarePreprocessor):
         if not self.range_table:
             raise ValueError("Range table not created")
 
-        bin_counts = bin_counts.join(self.range_table).update_view(
-            [
-                f"{bin_min} = {range_}.binMin({range_index})",
-                f"{bin_max} = {range_}.binMax({range_index})",
-                f"{bin_mid}=0.5*({bin_min}+{bin_max})",
-            ]
-        )
+        histnorm = self.histnorm
+        if self.cumulative and histnorm:
+            # with plotly express, cumulative=True will ignore density (including
+            # the density part of probability density, but not the probability
+            # part)
+            histnorm = histnorm.replace("density", "").strip()
 
+        totals = None
         if self.histnorm in {"percent", "probability", "probability density"}:
-            mult_factor = 100 if self.histnorm == "percent" else 1
-
-            sums = [f"{col}_sum = {col}" for col in new_agg_cols]
-
-            normed = [
-                f"{col} = {col} * {mult_factor} / {col}_sum" for col in new_agg_cols
-            ]
-
-            # range_ and bin cols need to be kept for probability density
-            # agg_var_name needs to be kept for plotting
-            bin_counts = (
-                bin_counts.agg_by(
-                    [
-                        agg.sum_(sums),
-                        agg.group(new_agg_cols + [bin_mid, range_, bin_min, bin_max]),
-                    ]
-                )
-                .update_view(normed)
-                .ungroup()
+            # the totals are taken before the cumulative sum, so they are joined
+            # back onto every bin rather than grouping and ungrouping the bins
+            totals = bin_counts.agg_by(
+                [agg.sum_([f"{col}_sum = {col}" for col in new_agg_cols])]
             )
 
         if self.cumulative:
             bin_counts = bin_counts.update_by(cum_sum(new_agg_cols))
 
-            # with plotly express, cumulative=True will ignore density (including
-            # the density part of probability density, but not the probability
-            # part)
-            if self.histnorm:
-                self.histnorm = self.histnorm.replace("density", "").strip()
-
-        if self.histnorm in {"density", "probability density"}:
-            bin_counts = bin_counts.update_view(
-                [f"{col} = {col} / ({bin_max} - {bin_min})" for col in new_agg_cols]
-            )
+        bin_counts = bin_counts.join(self.range_table)
+        if totals is not None:
+            bin_counts = bin_counts.join(totals)
+
+        # every normalization is folded into a single formula per column so only
+        # one more table is created regardless of how many options are set
+        normed = {}
+        for col in new_agg_cols:
+            formula = col
+            if totals is not None:
+                mult_factor = 100 if self.histnorm == "percent" else 1
+                formula = f"{formula} * {mult_factor} / {col}_sum"
+            if histnorm in {"density", "probability density"}:
+                formula = f"({formula}) / ({bin_max} - {bin_min})"
+            normed[col] = formula
+
+        bin_updates = [
+            f"{bin_min} = {range_}.binMin({range_index})",
+            f"{bin_max} = {range_}.binMax({range_index})",
+            f"{bin_mid}=0.5*({bin_min}+{bin_max})",
+        ]
 
         if self.barnorm:
             mult_factor = 100 if self.barnorm == "percent" else 1
-            sum_form = f"sum({','.join(new_agg_cols)})"
-            bin_counts = bin_counts.update_view(
-                [f"{total}={sum_form}"]
-                + [f"{col}={col} * {mult_factor} / {total}" for col in new_agg_cols]
-            )
+            sum_form = f"sum({','.join(f'({formula})' for formula in normed.values())})"
+            bin_updates.append(f"{total}={sum_form}")
+            normed = {
+                col: f"({formula}) * {mult_factor} / {total}"
+                for col, formula in normed.items()
+            }
+
+        bin_counts = bin_counts.update_view(
+            bin_updates
+            + [
+                f"{col} = {formula}"
+                for col, formula in normed.items()
+                if col != formula
+            ]
+        )
 
         for new_agg_col in new_agg_cols:
             yield bin_counts.view([f"{bin_col} = {bin_mid}", new_agg_col]), {
@@ -7,8 +7,11 @@ from deephaven.plot.express.shared import get_unique_names
 from deephaven.table import Table
 
 from .AttachedPreprocessor import AttachedPreprocessor
+from .BoxPreprocessor import BoxPreprocessor
+from .ECDFPreprocessor import ECDFPreprocessor
 from .FreqPreprocessor import FreqPreprocessor
 from .HistPreprocessor import HistPreprocessor
+from .SpatialPreprocessor import SpatialPreprocessor
 from .TimePreprocessor import TimePreprocessor
 from .HeatmapPreprocessor import HeatmapPreprocessor
 from .HierarchicalPreprocessor import HierarchicalPreprocessor
@@ -59,12 +62,22 @@ class Preprocessor:
             self.preprocessors.append(
                 HistPreprocessor(self.args, self.stacked_column_names, self.list_param)
             )
+        elif "preprocess_box" in self.groups:
+            self.preprocessors.append(
+                BoxPreprocessor(self.args, self.stacked_column_names, self.list_param)
+            )
+        elif "preprocess_ecdf" in self.groups:
+            self.preprocessors.append(
+                ECDFPreprocessor(self.args, self.stacked_column_names, self.list_param)
+            )
         elif "preprocess_freq" in self.groups:
             self.preprocessors.append(FreqPreprocessor(self.args))
         elif "preprocess_time" in self.groups:
             self.preprocessors.append(TimePreprocessor(self.args))
         elif "preprocess_heatmap" in self.groups:
             self.preprocessors.append(HeatmapPreprocessor(self.args))
+        elif "preprocess_spatial" in self.groups:
+            self.preprocessors.append(SpatialPreprocessor(self.args))
         elif "always_attached" in self.groups:
             # this is an engine oddity - if maps to a boolean
             color_mask = "true"
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Generator
+
+from deephaven import agg
+from deephaven.table import Table
+
+from ..shared import get_unique_names
+
+# The finest grid level, where a cell is 360 / 2 ** 30 degrees across
+MAX_SPATIAL_LEVEL = 30
+
+
+def calculate_spatial_level(span: float, spatial_bins: int) -> int:
+    """
+    Calculate the grid level where about spatial_bins cells span the visible longitudes.
+    Cells at level n are 360 / 2 ** n degrees across, so the cells of each level
+    split the cells of the level above into four, like map tiles.
+
+    Args:
+        span: The visible range of longitude in degrees
+        spatial_bins: The ideal number of cells across the visible longitudes
+
+    Returns:
+        The grid level
+    """
+    level = math.ceil(math.log2(360 * spatial_bins / span))
+    return min(max(level, 0), MAX_SPATIAL_LEVEL)
+
+
+class SpatialPreprocessor:
+    """
+    Preprocessor for maps that aggregates points into a grid of cells on the server.
+    Each table is reduced to one point per non-empty cell, placed at the centroid of
+    the points in the cell, so the client receives data sized by the number of visible
+    cells rather than the number of rows. The other columns the figure maps, such as
+    hover_name and text, are sampled from one row of the cell, so hover information
+    shows a representative point. Columns the figure doesn't use are dropped.
+
+    Args:
+        args: Figure creation args
+
+    Attributes:
+        args: dict[str, Any]: Figure creation args
+        lat: str: The latitude column
+        lon: str: The longitude column
+        spatial_bins: int: The ideal number of cells across the visible longitudes
+        range_lat: list[float] | None: The visible range of latitude, if known
+        range_lon: list[float] | None: The visible range of longitude, if known
+        cell_size: float: The width and height of a cell in degrees
+        names: dict[str, str]: A mapping of ideal name to unique names
+    """
+
+    def __init__(self, args: dict[str, Any]):
+        self.args = args
+        self.lat = args.get("lat")
+        self.lon = args.get("lon")
+        self.spatial_bins = args.pop("spatial_bins")
+        self.range_lat = args.pop("spatial_range_lat", None)
+        self.range_lon = args.pop("spatial_range_lon", None)
+
+        if not isinstance(self.lat, str) or not isinstance(self.lon, str):
+            raise ValueError("lat and lon columns must be set to use spatial_bins")
+        if not isinstance(self.spatial_bins, int) or self.spatial_bins <= 0:
+            raise ValueError("spatial_bins must be a positive integer")
+
+        if self.range_lon:
+            span = self.range_lon[1] - self.range_lon[0]
+        else:
+            # until the client reports a viewport, the initial zoom is visible
+            span = 360 / 2 ** (args.get("zoom") or 0)
+
+        self.cell_size = 360 / 2 ** calculate_spatial_level(span, self.spatial_bins)
+
+        self.names = get_unique_names(args["table"], ["cell_lat", "cell_lon", "count"])
+
+    def visible_filters(self) -> list[str]:
+        """
+        Get the filters that remove points outside the visible range,
+        with a margin of one cell so cells on the edge are complete
+
+        Returns:
+            The filters
+        """
+        filters = []
+        if self.range_lat:
+            filters.extend(
+                [
+                    f"{self.lat} >= {self.range_lat[0] - self.cell_size}",
+                    f"{self.lat} <= {self.range_lat[1] + self.cell_size}",
+                ]
+            )
+        # a range past the antimeridian covers longitudes on both sides of it,
+        # so only ranges within the usual longitudes are filtered
+        if self.range_lon and self.range_lon[0] >= -180 and self.range_lon[1] <= 180:
+            filters.extend(
+                [
+                    f"{self.lon} >= {self.range_lon[0] - self.cell_size}",
+                    f"{self.lon} <= {self.range_lon[1] + self.cell_size}",
+                ]
+            )
+        return filters
+
+    def get_mapped_columns(self, table: Table) -> list[str]:
+        """
+        Get the columns of the table that the figure maps, other than the location
+        and weight columns that are aggregated
+
+        Args:
+            table: The table to get the columns of
+
+        Returns:
+            The mapped columns, in table order
+        """
+        aggregated = {self.lat, self.lon, self.args.get("z")}
+        mapped = set()
+        for arg, value in self.args.items():
+            if arg == "table":
+                continue
+            if isinstance(value, str):
+                mapped.add(value)
+            elif isinstance(value, list):
+                mapped.update(col for col in value if isinstance(col, str))
+
+        return [
+            col for col in table.column_names if col in mapped and col not in aggregated
+        ]
+
+    def create_spatial_table(self, table: Table) -> Table:
+        """
+        Aggregate the points in the table into one point per cell
+
+        Args:
+            table: The table to aggregate
+
+        Returns:
+            A table with one row per non-empty cell
+        """
+        cell_lat, cell_lon, count = (
+            self.names["cell_lat"],
+            self.names["cell_lon"],
+            self.names["count"],
+        )
+        z = self.args.get("z")
+
+        sampled = self.get_mapped_columns(table)
+
+        aggs = [
+            agg.avg(cols=[self.lat, self.lon]),
+            agg.count_(count),
+        ]
+        if z:
+            # density is additive, so the cell weighs as much as its points together
+            aggs.append(agg.sum_(cols=[z]))
+        if sampled:
+            aggs.append(agg.first(cols=sampled))
+
+        points = table.where(
+            [f"!isNull({self.lat})", f"!isNull({self.lon})", *self.visible_filters()]
+        )
+
+        return (
+            points.update_view(
+                [
+                    f"{cell_lat} = (long) Math.floor({self.lat} / {self.cell_size})",
+                    f"{cell_lon} = (long) Math.floor({self.lon} / {self.cell_size})",
+                ]
+            )
+            .agg_by(aggs, by=[cell_lat, cell_lon])
+            .drop_columns([cell_lat, cell_lon])
+        )
+
+    def preprocess_partitioned_tables(
+        self, tables: list[Table], column: str | None = None
+    ) -> Generator[tuple[Table, dict[str, str | None]], None, None]:
+        """
+        Preprocess tables into tables with one point per cell
+
+        Args:
+            tables: List of tables to preprocess
+            column: the column used
+
+        Yields:
+            A tuple containing the table and a mapping of metadata
+        """
+        update: dict[str, str | None] = {}
+        if "z" in self.args and not self.args["z"]:
+            # density maps weigh each cell by the number of points in it
+            update["z"] = self.names["count"]
+        elif "size" in self.args and not self.args["size"]:
+            # markers are sized by the number of points in the cell
+            update["size"] = self.names["count"]
+
+        for table in tables:
+            yield self.create_spatial_table(table), update
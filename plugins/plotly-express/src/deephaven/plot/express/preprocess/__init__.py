@@ -1 +0,0 @@
-from .preprocess import preprocess_ecdf
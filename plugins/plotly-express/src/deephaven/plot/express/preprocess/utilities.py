@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Generator, Literal
+import threading
+from datetime import timedelta
+from typing import Any, Generator, Literal
 
 from deephaven import agg, empty_table
+from deephaven.liveness_scope import LivenessScope
 from deephaven.plot.express.shared import get_unique_names
 from deephaven.table import PartitionedTable, Table
 
@@ -86,6 +89,148 @@ def discretized_range_view(
     ).view(range_name)
 
 
+# the providers of the figure graphs being built on each thread
+_local_data = threading.local()
+
+
+class RangeTableProvider:
+    """
+    Memoizes the single row tables that contain the min and max over columns of a table.
+    Multiple plots in one figure graph often bin the same columns of the same table,
+    such as marginals, layers and subplots, and the figure is recreated whenever
+    partitions change, so the min and max aggregation is shared rather than recalculated.
+
+    Each figure graph owns a provider, and the range tables are released with it.
+    Range tables are keyed by the underlying java table, so the different python
+    wrappers created for the same table when a figure is recreated share them.
+
+    Attributes:
+        _lock: threading.Lock: The lock guarding the cache
+        _liveness_scope: LivenessScope | None: The liveness scope that keeps the range
+            tables alive, created once a refreshing range table is cached
+        _range_tables: dict[tuple[Any, tuple[str, ...], str, str], Table]: The range
+            tables, keyed by source java table, columns and range column names
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._liveness_scope = None
+        self._range_tables = {}
+
+    def get_min_max_table(
+        self,
+        table: Table | PartitionedTable,
+        cols: list[str],
+        range_min: str,
+        range_max: str,
+    ) -> Table:
+        """
+        Get a single row table with the min and max over all the columns
+
+        Args:
+            table: The table to calculate the min and max over
+            cols: The columns to calculate the min and max over
+            range_min: The name of the column that holds the min
+            range_max: The name of the column that holds the max
+
+        Returns:
+            A table with range_min and range_max columns
+        """
+        # j_object is the java table of both tables and partitioned tables
+        key = (table.j_object, tuple(cols), range_min, range_max)
+
+        with self._lock:
+            if key in self._range_tables:
+                return self._range_tables[key]
+
+        min_max_table = create_min_max_table(table, cols, range_min, range_max)
+
+        with self._lock:
+            if key in self._range_tables:
+                # another thread created the same range table in the meantime
+                return self._range_tables[key]
+
+            if min_max_table.is_refreshing:
+                # static tables should not be managed
+                if self._liveness_scope is None:
+                    self._liveness_scope = LivenessScope()
+                self._liveness_scope.manage(min_max_table)
+            self._range_tables[key] = min_max_table
+
+        return min_max_table
+
+    def release(self) -> None:
+        """
+        Release all range tables
+        """
+        with self._lock:
+            self._range_tables = {}
+            liveness_scope = self._liveness_scope
+            self._liveness_scope = None
+
+        if liveness_scope is not None:
+            liveness_scope.release()
+
+    def __enter__(self) -> RangeTableProvider:
+        """
+        Use this provider for the range tables created on this thread
+
+        Returns:
+            This provider
+        """
+        providers = getattr(_local_data, "range_table_providers", None)
+        if providers is None:
+            providers = _local_data.range_table_providers = []
+        providers.append(self)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Stop using this provider for the range tables created on this thread
+        """
+        _local_data.range_table_providers.pop()
+
+
+def get_range_table_provider() -> RangeTableProvider | None:
+    """
+    Get the provider of the figure graph being built on this thread
+
+    Returns:
+        The provider, or None if no figure graph is being built
+    """
+    providers = getattr(_local_data, "range_table_providers", None)
+    return providers[-1] if providers else None
+
+
+def create_min_max_table(
+    table: Table | PartitionedTable,
+    cols: list[str],
+    range_min: str,
+    range_max: str,
+) -> Table:
+    """
+    Create a single row table with the min and max over all the columns.
+    Both are calculated within one aggregation.
+
+    Args:
+        table: The table to calculate the min and max over
+        cols: The columns to calculate the min and max over
+        range_min: The name of the column that holds the min
+        range_max: The name of the column that holds the max
+
+    Returns:
+        A table with range_min and range_max columns
+    """
+    min_aggs, min_cols = get_aggs(range_min, cols)
+    max_aggs, max_cols = get_aggs(range_max, cols)
+    return (
+        single_table(table)
+        .agg_by([agg.min_(min_aggs), agg.max_(max_aggs)])
+        .update([f"{range_min} = min({min_cols})", f"{range_max} = max({max_cols})"])
+        .view([range_min, range_max])
+    )
+
+
 def create_range_table(
     table: Table | PartitionedTable,
     cols: str | list[str],
@@ -111,8 +256,6 @@ def create_range_table(
     Returns:
         A table that contains the range object for the given
     """
-    table = single_table(table)
-
     cols = [cols] if isinstance(cols, str) else cols
 
     range_min = (
@@ -122,22 +265,18 @@ def create_range_table(
         range_bins[1] if range_bins and range_bins[1] is not None else "RangeMax"
     )
 
-    min_table = empty_table(1)
-    max_table = empty_table(1)
-
-    if range_min == "RangeMin":
-        min_aggs, min_cols = get_aggs("RangeMin", cols)
-        min_table = table.agg_by([agg.min_(min_aggs)]).update(
-            [f"RangeMin = min({min_cols})"]
-        )
-    if range_max == "RangeMax":
-        max_aggs, max_cols = get_aggs("RangeMax", cols)
-        max_table = table.agg_by([agg.max_(max_aggs)]).update(
-            [f"RangeMax = max({max_cols})"]
+    if range_min == "RangeMin" or range_max == "RangeMax":
+        provider = get_range_table_provider()
+        min_max_table = (
+            provider.get_min_max_table(table, cols, "RangeMin", "RangeMax")
+            if provider is not None
+            else create_min_max_table(table, cols, "RangeMin", "RangeMax")
         )
+    else:
+        min_max_table = empty_table(1)
 
     return discretized_range_view(
-        min_table.join(max_table), range_min, range_max, nbins, range_name
+        min_max_table, range_min, range_max, nbins, range_name
     )
 
 
@@ -282,3 +421,65 @@ def calculate_bin_locations(
             f"{histfunc_col} = {agg_col}",
         ]
     )
+
+
+def create_bar_table(
+    table: Table,
+    x: str,
+    open: str,
+    high: str,
+    low: str,
+    close: str,
+    bar_interval: str | int | timedelta,
+    bar_count: int | None = None,
+) -> tuple[Table, dict[str, str]]:
+    """
+    Aggregate ticks into open, high, low and close bars of a fixed interval.
+    The bars are aggregated by interval, so each tick only updates the bar it falls in.
+    Ticks are expected to arrive in time order, so the first and last tick of a bar
+    are its open and close.
+
+    Args:
+        table: The table of ticks
+        x: The timestamp column of the ticks, which is replaced with the start of each bar
+        open: The column to take the open of each bar from
+        high: The column to take the high of each bar from
+        low: The column to take the low of each bar from
+        close: The column to take the close of each bar from
+        bar_interval: The length of each bar. A duration string such as 'PT1m',
+            a timedelta, or an integer number of nanoseconds.
+        bar_count: If set, only the latest bar_count bars are kept
+
+    Returns:
+        A tuple containing the bar table and the names of the open, high, low and close columns
+    """
+    if isinstance(bar_interval, str):
+        interval = f"'{bar_interval}'"
+    elif isinstance(bar_interval, timedelta):
+        interval = f"{bar_interval // timedelta(microseconds=1) * 1000}L"
+    else:
+        interval = f"{int(bar_interval)}L"
+
+    names = get_unique_names(table, ["Open", "High", "Low", "Close"])
+    value_cols = list(dict.fromkeys([open, high, low, close]))
+
+    bars = table.view([f"{x} = lowerBin({x}, {interval})", *value_cols]).agg_by(
+        [
+            agg.first(cols=[f"{names['Open']} = {open}"]),
+            agg.max_(cols=[f"{names['High']} = {high}"]),
+            agg.min_(cols=[f"{names['Low']} = {low}"]),
+            agg.last(cols=[f"{names['Close']} = {close}"]),
+        ],
+        by=x,
+    )
+
+    if bar_count is not None:
+        # bars are created in time order, so the tail is the latest bars
+        bars = bars.tail(bar_count)
+
+    return bars, {
+        "open": names["Open"],
+        "high": names["High"],
+        "low": names["Low"],
+        "close": names["Close"],
+    }
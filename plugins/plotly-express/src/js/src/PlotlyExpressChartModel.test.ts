@@ -665,4 +665,71 @@ describe('PlotlyExpressChartModel', () => {
 
     expect(chartModel.subscriptionCleanupMap.size).toBe(0);
   });
+
+  it('should send the visible ranges after the user stops zooming if the figure supports viewports', async () => {
+    const mockWidget = createMockWidget([SMALL_TABLE], 'histogram');
+    const widgetData = getWidgetData(mockWidget);
+    widgetData.figure.deephaven.supports_viewport = true;
+    mockWidget.getDataAsString = () => JSON.stringify(widgetData);
+    const chartModel = new PlotlyExpressChartModel(
+      mockDh,
+      mockWidget,
+      jest.fn()
+    );
+
+    await chartModel.subscribe(jest.fn());
+    await new Promise(process.nextTick);
+
+    jest.useFakeTimers();
+    try {
+      chartModel.layout.xaxis = { autorange: false, range: [1, 3] };
+      chartModel.setDimensions({ width: 100, height: 100 } as DOMRect);
+      chartModel.setDimensions({ width: 100, height: 100 } as DOMRect);
+      expect(mockWidget.sendMessage).toHaveBeenCalledTimes(0);
+
+      jest.advanceTimersByTime(PlotlyExpressChartModel.VIEWPORT_DEBOUNCE_MS);
+      expect(mockWidget.sendMessage).toHaveBeenCalledTimes(1);
+      expect(mockWidget.sendMessage).toHaveBeenLastCalledWith(
+        '{"type":"VIEWPORT","viewport":{"x":[1,3]}}'
+      );
+
+      // an unchanged viewport is not sent again
+      chartModel.setDimensions({ width: 200, height: 100 } as DOMRect);
+      jest.advanceTimersByTime(PlotlyExpressChartModel.VIEWPORT_DEBOUNCE_MS);
+      expect(mockWidget.sendMessage).toHaveBeenCalledTimes(1);
+
+      // autoranging resets the bins
+      chartModel.layout.xaxis = { autorange: true, range: [1, 3] };
+      chartModel.setDimensions({ width: 200, height: 100 } as DOMRect);
+      jest.advanceTimersByTime(PlotlyExpressChartModel.VIEWPORT_DEBOUNCE_MS);
+      expect(mockWidget.sendMessage).toHaveBeenCalledTimes(2);
+      expect(mockWidget.sendMessage).toHaveBeenLastCalledWith(
+        '{"type":"VIEWPORT","viewport":{}}'
+      );
+    } finally {
+      jest.useRealTimers();
+    }
+  });
+
+  it('should not send the viewport if the figure does not support viewports', async () => {
+    const mockWidget = createMockWidget([SMALL_TABLE], 'scatter');
+    const chartModel = new PlotlyExpressChartModel(
+      mockDh,
+      mockWidget,
+      jest.fn()
+    );
+
+    await chartModel.subscribe(jest.fn());
+    await new Promise(process.nextTick);
+
+    jest.useFakeTimers();
+    try {
+      chartModel.layout.xaxis = { autorange: false, range: [1, 3] };
+      chartModel.setDimensions({ width: 100, height: 100 } as DOMRect);
+      jest.advanceTimersByTime(PlotlyExpressChartModel.VIEWPORT_DEBOUNCE_MS);
+      expect(mockWidget.sendMessage).toHaveBeenCalledTimes(0);
+    } finally {
+      jest.useRealTimers();
+    }
+  });
 });
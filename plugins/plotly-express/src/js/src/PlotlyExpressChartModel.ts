@@ -24,6 +24,7 @@ import {
   getDataMappings,
   getPathParts,
   getReplaceableWebGlTraceIndices,
+  getViewport,
   getWidgetData,
   isAutoAxis,
   isLineSeries,
@@ -57,6 +58,12 @@ export class PlotlyExpressChartModel extends ChartModel {
    */
   static MAX_FETCH_SIZE = 1_000_000;
 
+  /**
+   * How long to wait for the user to stop zooming or panning before sending
+   * the viewport to the server, in milliseconds.
+   */
+  static VIEWPORT_DEBOUNCE_MS = 250;
+
   static canFetch(table: DhType.Table): boolean {
     return table.size <= PlotlyExpressChartModel.MAX_FETCH_SIZE;
   }
@@ -195,6 +202,20 @@ export class PlotlyExpressChartModel extends ChartModel {
    */
   requiredColumns: Set<string> = new Set();
 
+  /**
+   * If the server rebins the figure over the visible range, such as for histograms.
+   * The viewport is only sent to the server if this is true.
+   */
+  supportsViewport = false;
+
+  /**
+   * The last viewport sent to the server, serialized.
+   * Nothing is sent until the user zooms or pans away from the original ranges.
+   */
+  sentViewport = '{}';
+
+  viewportTimeout?: ReturnType<typeof setTimeout>;
+
   cleanupSubscriptions(id: number): void {
     this.subscriptionCleanupMap.get(id)?.forEach(cleanup => {
       cleanup();
@@ -252,6 +273,7 @@ export class PlotlyExpressChartModel extends ChartModel {
 
   override close(): void {
     super.close();
+    clearTimeout(this.viewportTimeout);
     this.widget?.close();
     this.widget = undefined;
   }
@@ -304,6 +326,7 @@ export class PlotlyExpressChartModel extends ChartModel {
     }
     super.unsubscribe(callback);
     this.widgetUnsubscribe?.();
+    clearTimeout(this.viewportTimeout);
     this.isSubscribed = false;
 
     this.tableReferenceMap.forEach((_, id) => this.removeTable(id));
@@ -523,6 +546,8 @@ export class PlotlyExpressChartModel extends ChartModel {
     const { layout: plotlyLayout = {} } = plotly;
     this.tableColumnReplacementMap = getDataMappings(data);
 
+    this.supportsViewport = deephaven.supports_viewport === true;
+
     this.plotlyData = plotly.data;
 
     if (!deephaven.is_user_set_template) {
@@ -886,6 +911,7 @@ export class PlotlyExpressChartModel extends ChartModel {
     this.downsampleMap.forEach((_, id) => {
       this.updateDownsampledTable(id);
     });
+    this.sendViewportUpdated();
   }
 
   override getFilterColumnMap(): FilterColumnMap {
@@ -926,6 +952,36 @@ export class PlotlyExpressChartModel extends ChartModel {
     }
   }
 
+  /**
+   * Send the visible ranges to the server once the user stops zooming or panning,
+   * so figures binned on the server are rebinned over the visible range.
+   */
+  sendViewportUpdated(): void {
+    if (!this.supportsViewport || !this.isSubscribed) {
+      return;
+    }
+
+    clearTimeout(this.viewportTimeout);
+    this.viewportTimeout = setTimeout(() => {
+      const viewport = getViewport(
+        this.layout,
+        this.getPlotWidth(),
+        this.getPlotHeight()
+      );
+      const serializedViewport = JSON.stringify(viewport);
+      if (serializedViewport === this.sentViewport) {
+        return;
+      }
+      this.sentViewport = serializedViewport;
+      this.widget?.sendMessage(
+        JSON.stringify({
+          type: 'VIEWPORT',
+          viewport,
+        })
+      );
+    }, PlotlyExpressChartModel.VIEWPORT_DEBOUNCE_MS);
+  }
+
   pauseUpdates(): void {
     this.isPaused = true;
   }
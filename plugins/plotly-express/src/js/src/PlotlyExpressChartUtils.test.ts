@@ -10,6 +10,9 @@ import {
   isAutoAxis,
   isLinearAxis,
   areSameAxisRange,
+  getAxisRange,
+  getViewport,
+  getMapViewport,
   removeColorsFromData,
   getDataMappings,
   type PlotlyChartWidgetData,
@@ -278,6 +281,72 @@ describe('areSameAxisRange', () => {
   });
 });
 
+describe('getAxisRange', () => {
+  it('should return the sorted range of a numeric axis that is not autoranged', () => {
+    expect(getAxisRange({ autorange: false, range: [1, 3] })).toEqual([1, 3]);
+    expect(getAxisRange({ autorange: false, range: [3, 1] })).toEqual([1, 3]);
+  });
+
+  it('should return null if the axis is autoranged or not numeric', () => {
+    expect(getAxisRange(undefined)).toBeNull();
+    expect(getAxisRange({ autorange: true, range: [1, 3] })).toBeNull();
+    expect(
+      getAxisRange({ autorange: false, type: 'log', range: [1, 3] })
+    ).toBeNull();
+    expect(
+      getAxisRange({
+        autorange: false,
+        type: 'date',
+        range: ['2024-01-01', '2024-01-02'],
+      })
+    ).toBeNull();
+  });
+});
+
+describe('getViewport', () => {
+  it('should return the ranges of the axes that are not autoranged', () => {
+    expect(
+      getViewport({
+        xaxis: { autorange: false, range: [1, 3] },
+        yaxis: { autorange: true },
+      })
+    ).toEqual({ x: [1, 3] });
+    expect(getViewport({})).toEqual({});
+  });
+
+  it('should return the bounds of a tile map', () => {
+    const map = { center: { lat: 0, lon: 10 }, zoom: 0 };
+    expect(
+      getViewport({ map } as Partial<Plotly.Layout>, 512, 512)
+    ).toEqual(getMapViewport(map, 512, 512));
+  });
+});
+
+describe('getMapViewport', () => {
+  it('should return the visible latitudes and longitudes', () => {
+    const viewport = getMapViewport(
+      { center: { lat: 0, lon: 10 }, zoom: 1 },
+      512,
+      512
+    );
+    // at zoom 1 the world is 1024 pixels wide, so half of it is visible
+    expect(viewport?.lon).toEqual([-80, 100]);
+    // a square around the equator spans the same projected distance either way
+    expect(viewport?.lat[0]).toBeCloseTo(-66.5133, 3);
+    expect(viewport?.lat[1]).toBeCloseTo(66.5133, 3);
+  });
+
+  it('should return null if the view or size is unknown', () => {
+    expect(getMapViewport(undefined, 512, 512)).toBeNull();
+    expect(
+      getMapViewport({ center: { lat: 0, lon: 0 } }, 512, 512)
+    ).toBeNull();
+    expect(
+      getMapViewport({ center: { lat: 0, lon: 0 }, zoom: 1 }, 0, 0)
+    ).toBeNull();
+  });
+});
+
 describe('getReplaceableWebGlTraceIndexes', () => {
   it('should return the indexes of any trace with gl', () => {
     expect(
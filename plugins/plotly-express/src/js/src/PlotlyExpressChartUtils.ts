@@ -83,6 +83,7 @@ export interface PlotlyChartDeephavenData {
   }>;
   is_user_set_template: boolean;
   is_user_set_color: boolean;
+  supports_viewport?: boolean;
 }
 
 export interface PlotlyChartWidgetData {
@@ -251,6 +252,134 @@ export function areSameAxisRange(
   );
 }
 
+/**
+ * The visible [min, max] range of each axis, keyed by axis name
+ */
+export type Viewport = Record<string, [number, number]>;
+
+/**
+ * Get the visible range of a numeric axis
+ * @param axis The plotly axis to get the range of
+ * @returns The [min, max] range, or null if the axis is autoranged or not numeric
+ */
+export function getAxisRange(
+  axis: Partial<LayoutAxis> | undefined
+): [number, number] | null {
+  if (
+    axis == null ||
+    axis.autorange !== false ||
+    axis.range == null ||
+    (!isLinearAxis(axis) && !isAutoAxis(axis))
+  ) {
+    return null;
+  }
+  const [start, end] = axis.range;
+  if (typeof start !== 'number' || typeof end !== 'number' || start === end) {
+    return null;
+  }
+  // reversed axes have their range reversed as well
+  return [Math.min(start, end), Math.max(start, end)];
+}
+
+/**
+ * The view of a tile map subplot, which plotly updates as the user zooms and pans
+ */
+export interface MapView {
+  center?: { lat?: number; lon?: number };
+  zoom?: number;
+}
+
+/**
+ * The width in pixels of the whole world at zoom 0 on a tile map
+ */
+const MAP_TILE_SIZE = 512;
+
+/**
+ * The latitude where Web Mercator maps are cut off
+ */
+const MAP_MAX_LATITUDE = 85.0511287798;
+
+/**
+ * Get the visible latitudes and longitudes of a tile map.
+ * Tile maps use the Web Mercator projection, so the bounds are calculated from
+ * the center, the zoom and the size of the map.
+ * @param map The map view
+ * @param width The width of the map in pixels
+ * @param height The height of the map in pixels
+ * @returns The viewport with lat and lon ranges, or null if the view is unknown
+ */
+export function getMapViewport(
+  map: MapView | undefined,
+  width: number,
+  height: number
+): Viewport | null {
+  const lat = map?.center?.lat;
+  const lon = map?.center?.lon;
+  const zoom = map?.zoom;
+  if (
+    typeof lat !== 'number' ||
+    typeof lon !== 'number' ||
+    typeof zoom !== 'number' ||
+    width <= 0 ||
+    height <= 0
+  ) {
+    return null;
+  }
+
+  const worldSize = MAP_TILE_SIZE * 2 ** zoom;
+  const lonSpan = (360 * width) / worldSize;
+
+  // the projected y of a latitude, in pixels from the equator
+  const toY = (latitude: number): number =>
+    (worldSize / (2 * Math.PI)) *
+    Math.log(Math.tan(Math.PI / 4 + (latitude * Math.PI) / 360));
+  const toLatitude = (y: number): number =>
+    (Math.atan(Math.sinh((y * 2 * Math.PI) / worldSize)) * 180) / Math.PI;
+
+  const centerY = toY(
+    Math.min(Math.max(lat, -MAP_MAX_LATITUDE), MAP_MAX_LATITUDE)
+  );
+  return {
+    lat: [toLatitude(centerY - height / 2), toLatitude(centerY + height / 2)],
+    lon: [lon - lonSpan / 2, lon + lonSpan / 2],
+  };
+}
+
+/**
+ * Get the visible ranges of the x and y axes, which the server rebins figures over.
+ * Autoranged axes are left out, so the server uses the original bins for them.
+ * Tile maps send their visible latitudes and longitudes instead.
+ * @param layout The plotly layout, which plotly updates as the user zooms and pans
+ * @param width The width of the plot area in pixels
+ * @param height The height of the plot area in pixels
+ * @returns The viewport
+ */
+export function getViewport(
+  layout: Partial<Layout>,
+  width = 0,
+  height = 0
+): Viewport {
+  const mapViewport = getMapViewport(
+    (layout as { map?: MapView }).map,
+    width,
+    height
+  );
+  if (mapViewport != null) {
+    return mapViewport;
+  }
+
+  const viewport: Viewport = {};
+  const xRange = getAxisRange(layout.xaxis);
+  if (xRange != null) {
+    viewport.x = xRange;
+  }
+  const yRange = getAxisRange(layout.yaxis);
+  if (yRange != null) {
+    viewport.y = yRange;
+  }
+  return viewport;
+}
+
 export interface DownsampleInfo {
   type: 'linear';
   /**
@@ -0,0 +1,86 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from ..BaseTest import BaseTestCase
+
+
+class FigureUpdateCoalescerTestCase(BaseTestCase):
+    def test_coalesce(self):
+        from src.deephaven.plot.express.communication.FigureUpdateCoalescer import (
+            FigureUpdateCoalescer,
+        )
+
+        batches = []
+        recreated = threading.Event()
+
+        def recreate(nodes):
+            batches.append(nodes)
+            recreated.set()
+
+        coalescer = FigureUpdateCoalescer(recreate, window=0.05)
+        first, second = MagicMock(), MagicMock()
+
+        # a burst of updates, including the same node twice, is recreated once
+        coalescer.add(first)
+        coalescer.add(second)
+        coalescer.add(first)
+
+        self.assertTrue(recreated.wait(5))
+        self.assertEqual(len(batches), 1)
+        self.assertCountEqual(batches[0], [first, second])
+
+        # a later update starts a new window
+        recreated.clear()
+        coalescer.add(second)
+        self.assertTrue(recreated.wait(5))
+        self.assertEqual(batches[1], [second])
+
+    def test_cancel(self):
+        from src.deephaven.plot.express.communication.FigureUpdateCoalescer import (
+            FigureUpdateCoalescer,
+        )
+
+        recreate = MagicMock()
+        coalescer = FigureUpdateCoalescer(recreate, window=0.05)
+
+        coalescer.add(MagicMock())
+        coalescer.cancel()
+
+        time.sleep(0.2)
+        recreate.assert_not_called()
+
+    def test_recreate_error(self):
+        from src.deephaven.plot.express.communication.FigureUpdateCoalescer import (
+            FigureUpdateCoalescer,
+        )
+
+        batches = []
+        recreated = threading.Event()
+
+        def recreate(nodes):
+            batches.append(nodes)
+            recreated.set()
+            if len(batches) == 1:
+                raise ValueError("Failed to recreate")
+
+        coalescer = FigureUpdateCoalescer(recreate, window=0.05)
+
+        # the error is logged, and later updates are still recreated
+        with self.assertLogs(
+            "src.deephaven.plot.express.communication.FigureUpdateCoalescer",
+            level="ERROR",
+        ):
+            coalescer.add(MagicMock())
+            self.assertTrue(recreated.wait(5))
+            time.sleep(0.1)
+
+        recreated.clear()
+        coalescer.add(MagicMock())
+        self.assertTrue(recreated.wait(5))
+        self.assertEqual(len(batches), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
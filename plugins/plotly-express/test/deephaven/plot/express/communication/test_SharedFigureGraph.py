@@ -0,0 +1,148 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from ..BaseTest import BaseTestCase
+
+
+class SharedFigureGraphTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col, string_col
+
+        self.source = new_table(
+            [
+                string_col("Category", ["A", "B", "A", "B"]),
+                int_col("X", [0, 1, 2, 3]),
+                int_col("Y", [0, 1, 2, 3]),
+            ]
+        )
+
+    def test_shared_graph(self):
+        import src.deephaven.plot.express as dx
+        from src.deephaven.plot.express.communication import (
+            DeephavenFigureListener,
+            SharedFigureGraph,
+        )
+
+        chart = dx.scatter(self.source, x="X", y="Y", by="Category")
+
+        first = DeephavenFigureListener(chart, MagicMock())
+        second = DeephavenFigureListener(chart, MagicMock())
+
+        self.assertIs(first._shared_graph, second._shared_graph)
+        self.assertIs(first._get_figure(), second._get_figure())
+
+        graph = first._shared_graph
+        first.close()
+        self.assertIn(id(chart), SharedFigureGraph._graphs)
+
+        second.close()
+        self.assertNotIn(id(chart), SharedFigureGraph._graphs)
+        self.assertEqual(len(graph._handles), 0)
+
+    def test_split_on_filter(self):
+        import src.deephaven.plot.express as dx
+        from src.deephaven.plot.express.communication import (
+            DeephavenFigureListener,
+        )
+
+        chart = dx.scatter(
+            self.source, x="X", y="Y", by="Category", filter_by="Category"
+        )
+
+        first = DeephavenFigureListener(chart, MagicMock())
+        second = DeephavenFigureListener(chart, MagicMock())
+        graph = second._shared_graph
+
+        message = {"type": "FILTER", "filterMap": {"Category": "A"}}
+        first.process_message(json.dumps(message).encode(), [])
+
+        self.assertIsNone(first._shared_graph)
+        self.assertIsNotNone(first._figure)
+        self.assertIs(second._shared_graph, graph)
+        self.assertIsNot(first._get_figure(), second._get_figure())
+
+        first.close()
+        second.close()
+
+    def test_filter_columns_sent_per_connection(self):
+        import src.deephaven.plot.express as dx
+        from src.deephaven.plot.express.communication import (
+            DeephavenFigureListener,
+        )
+
+        chart = dx.scatter(
+            self.source, x="X", y="Y", by="Category", filter_by="Category"
+        )
+
+        first = DeephavenFigureListener(chart, MagicMock())
+        second = DeephavenFigureListener(chart, MagicMock())
+
+        for listener in [first, second]:
+            payload, _ = listener._handle_retrieve_figure()
+            message = json.loads(payload.decode())
+            self.assertIn("filterColumns", message["figure"]["deephaven"])
+
+        first.close()
+        second.close()
+
+    def test_ticking_shared_graph(self):
+        import threading
+        import time
+        from deephaven import time_table
+        import src.deephaven.plot.express as dx
+        from src.deephaven.plot.express.communication import (
+            DeephavenFigureListener,
+        )
+
+        # a new partition appears with every tick
+        source = time_table("PT0.1S").update(
+            ["Category = `C` + ii", "X = ii", "Y = ii"]
+        )
+        chart = dx.scatter(source, x="X", y="Y", by="Category")
+
+        connections = [MagicMock(), MagicMock()]
+        listeners = [None, None]
+
+        def subscribe(i):
+            listeners[i] = DeephavenFigureListener(chart, connections[i])
+
+        # both connections acquire the graph while it is being built
+        threads = [threading.Thread(target=subscribe, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+            self.assertFalse(thread.is_alive())
+
+        first, second = listeners
+        self.assertIs(first._shared_graph, second._shared_graph)
+
+        deadline = time.time() + 10
+        while time.time() < deadline and not all(
+            connection.on_data.called for connection in connections
+        ):
+            time.sleep(0.1)
+
+        # every update is sent to both subscribers
+        for connection in connections:
+            self.assertTrue(connection.on_data.called)
+
+        first.close()
+        second.close()
+
+    def test_failed_init(self):
+        from src.deephaven.plot.express.communication import (
+            DeephavenFigureListener,
+        )
+
+        listener = DeephavenFigureListener.__new__(DeephavenFigureListener)
+
+        # a listener whose __init__ failed is collected without raising
+        listener.close()
+        listener.__del__()
+
+
+if __name__ == "__main__":
+    unittest.main()
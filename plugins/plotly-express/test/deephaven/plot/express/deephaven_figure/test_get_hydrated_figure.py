@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from ..BaseTest import BaseTestCase
 
 
@@ -31,8 +33,8 @@ class FigureCalendarTestCase(BaseTestCase):
         color_line = data["line"]["color"]
         colorway = line_fig.layout.template.layout.colorway
 
-        self.assertEqual(x, expected_x)
-        self.assertEqual(y, expected_y)
+        self.assertEqual(tuple(x), expected_x)
+        self.assertEqual(tuple(y), expected_y)
         self.assertEqual(color_marker, expected_color)
         self.assertEqual(color_line, expected_color)
         self.assertEqual(colorway, expected_colorway)
@@ -57,3 +59,32 @@ class FigureCalendarTestCase(BaseTestCase):
         value = indicator_fig.data[0]["value"]
 
         self.assertEqual(value, expected_value)
+
+    def test_get_hydrated_figure_shared_table(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col
+        import deephaven.pandas as dhpd
+        import deephaven.plot.express as dx
+
+        source = new_table(
+            [
+                int_col("X", [1, 2]),
+                int_col("Y", [3, 4]),
+                int_col("Unused", [5, 6]),
+            ]
+        )
+
+        subplots = dx.make_subplots(
+            dx.scatter(source, x="X", y="Y"), dx.line(source, x="X", y="Y"), rows=2
+        )
+
+        with patch.object(dhpd, "to_pandas", wraps=dhpd.to_pandas) as to_pandas:
+            subplots_fig = subplots.get_hydrated_figure()
+
+        # the table is snapshot once, with only the columns used by the traces
+        to_pandas.assert_called_once()
+        self.assertEqual(to_pandas.call_args.kwargs["cols"], ["X", "Y"])
+
+        for trace in subplots_fig.data:
+            self.assertEqual(tuple(trace["x"]), (1, 2))
+            self.assertEqual(tuple(trace["y"]), (3, 4))
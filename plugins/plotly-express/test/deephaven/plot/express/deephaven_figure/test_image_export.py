@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import importlib.util
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import patch
+
+from ..BaseTest import BaseTestCase
+
+
+def fake_to_image(figure: dict[str, Any], **kwargs: Any) -> bytes:
+    if figure["data"][0]["type"] == "bar":
+        raise ValueError("Failed to render")
+    return bytes(figure["data"][0]["y"].tolist())
+
+
+class ImageExportTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col
+
+        self.source = new_table(
+            [
+                int_col("X", [1, 2]),
+                int_col("Y", [3, 4]),
+                int_col("Unused", [5, 6]),
+            ]
+        )
+
+    def export(self, figures: list[Any], **kwargs: Any) -> Any:
+        """
+        Export the figures, rendering with a fake image function on threads instead of processes
+        """
+        import plotly.io as pio
+        from deephaven.plot.express import export_images
+
+        with ThreadPoolExecutor(max_workers=2) as executor, patch.object(
+            pio, "to_image", fake_to_image
+        ):
+            return export_images(figures, executor=executor, **kwargs)
+
+    def test_export_images(self) -> None:
+        import deephaven.pandas as dhpd
+        import deephaven.plot.express as dx
+
+        figures = [
+            dx.line(self.source, x="X", y="Y"),
+            dx.scatter(self.source, x="X", y="Y"),
+            dx.line(self.source, x="Y", y="X"),
+        ]
+        progress = []
+
+        with patch.object(dhpd, "to_pandas", wraps=dhpd.to_pandas) as to_pandas:
+            results = self.export(figures, max_workers=2, on_progress=progress.append)
+
+        # the shared table is converted once, with only the used columns
+        to_pandas.assert_called_once()
+        self.assertEqual(to_pandas.call_args.kwargs["cols"], ["X", "Y"])
+
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual(results[0].image, bytes([3, 4]))
+        self.assertEqual(results[1].image, bytes([3, 4]))
+        self.assertEqual(results[2].image, bytes([1, 2]))
+        for result in results:
+            self.assertIsNone(result.error)
+            self.assertIsNone(result.file)
+            self.assertGreater(result.hydrate_time, 0)
+            self.assertGreater(result.render_time, 0)
+        self.assertCountEqual(progress, results)
+
+    def test_export_images_error(self) -> None:
+        import deephaven.plot.express as dx
+
+        figures = [
+            dx.bar(self.source, x="X", y="Y"),
+            dx.line(self.source, x="X", y="Y"),
+        ]
+
+        results = self.export(figures)
+
+        # a failed figure does not stop the others
+        self.assertIsInstance(results[0].error, ValueError)
+        self.assertIsNone(results[0].image)
+        self.assertIsNone(results[1].error)
+        self.assertEqual(results[1].image, bytes([3, 4]))
+
+    def test_export_images_files_length(self) -> None:
+        import deephaven.plot.express as dx
+
+        with self.assertRaises(ValueError):
+            self.export([dx.line(self.source, x="X", y="Y")], files=[])
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("kaleido"), "kaleido is required to render images"
+    )
+    def test_export_images_process_pool(self) -> None:
+        import deephaven.plot.express as dx
+        from deephaven.plot.express.deephaven_figure.image_export import (
+            _can_spawn_processes,
+        )
+
+        # the tests run in a python interpreter, so render processes are spawned
+        self.assertTrue(_can_spawn_processes())
+
+        results = dx.export_images(
+            [dx.scatter(self.source, x="X", y="Y")], format="svg", max_workers=1
+        )
+
+        self.assertIsNone(results[0].error)
+        self.assertIn(b"<svg", results[0].image)
+
+    def test_embedded_interpreter(self) -> None:
+        import multiprocessing.spawn
+        from deephaven.plot.express.deephaven_figure.image_export import (
+            _can_spawn_processes,
+            _make_executor,
+        )
+
+        # python embedded in a JVM reports the java executable
+        with patch.object(
+            multiprocessing.spawn, "get_executable", return_value="/usr/bin/java"
+        ), patch("os.path.isfile", return_value=True):
+            self.assertFalse(_can_spawn_processes())
+            with _make_executor(1) as executor:
+                self.assertIsInstance(executor, ThreadPoolExecutor)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from ..BaseTest import BaseTestCase
+
+
+class ViewportTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col
+
+        self.source = new_table(
+            [
+                int_col("X", [0, 1, 2, 3, 4]),
+                int_col("Y", [0, 1, 2, 3, 4]),
+            ]
+        )
+
+    def test_viewport_range_args(self):
+        from src.deephaven.plot.express.deephaven_figure.DeephavenFigure import (
+            get_viewport_range_args,
+        )
+
+        viewport = {"x": [1, 3], "y": [0, 2]}
+
+        self.assertEqual(
+            get_viewport_range_args({"preprocess_heatmap"}, {}, viewport),
+            {"range_bins_x": [1.0, 3.0], "range_bins_y": [0.0, 2.0]},
+        )
+
+        self.assertEqual(
+            get_viewport_range_args({"preprocess_hist"}, {"x": "X"}, viewport),
+            {"range_bins": [1.0, 3.0]},
+        )
+
+        self.assertEqual(
+            get_viewport_range_args(
+                {"preprocess_hist"}, {"x": "X", "orientation": "h"}, viewport
+            ),
+            {"range_bins": [0.0, 2.0]},
+        )
+
+        # non-numeric or inverted ranges keep the original bins
+        self.assertEqual(
+            get_viewport_range_args(
+                {"preprocess_heatmap"}, {}, {"x": ["a", "b"], "y": [2, 0]}
+            ),
+            {},
+        )
+
+        # maps are rebinned over the visible latitudes and longitudes
+        self.assertEqual(
+            get_viewport_range_args(
+                {"scatter", "preprocess_spatial"},
+                {},
+                {"lat": [-10, 10], "lon": [20, 40]},
+            ),
+            {"spatial_range_lat": [-10.0, 10.0], "spatial_range_lon": [20.0, 40.0]},
+        )
+
+        # plots that are not binned on the server are not affected
+        self.assertEqual(get_viewport_range_args({"scatter"}, {}, viewport), {})
+
+    def test_histogram_viewport(self):
+        import src.deephaven.plot.express as dx
+
+        chart = dx.histogram(self.source, x="X", nbins=2)
+        node = chart.get_head_node().node
+
+        original_figure = chart.get_figure()
+
+        chart.update_viewport({"x": [0, 2]})
+        zoomed_figure = chart.get_figure()
+
+        self.assertIsNot(zoomed_figure, original_figure)
+        self.assertEqual(len(node.viewport_cache), 1)
+
+        chart.update_viewport(None)
+        chart.update_viewport({"x": [0, 2]})
+
+        # the recently viewed viewport is reused rather than rebuilt
+        self.assertIs(chart.get_figure(), zoomed_figure)
+        self.assertEqual(len(node.viewport_cache), 2)
+
+        # recreating the figure invalidates the cached viewports
+        chart.recreate_figure()
+        self.assertEqual(len(node.viewport_cache), 0)
+
+    def test_scatter_map_viewport(self):
+        import src.deephaven.plot.express as dx
+
+        chart = dx.scatter_map(self.source, lat="Y", lon="X", spatial_bins=10)
+        original_figure = chart.get_figure()
+
+        self.assertTrue(chart.supports_viewport)
+
+        chart.update_viewport({"lat": [0, 2], "lon": [0, 2]})
+
+        self.assertIsNot(chart.get_figure(), original_figure)
+
+    def test_scatter_viewport(self):
+        import src.deephaven.plot.express as dx
+
+        chart = dx.scatter(self.source, x="X", y="Y")
+        original_figure = chart.get_figure()
+
+        chart.update_viewport({"x": [0, 2]})
+
+        self.assertIs(chart.get_figure(), original_figure)
+
+    def test_supports_viewport_sent(self):
+        import src.deephaven.plot.express as dx
+        from src.deephaven.plot.express.communication import (
+            DeephavenFigureListener,
+        )
+
+        histogram = DeephavenFigureListener(
+            dx.histogram(self.source, x="X", nbins=2), MagicMock()
+        )
+        scatter = DeephavenFigureListener(
+            dx.scatter(self.source, x="X", y="Y"), MagicMock()
+        )
+
+        # the client only sends viewports for figures that are rebinned
+        payload, _ = histogram._handle_retrieve_figure()
+        deephaven = json.loads(payload.decode())["figure"]["deephaven"]
+        self.assertTrue(deephaven["supports_viewport"])
+
+        payload, _ = scatter._handle_retrieve_figure()
+        deephaven = json.loads(payload.decode())["figure"]["deephaven"]
+        self.assertNotIn("supports_viewport", deephaven)
+
+        histogram.close()
+        scatter.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Benchmarks are not run as part of the regular test suite. Run them with
+python -m unittest discover -p "benchmark_*.py"
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+import unittest
+from typing import Any, Callable
+
+from ..BaseTest import BaseTestCase
+
+TRACE_COUNTS = [10, 100, 1000]
+
+REPEATS = 5
+
+
+def median_seconds(func: Callable[[], Any]) -> float:
+    """
+    Measure the median time of calling a function
+
+    Args:
+        func: The function to call
+
+    Returns:
+        The median time in seconds
+    """
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+class LayerBenchmark(BaseTestCase):
+    def setUp(self) -> None:
+        import pandas as pd
+        import plotly.express as px
+
+        frame = pd.DataFrame({"X": [1, 2, 3], "Y": [4, 5, 6]})
+        # one figure per partition, like a plot by with many partitions
+        self.figs = [px.scatter(frame, x="X", y="Y") for _ in range(max(TRACE_COUNTS))]
+
+    def test_atomic_layer(self):
+        from src.deephaven.plot.express.plots._layer import atomic_layer
+
+        for count in TRACE_COUNTS:
+            figs = self.figs[:count]
+            seconds = median_seconds(lambda: atomic_layer(*figs, which_layout=0))
+            print(f"atomic_layer: {count} traces in {seconds * 1000:.2f} ms")
+
+    def test_atomic_layer_specs(self):
+        from src.deephaven.plot.express.plots._layer import atomic_layer
+
+        for count in TRACE_COUNTS:
+            figs = self.figs[:count]
+            specs = [{"x": [i / count, (i + 1) / count]} for i in range(count)]
+            seconds = median_seconds(lambda: atomic_layer(*figs, specs=specs))
+            print(f"atomic_layer with specs: {count} traces in {seconds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from ..BaseTest import BaseTestCase
+
+
+class PartitionManagerTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col, long_col, double_col, string_col
+
+        self.source = new_table(
+            [
+                string_col("Sym", ["A", "B"]),
+                int_col("X", [1, 2]),
+                int_col("Y", [3, 4]),
+                double_col("Z", [5.5, 6.5]),
+                long_col("W", [7, 8]),
+            ]
+        )
+
+    def test_melt(self):
+        from src.deephaven.plot.express.plots.PartitionManager import melt
+        import deephaven.pandas as dhpd
+
+        melted = melt(self.source, ["X", "Y"], "variable", "value")
+
+        self.assertEqual(
+            [col.name for col in melted.columns],
+            ["Sym", "Z", "W", "variable", "value"],
+        )
+        self.assertEqual(melted.columns[-1].data_type.j_name, "int")
+
+        df = dhpd.to_pandas(melted)
+        self.assertEqual(df["Sym"].tolist(), ["A", "B", "A", "B"])
+        self.assertEqual(df["variable"].tolist(), ["X", "X", "Y", "Y"])
+        self.assertEqual(df["value"].tolist(), [1, 2, 3, 4])
+
+    def test_melt_mixed_types(self):
+        from src.deephaven.plot.express.plots.PartitionManager import melt
+        import deephaven.pandas as dhpd
+
+        melted = melt(self.source, ["X", "Z"], "variable", "value")
+
+        self.assertEqual(melted.columns[-1].data_type.j_name, "double")
+
+        df = dhpd.to_pandas(melted)
+        self.assertEqual(df["value"].tolist(), [1.0, 2.0, 5.5, 6.5])
+
+    def test_melt_mixed_integral_types(self):
+        from src.deephaven.plot.express.plots.PartitionManager import melt
+        import deephaven.pandas as dhpd
+
+        melted = melt(self.source, ["X", "W"], "variable", "value")
+
+        # integral columns are not widened to double, which would lose precision
+        self.assertEqual(melted.columns[-1].data_type.j_name, "long")
+
+        df = dhpd.to_pandas(melted)
+        self.assertEqual(df["value"].tolist(), [1, 2, 7, 8])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2266,6 +2266,67 @@ class DistributionTestCase(BaseTestCase):
         self.assertEqual(deephaven["is_user_set_template"], False)
         self.assertEqual(deephaven["is_user_set_color"], False)
 
+    def test_box_precompute(self):
+        import src.deephaven.plot.express as dx
+
+        chart = dx.box(self.source, x="category", y="Y", precompute=True).to_dict(
+            self.exporter
+        )
+        plotly, deephaven = chart["plotly"], chart["deephaven"]
+
+        # the statistics are shown in the box hover, so only the axes are in the hovertext
+        self.assertEqual(
+            plotly["data"][0]["hovertemplate"],
+            "category=%{x}<br>Y=%{y}<extra></extra>",
+        )
+        self.assertEqual(plotly["data"][0]["orientation"], "v")
+        # the box only receives the statistics, so the outliers are a separate trace
+        self.assertEqual(plotly["data"][0]["boxpoints"], False)
+
+        outliers = plotly["data"][1]
+        self.assertEqual(outliers["boxpoints"], "all")
+        self.assertEqual(outliers["offsetgroup"], plotly["data"][0]["offsetgroup"])
+        self.assertEqual(
+            outliers["marker"]["color"], plotly["data"][0]["marker"]["color"]
+        )
+        self.assertEqual(outliers["showlegend"], False)
+
+        expected_mappings = [
+            {
+                "table": 0,
+                "data_columns": {
+                    "category": ["/plotly/data/0/x"],
+                    "Y": ["/plotly/data/0/y", "/plotly/data/0/median"],
+                    "q1": ["/plotly/data/0/q1"],
+                    "q3": ["/plotly/data/0/q3"],
+                    "lowerfence": ["/plotly/data/0/lowerfence"],
+                    "upperfence": ["/plotly/data/0/upperfence"],
+                    "mean": ["/plotly/data/0/mean"],
+                },
+            },
+            {
+                "table": 1,
+                "data_columns": {
+                    "category": ["/plotly/data/1/x"],
+                    "Y": ["/plotly/data/1/y"],
+                },
+            },
+        ]
+
+        self.assertEqual(deephaven["mappings"], expected_mappings)
+
+    def test_box_precompute_points(self):
+        import src.deephaven.plot.express as dx
+
+        chart = dx.box(
+            self.source, x="category", y="Y", precompute=True, points=False
+        ).to_dict(self.exporter)
+        self.assertEqual(len(chart["plotly"]["data"]), 1)
+
+        # every value would be sent
+        with self.assertRaises(ValueError):
+            dx.box(self.source, x="category", y="Y", precompute=True, points="all")
+
     def test_basic_box_x_y(self):
         import src.deephaven.plot.express as dx
 
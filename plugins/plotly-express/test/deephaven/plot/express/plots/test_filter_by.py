@@ -2165,6 +2165,31 @@ class FilterByTestCase(BaseTestCase):
             expected_is_user_set_color=False,
         )
 
+    def test_filter_cache(self):
+        import src.deephaven.plot.express as dx
+
+        chart = dx.line(self.source, x="X", y="Y", filter_by="cat_one")
+        node = chart.get_head_node().node
+        func = node.func
+        calls = []
+
+        def counting_func(**kwargs):
+            calls.append(kwargs["args"]["filters"])
+            return func(**kwargs)
+
+        node.func = counting_func
+
+        chart.update_filters({"cat_one": "A"})
+        figure_a = chart.get_figure()
+        chart.update_filters({"cat_one": "B"})
+        figure_b = chart.get_figure()
+        chart.update_filters({"cat_one": "A"})
+
+        # switching back to a recent filter reuses its figure
+        self.assertEqual(len(calls), 2)
+        self.assertIs(chart.get_figure(), figure_a)
+        self.assertIsNot(figure_a, figure_b)
+
     def test_filter_overlap(self):
         import src.deephaven.plot.express as dx
 
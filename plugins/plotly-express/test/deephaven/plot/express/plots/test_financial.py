@@ -63,6 +63,44 @@ class FinancialTestCase(BaseTestCase):
             expected_is_user_set_color=False,
         )
 
+    def test_ohlc_bar_interval(self):
+        import src.deephaven.plot.express as dx
+        from deephaven import empty_table
+
+        ticks = empty_table(6).update(
+            ["Timestamp = '2024-01-01T00:00:00 ET' + i * 20 * SECOND", "Price = i"]
+        )
+
+        chart = dx.ohlc(ticks, x="Timestamp", close="Price", bar_interval="PT1m")
+        deephaven = chart.to_dict(self.exporter)["deephaven"]
+
+        # the bars are aggregated from the ticks, so the new columns are mapped
+        expected_mappings = [
+            {
+                "data_columns": {
+                    "Close": ["/plotly/data/0/close"],
+                    "High": ["/plotly/data/0/high"],
+                    "Low": ["/plotly/data/0/low"],
+                    "Open": ["/plotly/data/0/open"],
+                    "Timestamp": ["/plotly/data/0/x"],
+                },
+                "table": 0,
+            }
+        ]
+
+        self.assertEqual(deephaven["mappings"], expected_mappings)
+
+    def test_ohlc_bar_interval_list(self):
+        import src.deephaven.plot.express as dx
+
+        with self.assertRaises(ValueError):
+            dx.ohlc(
+                self.source,
+                x="X",
+                close=["Close", "Open"],
+                bar_interval="PT1m",
+            )
+
     def test_basic_candlestick(self):
         import src.deephaven.plot.express as dx
 
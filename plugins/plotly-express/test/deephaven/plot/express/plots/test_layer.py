@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from ..BaseTest import BaseTestCase, PLOTLY_NULL_INT
 
@@ -232,6 +233,34 @@ class LayerTestCase(BaseTestCase):
 
         self.assert_calendar_equal(layered["deephaven"]["calendar"], expected_calendar)
 
+    def test_layer_cache(self):
+        import src.deephaven.plot.express as dx
+        from src.deephaven.plot.express.plots import _layer
+
+        chart = dx.scatter(self.source, x="X", y="Y")
+        chart2 = dx.scatter(self.source, x="X2", y="Y2")
+        chart3 = dx.scatter(self.source, x="X", y="Y2")
+        specs = [{"x": [0, 0.5]}, {"x": [0.5, 1]}]
+
+        layer_cache = {}
+        with patch.object(
+            _layer, "fig_data_and_layout", wraps=_layer.fig_data_and_layout
+        ) as fig_data_and_layout:
+            _layer.atomic_layer(chart, chart2, specs=specs, layer_cache=layer_cache)
+            self.assertEqual(fig_data_and_layout.call_count, 2)
+
+            # only the changed figure is resized again
+            cached = _layer.atomic_layer(
+                chart, chart3, specs=specs, layer_cache=layer_cache
+            ).to_dict(self.exporter)
+            self.assertEqual(fig_data_and_layout.call_count, 3)
+
+        uncached = _layer.atomic_layer(chart, chart3, specs=specs).to_dict(
+            self.exporter
+        )
+        self.assertEqual(cached["plotly"], uncached["plotly"])
+        self.assertEqual(cached["deephaven"], uncached["deephaven"])
+
 
 if __name__ == "__main__":
     unittest.main()
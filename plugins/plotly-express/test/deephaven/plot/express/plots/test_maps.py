@@ -233,6 +233,55 @@ class MapTestCase(BaseTestCase):
 
         self.assertEqual(plotly["layout"], expected_layout)
 
+    def test_scatter_map_spatial_bins(self):
+        import src.deephaven.plot.express as dx
+
+        chart = dx.scatter_map(
+            self.source, lat="lat", lon="lon", spatial_bins=100
+        ).to_dict(self.exporter)
+        plotly, deephaven = chart["plotly"], chart["deephaven"]
+
+        # markers are sized by the number of points in each cell
+        self.assertEqual(
+            plotly["data"][0]["hovertemplate"],
+            "lat=%{lat}<br>lon=%{lon}<br>count=%{marker.size}<extra></extra>",
+        )
+
+        expected_mappings = [
+            {
+                "table": 0,
+                "data_columns": {
+                    "lat": ["/plotly/data/0/lat"],
+                    "lon": ["/plotly/data/0/lon"],
+                    "count": ["/plotly/data/0/marker/size"],
+                },
+            }
+        ]
+
+        self.assertEqual(deephaven["mappings"], expected_mappings)
+
+    def test_density_map_spatial_bins(self):
+        import src.deephaven.plot.express as dx
+
+        chart = dx.density_map(
+            self.source, lat="lat", lon="lon", spatial_bins=100
+        ).to_dict(self.exporter)
+        deephaven = chart["deephaven"]
+
+        # cells are weighted by the number of points in them
+        expected_mappings = [
+            {
+                "table": 0,
+                "data_columns": {
+                    "lat": ["/plotly/data/0/lat"],
+                    "lon": ["/plotly/data/0/lon"],
+                    "count": ["/plotly/data/0/z"],
+                },
+            }
+        ]
+
+        self.assertEqual(deephaven["mappings"], expected_mappings)
+
 
 if __name__ == "__main__":
     unittest.main()
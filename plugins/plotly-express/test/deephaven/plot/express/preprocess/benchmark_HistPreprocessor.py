@@ -0,0 +1,87 @@
+"""
+Benchmarks are not run as part of the regular test suite. Run them with
+python -m unittest discover -p "benchmark_*.py"
+"""
+
+import statistics
+import threading
+import time
+import unittest
+
+from ..BaseTest import BaseTestCase
+
+ROWS_PER_TICK = 10_000
+TICKS = 20
+NBINS = 100
+
+HISTNORM_MODES = [
+    {},
+    {"histnorm": "percent"},
+    {"histnorm": "probability"},
+    {"histnorm": "density"},
+    {"histnorm": "probability density"},
+    {"histnorm": "percent", "cumulative": True},
+    {"barnorm": "fraction"},
+    {"histnorm": "probability", "cumulative": True, "barnorm": "percent"},
+]
+
+
+class HistPreprocessorBenchmark(BaseTestCase):
+    def measure_update_latency(self, hist_args: dict) -> list[float]:
+        """
+        Measure the time between rows being added to the source and the
+        histogram table updating
+
+        Args:
+            hist_args: The histnorm, cumulative and barnorm args to use
+
+        Returns:
+            The latency of each tick in seconds
+        """
+        from deephaven import empty_table, dtypes
+        from deephaven.table_factory import input_table
+        from deephaven.table_listener import listen
+        from src.deephaven.plot.express.preprocess.HistPreprocessor import (
+            HistPreprocessor,
+        )
+
+        source = input_table({"X": dtypes.double, "Z": dtypes.double})
+        source.add(empty_table(ROWS_PER_TICK).update(["X = random()", "Z = i % 2"]))
+
+        args = {"x": "X", "table": source.partition_by("Z"), "nbins": NBINS}
+        args.update(hist_args)
+        preprocessor = HistPreprocessor(args, None)
+        hist_tables = [
+            table
+            for table, _ in preprocessor.preprocess_partitioned_tables(
+                list(args["table"].constituent_tables)
+            )
+        ]
+
+        updated = threading.Event()
+        handle = listen(hist_tables[0], lambda update, is_replay: updated.set())
+
+        latencies = []
+        batch = empty_table(ROWS_PER_TICK).update(["X = random()", "Z = i % 2"])
+        for _ in range(TICKS):
+            updated.clear()
+            start = time.perf_counter()
+            source.add(batch)
+            updated.wait(10)
+            latencies.append(time.perf_counter() - start)
+
+        handle.stop()
+        return latencies
+
+    def test_update_latency_per_histnorm(self):
+        for hist_args in HISTNORM_MODES:
+            latencies = self.measure_update_latency(hist_args)
+            print(
+                f"{hist_args or 'no normalization'}: "
+                f"median {statistics.median(latencies) * 1000:.2f} ms, "
+                f"max {max(latencies) * 1000:.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import unittest
+
+from ..BaseTest import BaseTestCase
+
+
+class BoxPreprocessorTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col
+
+        self.source = new_table(
+            [
+                int_col("X", [1, 2, 3, 4, 100, 2, 4, 6, 8, 10]),
+                int_col("Z", [1, 1, 1, 1, 1, 2, 2, 2, 2, 2]),
+            ]
+        )
+
+    def preprocess(self, args):
+        """
+        Preprocess the source table with the box preprocessor
+
+        Args:
+            args: The arguments to pass to the preprocessor
+
+        Returns:
+            The preprocessed dataframe and the update to the args
+        """
+        from src.deephaven.plot.express.preprocess.BoxPreprocessor import (
+            BoxPreprocessor,
+        )
+        import deephaven.pandas as dhpd
+
+        box_preprocessor = BoxPreprocessor(args.copy())
+
+        new_table, update = next(
+            box_preprocessor.preprocess_partitioned_tables([args["table"]])
+        )
+
+        return dhpd.to_pandas(new_table), update
+
+    def test_box_stats(self):
+        args = {
+            "y": "X",
+            "table": self.source.where("Z = 1"),
+        }
+
+        df, update = self.preprocess(args)
+
+        self.assertEqual(df["q1"].tolist(), [2])
+        self.assertEqual(df["X"].tolist(), [3])
+        self.assertEqual(df["q3"].tolist(), [4])
+        # 100 is outside of 1.5 IQR, so the upper whisker ends at 4
+        self.assertEqual(df["mean"].tolist(), [22.0])
+        self.assertEqual(df["lowerfence"].tolist(), [1])
+        self.assertEqual(df["upperfence"].tolist(), [4])
+
+        self.assertEqual(
+            update,
+            {
+                "y": "X",
+                "box_q1": "q1",
+                "box_median": "X",
+                "box_q3": "q3",
+                "box_lowerfence": "lowerfence",
+                "box_upperfence": "upperfence",
+                "box_mean": "mean",
+            },
+        )
+
+    def test_box_stats_by_position(self):
+        args = {
+            "x": "X",
+            "y": "Z",
+            "orientation": "h",
+            "table": self.source,
+        }
+
+        df, _ = self.preprocess(args)
+        df = df.sort_values("Z")
+
+        # one row per box
+        self.assertEqual(df["Z"].tolist(), [1, 2])
+        self.assertEqual(df["X"].tolist(), [3, 6])
+        self.assertEqual(df["upperfence"].tolist(), [4, 10])
+
+    def test_box_notched(self):
+        args = {
+            "y": "X",
+            "table": self.source.where("Z = 2"),
+            "notched": True,
+        }
+
+        df, update = self.preprocess(args)
+
+        self.assertEqual(update["box_notchspan"], "notchspan")
+        # 1.57 * IQR / sqrt(count)
+        self.assertAlmostEqual(df["notchspan"][0], 1.57 * 4 / 5**0.5)
+
+    def test_box_outliers(self):
+        import deephaven.pandas as dhpd
+
+        args = {
+            "x": "Z",
+            "y": "X",
+            "table": self.source,
+            "points": "outliers",
+        }
+
+        df, update = self.preprocess(args)
+
+        # only 100 is outside of the whiskers
+        outliers = dhpd.to_pandas(update["outliers_table"])
+        self.assertEqual(outliers["Z"].tolist(), [1])
+        self.assertEqual(outliers["X"].tolist(), [100])
+
+    def test_box_no_points(self):
+        args = {
+            "y": "X",
+            "table": self.source,
+            "points": False,
+        }
+
+        df, update = self.preprocess(args)
+
+        self.assertNotIn("outliers_table", update)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+import pandas as pd
+
+from ..BaseTest import BaseTestCase, remap_types
+
+
+class ECDFPreprocessorTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col
+
+        self.source = new_table(
+            [
+                int_col("X", [1, 2, 3, 4]),
+                int_col("W", [1, 1, 1, 5]),
+            ]
+        )
+
+    def tables_equal(self, args, expected_df) -> None:
+        """
+        Compare the expected dataframe to the actual dataframe generated by the preprocessor
+
+        Args:
+            args: The arguments to pass to the preprocessor
+            expected_df: The expected dataframe
+        """
+        from src.deephaven.plot.express.preprocess.ECDFPreprocessor import (
+            ECDFPreprocessor,
+        )
+        import deephaven.pandas as dhpd
+
+        ecdf_preprocessor = ECDFPreprocessor(args.copy(), None)
+
+        new_table, _ = next(
+            ecdf_preprocessor.preprocess_partitioned_tables([self.source])
+        )
+
+        new_df = dhpd.to_pandas(new_table)
+
+        self.assertTrue(expected_df.equals(new_df))
+
+    def test_standard_ecdf(self):
+        args = {"x": "X", "table": self.source, "npoints": 2}
+
+        expected_df = pd.DataFrame({"X": [2.5, 4.0], "probability": [0.5, 1.0]})
+        remap_types(expected_df)
+
+        self.tables_equal(args, expected_df)
+
+    def test_complementary_ecdf(self):
+        args = {
+            "x": "X",
+            "table": self.source,
+            "npoints": 2,
+            "ecdfmode": "complementary",
+            "ecdfnorm": "percent",
+        }
+
+        expected_df = pd.DataFrame({"X": [2.5, 4.0], "percent": [50.0, 0.0]})
+        remap_types(expected_df)
+
+        self.tables_equal(args, expected_df)
+
+    def test_reversed_ecdf(self):
+        args = {
+            "x": "X",
+            "table": self.source,
+            "npoints": 2,
+            "ecdfmode": "reversed",
+            "ecdfnorm": None,
+        }
+
+        expected_df = pd.DataFrame({"X": [1.0, 2.5], "count": [4, 2]})
+        remap_types(expected_df)
+
+        self.tables_equal(args, expected_df)
+
+    def test_weighted_ecdf(self):
+        args = {"x": "X", "y": "W", "table": self.source, "npoints": 2}
+
+        # the last value has most of the weight
+        expected_df = pd.DataFrame({"X": [2.5, 4.0], "probability": [0.25, 1.0]})
+        remap_types(expected_df)
+
+        self.tables_equal(args, expected_df)
+
+    def test_invalid_ecdfmode(self):
+        from src.deephaven.plot.express.preprocess.ECDFPreprocessor import (
+            ECDFPreprocessor,
+        )
+
+        with self.assertRaises(ValueError):
+            ECDFPreprocessor(
+                {"x": "X", "table": self.source, "ecdfmode": "backwards"}, None
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
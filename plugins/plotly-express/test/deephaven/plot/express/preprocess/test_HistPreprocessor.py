@@ -77,6 +77,49 @@ class HistPreprocessorTestCase(BaseTestCase):
 
         self.tables_equal(args, expected_df, t=self.partitioned.constituent_tables[1])
 
+    def test_percent_hist(self):
+        args = {
+            "x": "X",
+            "table": self.source,
+            "nbins": 2,
+            "histnorm": "percent",
+        }
+
+        expected_df = pd.DataFrame({"X": [1.0, 3.0], "tmpbar0": [50.0, 50.0]})
+        remap_types(expected_df)
+
+        self.tables_equal(args, expected_df)
+
+    def test_cumulative_probability_density_hist(self):
+        args = {
+            "x": "X",
+            "table": self.source,
+            "nbins": 2,
+            "histnorm": "probability density",
+            "cumulative": True,
+        }
+
+        # cumulative drops the density part of the normalization
+        expected_df = pd.DataFrame({"X": [1.0, 3.0], "tmpbar0": [0.5, 1.0]})
+        remap_types(expected_df)
+
+        self.tables_equal(args, expected_df)
+
+    def test_density_barnorm_hist(self):
+        args = {
+            "x": "X",
+            "table": self.source,
+            "nbins": 2,
+            "histnorm": "density",
+            "barnorm": "percent",
+        }
+
+        # with a single column, every bin is the whole bar
+        expected_df = pd.DataFrame({"X": [1.0, 3.0], "tmpbar0": [100.0, 100.0]})
+        remap_types(expected_df)
+
+        self.tables_equal(args, expected_df)
+
 
 if __name__ == "__main__":
     unittest.main()
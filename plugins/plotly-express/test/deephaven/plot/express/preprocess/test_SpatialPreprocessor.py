@@ -0,0 +1,144 @@
+import unittest
+
+import pandas as pd
+
+from ..BaseTest import BaseTestCase, remap_types
+
+
+class SpatialPreprocessorTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col, string_col
+
+        self.source = new_table(
+            [
+                int_col("lat", [1, 2, 2, 3, 3, 3, 4, 4, 5]),
+                int_col("lon", [1, 2, 2, 3, 3, 3, 4, 4, 5]),
+                int_col("z", [1, 2, 2, 3, 3, 3, 4, 4, 5]),
+                string_col("name", ["a", "b", "c", "d", "e", "f", "g", "h", "i"]),
+            ]
+        )
+
+    def tables_equal(self, args, expected_df) -> None:
+        """
+        Compare the expected dataframe to the actual dataframe generated by the preprocessor
+
+        Args:
+            args: The arguments to pass to the preprocessor
+            expected_df: The expected dataframe
+        """
+        from src.deephaven.plot.express.preprocess.SpatialPreprocessor import (
+            SpatialPreprocessor,
+        )
+        import deephaven.pandas as dhpd
+
+        spatial_preprocessor = SpatialPreprocessor(args.copy())
+
+        new_table, _ = next(
+            spatial_preprocessor.preprocess_partitioned_tables([self.source])
+        )
+
+        new_df = dhpd.to_pandas(new_table)
+
+        self.assertTrue(expected_df.equals(new_df))
+
+    def test_calculate_spatial_level(self):
+        from src.deephaven.plot.express.preprocess.SpatialPreprocessor import (
+            calculate_spatial_level,
+        )
+
+        self.assertEqual(calculate_spatial_level(360, 1), 0)
+        self.assertEqual(calculate_spatial_level(360, 100), 7)
+        # zooming in by one level refines the grid by one level
+        self.assertEqual(calculate_spatial_level(180, 100), 8)
+        self.assertEqual(calculate_spatial_level(1e-12, 100), 30)
+
+    def test_density_spatial(self):
+        # cells are 360 / 2 ** 8 = 1.40625 degrees across
+        args = {
+            "lat": "lat",
+            "lon": "lon",
+            "z": "z",
+            "hover_name": "name",
+            "table": self.source,
+            "spatial_bins": 4,
+            "spatial_range_lon": [0.0, 8.0],
+        }
+
+        expected_df = pd.DataFrame(
+            {
+                "lat": [1.0, 2.0, 3.4, 5.0],
+                "lon": [1.0, 2.0, 3.4, 5.0],
+                "count": [1, 2, 5, 1],
+                "z": [1, 4, 17, 5],
+                "name": ["a", "b", "d", "i"],
+            }
+        )
+        remap_types(expected_df)
+
+        self.tables_equal(args, expected_df)
+
+    def test_scatter_spatial(self):
+        from src.deephaven.plot.express.preprocess.SpatialPreprocessor import (
+            SpatialPreprocessor,
+        )
+
+        args = {
+            "lat": "lat",
+            "lon": "lon",
+            "size": None,
+            "table": self.source,
+            "spatial_bins": 4,
+            "spatial_range_lat": [0.0, 2.0],
+            "spatial_range_lon": [0.0, 8.0],
+        }
+
+        # points more than a cell outside the visible latitudes are removed,
+        # and columns the figure doesn't map are dropped
+        expected_df = pd.DataFrame(
+            {
+                "lat": [1.0, 2.0, 3.0],
+                "lon": [1.0, 2.0, 3.0],
+                "count": [1, 2, 3],
+            }
+        )
+        remap_types(expected_df)
+
+        self.tables_equal(args, expected_df)
+
+        _, update = next(
+            SpatialPreprocessor(args.copy()).preprocess_partitioned_tables(
+                [self.source]
+            )
+        )
+        self.assertEqual(update, {"size": "count"})
+
+    def test_mapped_columns(self):
+        from src.deephaven.plot.express.preprocess.SpatialPreprocessor import (
+            SpatialPreprocessor,
+        )
+
+        args = {
+            "lat": "lat",
+            "lon": "lon",
+            "text": "name",
+            "custom_data": ["z"],
+            "table": self.source,
+            "spatial_bins": 4,
+        }
+
+        self.assertEqual(
+            SpatialPreprocessor(args).get_mapped_columns(self.source), ["z", "name"]
+        )
+
+    def test_missing_lat(self):
+        from src.deephaven.plot.express.preprocess.SpatialPreprocessor import (
+            SpatialPreprocessor,
+        )
+
+        with self.assertRaises(ValueError):
+            SpatialPreprocessor({"lon": "lon", "table": self.source, "spatial_bins": 4})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+
+from ..BaseTest import BaseTestCase
+
+
+class RangeTableProviderTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import new_table
+        from deephaven.column import int_col
+
+        self.source = new_table(
+            [
+                int_col("X", [0, 4, 0, 4]),
+                int_col("Y", [1, 5, 1, 8]),
+            ]
+        )
+
+    def test_min_max_table(self):
+        from src.deephaven.plot.express.preprocess.utilities import (
+            create_min_max_table,
+        )
+        import deephaven.pandas as dhpd
+
+        min_max = create_min_max_table(self.source, ["X", "Y"], "RangeMin", "RangeMax")
+
+        df = dhpd.to_pandas(min_max)
+
+        self.assertEqual(df["RangeMin"].tolist(), [0])
+        self.assertEqual(df["RangeMax"].tolist(), [8])
+
+    def test_shared_range_table(self):
+        from src.deephaven.plot.express.preprocess.utilities import (
+            RangeTableProvider,
+        )
+
+        provider = RangeTableProvider()
+
+        first = provider.get_min_max_table(self.source, ["X"], "RangeMin", "RangeMax")
+        second = provider.get_min_max_table(self.source, ["X"], "RangeMin", "RangeMax")
+        other = provider.get_min_max_table(self.source, ["Y"], "RangeMin", "RangeMax")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_shared_between_wrappers(self):
+        from deephaven.table import Table
+        from src.deephaven.plot.express.preprocess.utilities import (
+            RangeTableProvider,
+        )
+
+        provider = RangeTableProvider()
+
+        # recreating a figure wraps the same java table again
+        wrapper = Table(j_table=self.source.j_table)
+
+        first = provider.get_min_max_table(self.source, ["X"], "RangeMin", "RangeMax")
+        second = provider.get_min_max_table(wrapper, ["X"], "RangeMin", "RangeMax")
+
+        self.assertIs(first, second)
+
+        provider.release()
+        self.assertEqual(len(provider._range_tables), 0)
+
+    def test_active_provider(self):
+        from src.deephaven.plot.express.preprocess.utilities import (
+            RangeTableProvider,
+            create_range_table,
+            get_range_table_provider,
+        )
+
+        provider = RangeTableProvider()
+
+        self.assertIsNone(get_range_table_provider())
+        with provider:
+            self.assertIs(get_range_table_provider(), provider)
+            create_range_table(self.source, ["X"], None, 10, "Range")
+        self.assertIsNone(get_range_table_provider())
+
+        self.assertEqual(len(provider._range_tables), 1)
+
+
+class BarTableTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven import empty_table
+
+        # a tick every 20 seconds, so three ticks per minute
+        self.ticks = empty_table(7).update(
+            [
+                "Timestamp = '2024-01-01T00:00:00 ET' + i * 20 * SECOND",
+                "Price = i % 3 == 1 ? 10 * i : i",
+            ]
+        )
+
+    def test_bar_table(self):
+        from src.deephaven.plot.express.preprocess.utilities import create_bar_table
+        import deephaven.pandas as dhpd
+
+        bars, columns = create_bar_table(
+            self.ticks, "Timestamp", "Price", "Price", "Price", "Price", "PT1m"
+        )
+
+        self.assertEqual(
+            columns, {"open": "Open", "high": "High", "low": "Low", "close": "Close"}
+        )
+
+        df = dhpd.to_pandas(bars)
+
+        self.assertEqual(df["Open"].tolist(), [0, 3, 6])
+        self.assertEqual(df["High"].tolist(), [10, 40, 6])
+        self.assertEqual(df["Low"].tolist(), [0, 3, 6])
+        self.assertEqual(df["Close"].tolist(), [2, 5, 6])
+
+    def test_bar_table_count(self):
+        from datetime import timedelta
+        from src.deephaven.plot.express.preprocess.utilities import create_bar_table
+        import deephaven.pandas as dhpd
+
+        bars, _ = create_bar_table(
+            self.ticks,
+            "Timestamp",
+            "Price",
+            "Price",
+            "Price",
+            "Price",
+            timedelta(minutes=1),
+            bar_count=2,
+        )
+
+        df = dhpd.to_pandas(bars)
+
+        # only the latest bars are kept
+        self.assertEqual(df["Open"].tolist(), [3, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
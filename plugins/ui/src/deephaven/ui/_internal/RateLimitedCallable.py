@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from .RenderContext import OnChangeCallable
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitedCallable:
+    """
+    Wraps a callable so calls within a time window are coalesced, and only the latest arguments are applied.
+    Coalesced calls are queued on the render thread when the window ends.
+    """
+
+    func: Callable[..., Any]
+    """
+    The callable to call. Can be replaced, so the latest callable is called at the end of a window.
+    """
+
+    wait: float
+    """
+    Length of the window in seconds.
+    """
+
+    _queue_render: OnChangeCallable
+    """
+    Queues the coalesced call on the render thread.
+    """
+
+    _leading: bool
+    """
+    Whether the first call of a window is called immediately (throttle), or only the last call is called
+    when no calls have been made for the whole window (debounce).
+    """
+
+    _pending_args: Optional[tuple[Any, ...]]
+    """
+    Arguments of the latest call that has not been applied yet, or None if there is no pending call.
+    """
+
+    _timer: Optional[threading.Timer]
+    """
+    Timer for the end of the current window, or None if there is no window open.
+    """
+
+    _lock: threading.Lock
+    """
+    Lock guarding the pending call and the timer.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        wait_ms: float,
+        queue_render: OnChangeCallable,
+        leading: bool,
+    ):
+        """
+        Create a new RateLimitedCallable.
+
+        Args:
+            func: The callable to call.
+            wait_ms: Length of the window in milliseconds.
+            queue_render: Queues the coalesced call on the render thread.
+            leading: True to call the first call of a window immediately (throttle),
+                False to only call the last call after no calls for the whole window (debounce).
+        """
+        self.func = func
+        self.wait = wait_ms / 1000
+        self._queue_render = queue_render
+        self._leading = leading
+        self._pending_args = None
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def __call__(self, *args: Any) -> Any:
+        """
+        Call the callable, or coalesce the call if a window is open.
+
+        Args:
+            args: The arguments to call the callable with.
+
+        Returns:
+            The result of the callable if it was called immediately, None if the call was coalesced.
+        """
+        with self._lock:
+            if self._leading and self._timer is None:
+                self._start_timer()
+                call_now = True
+            else:
+                self._pending_args = args
+                if not self._leading:
+                    # Each call restarts the window of a debounced callable
+                    self._cancel_timer()
+                    self._start_timer()
+                call_now = False
+
+        if call_now:
+            return self.func(*args)
+        return None
+
+    def cancel(self) -> None:
+        """
+        Cancel the pending call, if any.
+        """
+        with self._lock:
+            self._cancel_timer()
+            self._pending_args = None
+
+    def _start_timer(self) -> None:
+        """
+        Start the timer for a new window. Must be called with the lock held.
+        """
+        timer = threading.Timer(self.wait, self._on_window_end)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _cancel_timer(self) -> None:
+        """
+        Cancel the timer of the current window, if any. Must be called with the lock held.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_window_end(self) -> None:
+        """
+        Called when a window ends. Queues the pending call on the render thread, if any.
+        """
+        with self._lock:
+            if self._timer is not threading.current_thread():
+                # The window was cancelled or restarted after the timer fired
+                return
+            args = self._pending_args
+            self._pending_args = None
+            self._timer = None
+            if args is None:
+                return
+            if self._leading:
+                # The coalesced call starts a new window, so calls right after it are still throttled
+                self._start_timer()
+
+        func = self.func
+        logger.debug("Calling coalesced call of %s", func)
+        self._queue_render(lambda: func(*args))
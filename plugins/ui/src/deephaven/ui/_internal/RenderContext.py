@@ -17,8 +17,8 @@ from typing import (
 )
 from functools import partial
 from deephaven import DHError
-from deephaven.liveness_scope import LivenessScope
-from contextlib import contextmanager
+from deephaven.liveness_scope import LivenessScope, is_liveness_referent
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from .NoContextException import NoContextException
 from .RootRenderContextProtocol import RootRenderContextProtocol, StateUpdateCallable
@@ -71,6 +71,8 @@ A function that performs an effect.
 class ValueWithLiveness(Generic[T]):
     """A value with an associated liveness scope, if any."""
 
+    __slots__ = ("value", "liveness_scope")
+
     value: T
     liveness_scope: Union[LivenessScope, None]
 
@@ -120,6 +122,21 @@ def _should_retain_value(value: ValueWithLiveness[Any]) -> bool:
     return value.liveness_scope is None and isinstance(value.value, (str, int, float))
 
 
+def _exported_value(value: ValueWithLiveness[Any]) -> Tuple[type, Any] | None:
+    """
+    Get the value as it would be exported, for checking if the exported state changed.
+
+    Args:
+        value: The value to get the exported value of.
+
+    Returns:
+        The type and value if the value is retained, None otherwise.
+    """
+    if _should_retain_value(value):
+        return type(value.value), value.value
+    return None
+
+
 _local_data = threading.local()
 
 
@@ -186,6 +203,27 @@ class RenderContext:
     Used by hooks to get and set state.
     """
 
+    # A context is kept for every rendered component, so use slots to keep them small
+    __slots__ = (
+        "_hook_index",
+        "_hook_count",
+        "_state",
+        "_children_context",
+        "_root",
+        "_parent",
+        "_top_level_scope",
+        "_collected_scopes",
+        "_collected_effects",
+        "_collected_unmount_listeners",
+        "_collected_contexts",
+        "_open_context_cleanups",
+        "_is_mounted",
+        "_is_dirty",
+        "_cache",
+        "_is_state_dirty",
+        "_exported_state",
+    )
+
     _hook_index: int
     """
     The index of the current hook for this render. Should only be set while rendering.
@@ -211,9 +249,15 @@ class RenderContext:
     The root render context protocol that provides access to shared context callbacks and variables. Passed down to all child contexts.
     """
 
+    _parent: RenderContext | None
+    """
+    The parent of this context, or None if this is the root context.
+    """
+
     _top_level_scope: LivenessScope | None
     """
-    Liveness scope that captures objects directly created in the FunctionElement. Will only be non-None when the context manager is open.
+    Liveness scope that captures objects directly created in the FunctionElement. Will only be non-None when the context manager is open,
+    and is only created when needed: when the context is opened to capture liveness, or when a liveness referent is first managed.
     """
 
     _collected_scopes: set[LivenessScope]
@@ -263,12 +307,26 @@ class RenderContext:
     A value that can be used to store arbitrary data for this context.
     """
 
-    def __init__(self, root: RootRenderContextProtocol):
+    _is_state_dirty: bool
+    """
+    Flag to indicate if the exported state of this context or any of its children has changed since the last export.
+    If a context is marked, all of its ancestors are marked as well.
+    """
+
+    _exported_state: ExportedRenderState
+    """
+    The state exported on the last call to export_state. Reused while the state is not dirty.
+    """
+
+    def __init__(
+        self, root: RootRenderContextProtocol, parent: RenderContext | None = None
+    ):
         """
         Create a new render context.
 
         Args:
             root: The root protocol that provides access to shared context callbacks and variables.
+            parent: The parent context, or None if this is the root context.
         """
 
         self._hook_index = _READY_TO_OPEN
@@ -276,6 +334,7 @@ class RenderContext:
         self._state = {}
         self._children_context = {}
         self._root = root
+        self._parent = parent
         self._collected_scopes = set()
         self._collected_effects = []
         self._collected_unmount_listeners = []
@@ -285,6 +344,8 @@ class RenderContext:
         self._is_mounted = True
         self._is_dirty = True
         self._cache = None
+        self._is_state_dirty = False
+        self._exported_state = {}
 
     def __del__(self):
         logger.debug("Deleting context")
@@ -294,7 +355,9 @@ class RenderContext:
             self.unmount()
 
     @contextmanager
-    def open(self) -> Generator[RenderContext, None, None]:
+    def open(
+        self, capture_liveness: bool = True
+    ) -> Generator[RenderContext, None, None]:
         """
         Opens this context to track hook creation, sets this context as active on
         this thread, and opens the liveness scope for user-created objects.
@@ -302,6 +365,11 @@ class RenderContext:
         This is not reentrant and not safe across threads, ensure it is only opened
         once at a time. After it has been closed, it is safe to be opened again.
 
+        Args:
+            capture_liveness: Whether to open a liveness scope to capture objects created while the context is open.
+                Creating a scope is a round trip to Java, so contexts that do not run user code can skip it.
+                A scope is still created if a liveness referent is managed by the context.
+
         Returns:
             A context manager to manage RenderContext resources.
         """
@@ -323,8 +391,9 @@ class RenderContext:
 
         # Keep a reference to old liveness scopes, and make a collection to track our new ones
         old_liveness_scopes = self._collected_scopes
-        self._top_level_scope = LivenessScope()
-        self._collected_scopes = {self._top_level_scope}
+        self._collected_scopes = set()
+        if capture_liveness:
+            self._get_top_level_scope()
 
         # Reset the after render listeners. No need to retain the old ones.
         self._collected_effects = []
@@ -338,7 +407,11 @@ class RenderContext:
         self._collected_contexts = []
 
         try:
-            with self._top_level_scope.open():
+            with (
+                self._top_level_scope.open()
+                if self._top_level_scope is not None
+                else nullcontext()
+            ):
                 yield self
 
                 # Run open context cleanups in reverse order (e.g. pop context values)
@@ -411,6 +484,19 @@ class RenderContext:
                 )
             )
 
+    def _get_top_level_scope(self) -> LivenessScope:
+        """
+        Get the liveness scope for objects retained directly by this context, creating it if needed.
+        The context must be open.
+
+        Returns:
+            The top level liveness scope.
+        """
+        if self._top_level_scope is None:
+            self._top_level_scope = LivenessScope()
+            self._collected_scopes.add(self._top_level_scope)
+        return self._top_level_scope
+
     def _assert_active(self) -> None:
         """
         Verify that this context is active on this thread.
@@ -445,6 +531,16 @@ class RenderContext:
         """
         self._root.set_url(url)
 
+    @property
+    def root(self) -> RootRenderContextProtocol:
+        """
+        Get the root protocol of this context, shared by every context in the tree.
+
+        Returns:
+            The root protocol of this context.
+        """
+        return self._root
+
     @property
     def is_dirty(self) -> bool:
         """
@@ -472,6 +568,26 @@ class RenderContext:
         """
         self._is_dirty = False
 
+    @property
+    def is_state_dirty(self) -> bool:
+        """
+        Get whether the exported state of this context or any of its children has changed since the last export.
+
+        Returns:
+            True if the state needs to be exported again, False otherwise.
+        """
+        return self._is_state_dirty
+
+    def _mark_state_dirty(self) -> None:
+        """
+        Mark the exported state of this context and all of its ancestors as changed.
+        """
+        context: RenderContext | None = self
+        # Ancestors of a dirty context are always dirty, so we can stop at the first one
+        while context is not None and not context._is_state_dirty:
+            context._is_state_dirty = True
+            context = context._parent
+
     def has_state(self, key: StateKey) -> bool:
         """
         Check if the given key is in the state.
@@ -489,13 +605,9 @@ class RenderContext:
         # and will be released when no longer used.
         if wrapper.liveness_scope:
             self.manage(wrapper.liveness_scope)
-        else:
+        elif is_liveness_referent(wrapper.value):
             try:
-                if self._top_level_scope is None:
-                    raise RuntimeError(
-                        "RenderContext.get_state() called when RenderContext not opened"
-                    )
-                self._top_level_scope.manage(wrapper.value)
+                self._get_top_level_scope().manage(wrapper.value)
             except DHError:
                 # Ignore, we just won't manage this instance
                 pass
@@ -511,6 +623,8 @@ class RenderContext:
 
         # Just set the key value, we don't need to trigger an on_change or anything special on initialization
         self._state[key] = _value_or_call(value)
+        if _should_retain_value(self._state[key]):
+            self._mark_state_dirty()
 
     def set_state(self, key: StateKey, value: T | UpdaterFunction[T]) -> None:
         """
@@ -531,7 +645,11 @@ class RenderContext:
             else:
                 new_value = _value_or_call(value)
             logger.debug("Setting state %s to %s in %s", key, new_value, self)
+            old_value = self._state[key]
             self._state[key] = new_value
+            # Only values that are exported change the exported state
+            if _exported_value(old_value) != _exported_value(new_value):
+                self._mark_state_dirty()
 
         # This is not the initial state, queue up the state change on the render loop
         self._root.on_change(update_state)
@@ -559,7 +677,7 @@ class RenderContext:
         if fetch_only:
             return self._children_context[key]
         if key not in self._children_context:
-            child_context = RenderContext(self._root)
+            child_context = RenderContext(self._root, self)
             logger.debug(
                 "Created new child context %s for key %s in %s",
                 child_context,
@@ -574,7 +692,10 @@ class RenderContext:
         """
         Unmount and delete the child context for the given key.
         """
-        self._children_context[key].unmount()
+        child_context = self._children_context[key]
+        if child_context._is_state_dirty or len(child_context._exported_state) > 0:
+            self._mark_state_dirty()
+        child_context.unmount()
         del self._children_context[key]
 
     def next_hook_index(self) -> int:
@@ -641,10 +762,15 @@ class RenderContext:
     def export_state(self) -> ExportedRenderState:
         """
         Export the state of this context. This is used to serialize the state for the client.
+        Only contexts that changed since the last export are walked, the last exported state is reused for the rest.
+        The returned state is shared with later exports and must not be modified.
 
         Returns:
             The exported serializable state of this context.
         """
+        if not self._is_state_dirty:
+            return self._exported_state
+
         exported_state: ExportedRenderState = {}
 
         # We need to iterate through all of our state and export anything that doesn't have a LivenessScope right now (anything serializable)
@@ -665,6 +791,8 @@ class RenderContext:
         if len(children_state := dict(retained_children(self._children_context))) > 0:
             exported_state["children"] = children_state
 
+        self._exported_state = exported_state
+        self._is_state_dirty = False
         return exported_state
 
     def import_state(self, state: dict[str, Any]) -> None:
@@ -677,6 +805,7 @@ class RenderContext:
         self._state.clear()
         self._children_context.clear()
         self.mark_dirty()
+        self._mark_state_dirty()
 
         if "state" in state:
             for key, value in state["state"].items():
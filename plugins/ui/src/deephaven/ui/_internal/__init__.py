@@ -31,6 +31,7 @@ from .utils import (
     shallow_equal,
     wrap_callable,
 )
+from .coroutines import run_coroutine
 from .RootRenderContextProtocol import (
     RootRenderContextProtocol,
     StateUpdateCallable,
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import types
+from contextlib import ExitStack
+from typing import Any, Coroutine, Generator, Optional
+
+from deephaven.execution_context import ExecutionContext, get_exec_ctx
+from deephaven.liveness_scope import LivenessScope
+
+from .EventContext import EventContext, get_event_context
+from .NoContextException import NoContextException
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+"""
+The event loop coroutines are run on. Shared by every component on the server, and started when first needed.
+"""
+
+_loop_lock = threading.Lock()
+"""
+Lock guarding the creation of the event loop.
+"""
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop coroutines are run on, starting it if needed.
+
+    Returns:
+        The running event loop.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="deephaven.ui.coroutines", daemon=True
+            ).start()
+            _loop = loop
+        return _loop
+
+
+@types.coroutine
+def _run_in_contexts(
+    coroutine: Coroutine[Any, Any, Any],
+    exec_ctx: ExecutionContext,
+    event_context: EventContext | None,
+    liveness_scope: LivenessScope,
+) -> Generator[Any, Any, Any]:
+    """
+    Run each step of a coroutine with the contexts entered. The contexts are thread local, and other coroutines run
+    on the same thread between steps, so they can't be entered once around the whole coroutine.
+
+    Args:
+        coroutine: The coroutine to run.
+        exec_ctx: The execution context to run each step in.
+        event_context: The event context to run each step in, if any.
+        liveness_scope: The liveness scope to open for each step.
+
+    Returns:
+        The result of the coroutine.
+    """
+    send_value: Any = None
+    error: BaseException | None = None
+    while True:
+        with ExitStack() as stack:
+            stack.enter_context(exec_ctx)
+            if event_context is not None:
+                stack.enter_context(event_context.open())
+            stack.enter_context(liveness_scope.open())
+            try:
+                if error is None:
+                    awaited = coroutine.send(send_value)
+                else:
+                    awaited = coroutine.throw(error)
+            except StopIteration as e:
+                return e.value
+        try:
+            send_value = yield awaited
+            error = None
+        except BaseException as e:
+            # Includes cancellation, which is passed on to the coroutine so it can clean up
+            send_value = None
+            error = e
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+    """
+    Run a coroutine on the shared event loop, so it does not block the render thread.
+    Each step of the coroutine runs in the execution context and event context active when this is called.
+    State updates from the coroutine are queued on the render thread by the state setters, like other threads.
+    Objects created by the coroutine are kept alive until it is done.
+
+    Args:
+        coroutine: The coroutine to run.
+
+    Returns:
+        A future for the result of the coroutine. Cancel it to cancel the coroutine.
+    """
+    exec_ctx = get_exec_ctx()
+    try:
+        event_context: EventContext | None = get_event_context()
+    except NoContextException:
+        event_context = None
+
+    async def run() -> Any:
+        # Create the scope once running, so it isn't leaked if cancelled before it starts
+        liveness_scope = LivenessScope()
+        try:
+            return await _run_in_contexts(
+                coroutine, exec_ctx, event_context, liveness_scope
+            )
+        finally:
+            liveness_scope.release()
+
+    future = asyncio.run_coroutine_threadsafe(run(), _get_loop())
+    future.add_done_callback(_log_exception)
+    return future
+
+
+def _log_exception(future: concurrent.futures.Future) -> None:
+    """
+    Log the exception of a finished coroutine, if any. Cancelled coroutines are not logged.
+
+    Args:
+        future: The future of the coroutine.
+    """
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.error(error, exc_info=error)
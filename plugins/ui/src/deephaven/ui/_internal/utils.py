@@ -19,7 +19,7 @@ from deephaven.dtypes import (
 )
 from inspect import signature
 import sys
-from functools import partial
+from functools import lru_cache, partial
 from itertools import zip_longest
 from deephaven.time import (
     to_j_instant,
@@ -126,9 +126,11 @@ def to_camel_case(snake_case_text: str) -> str:
     return "_" * leading_underscores + camel_case_text + "_" * trailing_underscores
 
 
+@lru_cache(maxsize=4096)
 def to_react_prop_case(snake_case_text: str) -> str:
     """
     Convert a snake_case string to camelCase, with exceptions for special props like `UNSAFE_` or `aria_` props.
+    Results are cached, as the same prop names are converted for every element created.
 
     Args:
         snake_case_text: The snake_case string to convert.
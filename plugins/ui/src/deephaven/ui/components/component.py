@@ -63,8 +63,9 @@ def component(func: Callable[..., Any]) -> Callable[..., Element]:
 def component(
     *,
     memo: bool | CompareFunction = ...,
+    broadcast: bool = ...,
 ) -> Callable[[Callable[..., Any]], Callable[..., Element]]:
-    """Usage with parameters: @ui.component() or @ui.component(memo=True)"""
+    """Usage with parameters: @ui.component(), @ui.component(memo=True) or @ui.component(broadcast=True)"""
     ...
 
 
@@ -72,6 +73,7 @@ def component(
     func: Callable[..., Any] | None = None,
     *,
     memo: bool | CompareFunction = False,
+    broadcast: bool = False,
 ) -> Callable[..., Element] | Callable[[Callable[..., Any]], Callable[..., Element]]:
     """
     Create a FunctionalElement from the passed in function.
@@ -84,6 +86,11 @@ def component(
               - True: Enable memoization with shallow equality comparison.
               - Callable: Custom comparison function (prev_props, next_props) -> bool
                           that returns True if props are equal (should skip re-render).
+        broadcast: Render the component once and send the result to every client viewing it,
+              instead of rendering it separately for each client. Applies when the component is the
+              element being viewed. State, callbacks and the URL are shared by all viewers, and state
+              sent by clients is ignored, so only use it for components without per-viewer state,
+              such as read-only dashboards.
 
     Can be used in several ways:
 
@@ -106,6 +113,11 @@ def component(
        @ui.component(memo=lambda prev, next: prev["value"] == next["value"])
        def my_component(value, on_click):
            return ui.button(str(value), on_press=on_click)
+
+    5. Rendered once for all viewers:
+       @ui.component(broadcast=True)
+       def monitor():
+           return ui.table(trades.tail(100))
     """
     # Determine if memoization is enabled and what comparison function to use
     if memo is False:
@@ -127,7 +139,10 @@ def component(
         def make_component_node(*args: Any, key: str | None = None, **kwargs: Any):
             component_type = get_component_qualname(fn)
             element = FunctionElement(
-                component_type, lambda: fn(*args, **kwargs), key=key
+                component_type,
+                lambda: fn(*args, **kwargs),
+                key=key,
+                broadcast=broadcast,
             )
 
             if enable_memo and compare_fn is not None:
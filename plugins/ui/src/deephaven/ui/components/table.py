@@ -357,6 +357,8 @@ class table(Element):
         The rendered Table.
     """
 
+    __slots__ = ("_props", "_key")
+
     _props: dict[str, Any]
     """
     The props that are passed to the frontend
@@ -19,6 +19,8 @@ class BaseElement(Element):
         props: The props for the element
     """
 
+    __slots__ = ("_name", "_key", "_props")
+
     def __init__(
         self,
         name: str,
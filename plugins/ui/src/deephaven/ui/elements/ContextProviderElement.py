@@ -16,6 +16,8 @@ class ContextProviderElement(Element):
     as its props.
     """
 
+    __slots__ = ("_context", "_value", "_children")
+
     def __init__(self, context: Context, value: Any, *children: Any):
         """
         Args:
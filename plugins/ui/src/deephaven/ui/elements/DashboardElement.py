@@ -8,6 +8,8 @@ logger = logging.getLogger(__name__)
 
 
 class DashboardElement(BaseElement):
+    __slots__ = ()
+
     def __init__(
         self,
         element: FunctionElement,
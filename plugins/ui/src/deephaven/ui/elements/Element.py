@@ -11,6 +11,9 @@ class Element(ABC):
     Interface for all custom UI elements that have children.
     """
 
+    # Elements are created for every node of every render, so subclasses declare slots to keep them small
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """
@@ -31,6 +34,17 @@ class Element(ABC):
         """
         return None
 
+    @property
+    def broadcast(self) -> bool:
+        """
+        Get whether this element is rendered once and shared by every client viewing it,
+        rather than rendered separately for each client.
+
+        Returns:
+            True if this element is broadcast to all clients.
+        """
+        return False
+
     @abstractmethod
     def render(self) -> PropsType:
         """
@@ -7,8 +7,14 @@ logger = logging.getLogger(__name__)
 
 
 class FunctionElement(Element):
+    __slots__ = ("_name", "_render", "_key", "_broadcast")
+
     def __init__(
-        self, name: str, render: Callable[[], list[Element]], key: str | None = None
+        self,
+        name: str,
+        render: Callable[[], list[Element]],
+        key: str | None = None,
+        broadcast: bool = False,
     ):
         """
         Create an element that takes a function to render.
@@ -17,10 +23,12 @@ class FunctionElement(Element):
             name: Name of the component. Typically, the module joined with the name of the function.
             render: The render function to call when the component needs to be rendered.
             key: The key of this element.
+            broadcast: Whether the component is rendered once and shared by every client viewing it.
         """
         self._name = name
         self._render = render
         self._key = key
+        self._broadcast = broadcast
 
     @property
     def name(self):
@@ -30,6 +38,10 @@ class FunctionElement(Element):
     def key(self) -> str | None:
         return self._key
 
+    @property
+    def broadcast(self) -> bool:
+        return self._broadcast
+
     def render(self) -> PropsType:
         """
         Render the component. Should only be called when actually rendering the component, e.g. exporting it to the client.
@@ -5,6 +5,8 @@ from .Element import Element, PropsType
 
 
 class MemoizedElement(Element):
+    __slots__ = ("_element", "_props", "_are_props_equal")
+
     _element: Element
     _props: PropsType
     _are_props_equal: Callable[[PropsType, PropsType], bool]
@@ -35,6 +37,10 @@ class MemoizedElement(Element):
     def key(self) -> str | None:
         return self._element.key
 
+    @property
+    def broadcast(self) -> bool:
+        return self._element.broadcast
+
     @property
     def props(self) -> PropsType:
         return self._props
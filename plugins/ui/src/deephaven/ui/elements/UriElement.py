@@ -12,9 +12,11 @@ class UriElement(Element):
         key: An optional key for the element.
     """
 
+    __slots__ = ("_uri", "_key")
+
     _uri: str
 
-    _key: str | None = None
+    _key: str | None
 
     def __init__(self, uri: str, key: str | None = None):
         self._uri = uri
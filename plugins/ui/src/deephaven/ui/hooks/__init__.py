@@ -22,6 +22,9 @@ from .use_path import use_path
 from .use_navigate import use_navigate
 from .use_url_components import use_url_components
 from .use_params import use_params
+from .use_debounce import use_debounce
+from .use_throttle import use_throttle
+from .use_background_task import use_background_task
 
 
 __all__ = [
@@ -49,4 +52,7 @@ __all__ = [
     "use_navigate",
     "use_url_components",
     "use_params",
+    "use_debounce",
+    "use_throttle",
+    "use_background_task",
 ]
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Deque, Generic, Optional, Tuple, TypeVar
+from weakref import WeakKeyDictionary
+
+from deephaven.execution_context import ExecutionContext, get_exec_ctx
+from deephaven.liveness_scope import LivenessScope
+from deephaven.server.executors import submit_task
+
+from .use_effect import use_effect
+from .use_ref import use_ref, Ref
+from .use_state import use_state
+from .._internal import (
+    OnChangeCallable,
+    RootRenderContextProtocol,
+    ValueWithLiveness,
+    get_context,
+)
+from ..types import Dependencies
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MAX_CONCURRENT_TASKS = 4
+"""
+Maximum number of background tasks running at once for each rendered element. Other tasks wait until one finishes.
+Set this before an element is rendered to change the limit of its tasks.
+"""
+
+
+class _BackgroundTask:
+    """
+    A single run of a background task function.
+    """
+
+    func: Callable[[], Any]
+    """
+    The function to run.
+    """
+
+    exec_ctx: ExecutionContext
+    """
+    The execution context to run the function in.
+    """
+
+    on_done: Callable[[ValueWithLiveness[Any], Optional[Exception]], None]
+    """
+    Called from the background thread with the result or error of the function.
+    """
+
+    is_cancelled: bool
+    """
+    Whether the task was superseded or unmounted. Tasks that have not started yet are skipped.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[], Any],
+        exec_ctx: ExecutionContext,
+        on_done: Callable[[ValueWithLiveness[Any], Optional[Exception]], None],
+    ):
+        self.func = func
+        self.exec_ctx = exec_ctx
+        self.on_done = on_done
+        self.is_cancelled = False
+
+    def cancel(self) -> None:
+        """
+        Cancel the task. Running tasks can't be interrupted, but their result is dropped.
+        """
+        self.is_cancelled = True
+
+    def run(self) -> None:
+        """
+        Run the function, capturing the objects it creates in a new liveness scope.
+        """
+        liveness_scope = LivenessScope()
+        result = None
+        error = None
+        with self.exec_ctx, liveness_scope.open():
+            try:
+                result = self.func()
+            except Exception as e:
+                logger.debug("Background task failed: %s", e)
+                error = e
+        self.on_done(
+            ValueWithLiveness(value=result, liveness_scope=liveness_scope), error
+        )
+
+
+class _BackgroundTaskLimiter:
+    """
+    Limits the number of background tasks running at once for a rendered element.
+    """
+
+    _pending: Deque[_BackgroundTask]
+    """
+    Tasks waiting for a running task to finish.
+    """
+
+    _running_count: int
+    """
+    The number of tasks running.
+    """
+
+    _max_concurrent: int
+    """
+    Maximum number of tasks running at once.
+    """
+
+    _lock: threading.Lock
+    """
+    Lock guarding the pending tasks and running count.
+    """
+
+    def __init__(self, max_concurrent: int | None = None):
+        """
+        Create a new task limiter.
+
+        Args:
+            max_concurrent: Maximum number of tasks running at once. Defaults to MAX_CONCURRENT_TASKS.
+        """
+        self._pending = deque()
+        self._running_count = 0
+        self._max_concurrent = (
+            MAX_CONCURRENT_TASKS if max_concurrent is None else max_concurrent
+        )
+        self._lock = threading.Lock()
+
+    def submit(self, task: _BackgroundTask) -> None:
+        """
+        Run the task on the concurrent executor, or queue it if too many tasks are running already.
+
+        Args:
+            task: The task to run.
+        """
+        with self._lock:
+            if self._running_count >= self._max_concurrent:
+                self._pending.append(task)
+                return
+            self._running_count += 1
+        submit_task("concurrent", partial(self._run, task))
+
+    def _run(self, task: Optional[_BackgroundTask]) -> None:
+        """
+        Run the task and any pending tasks after it, skipping cancelled tasks.
+
+        Args:
+            task: The task to run first.
+        """
+        while task is not None:
+            finished = False
+            try:
+                if not task.is_cancelled:
+                    task.run()
+                finished = True
+            except Exception as e:
+                logger.error("Background task could not finish: %s", e)
+                finished = True
+            finally:
+                task = self._next_task()
+                if not finished and task is not None:
+                    # This thread is exiting, so the next task runs on another one
+                    submit_task("concurrent", partial(self._run, task))
+
+    def _next_task(self) -> Optional[_BackgroundTask]:
+        """
+        Take the next pending task, or release the running slot if there are none.
+
+        Returns:
+            The next task to run, or None if there are no pending tasks.
+        """
+        with self._lock:
+            if self._pending:
+                return self._pending.popleft()
+            self._running_count -= 1
+            return None
+
+
+_limiters: WeakKeyDictionary[
+    RootRenderContextProtocol, _BackgroundTaskLimiter
+] = WeakKeyDictionary()
+"""
+The task limiter of each rendered element, by its root.
+"""
+
+_limiters_lock = threading.Lock()
+"""
+Lock guarding the task limiters.
+"""
+
+
+def _get_limiter(root: RootRenderContextProtocol) -> _BackgroundTaskLimiter:
+    """
+    Get the task limiter for a rendered element, creating it if needed.
+
+    Args:
+        root: The root of the rendered element.
+
+    Returns:
+        The task limiter.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(root)
+        if limiter is None:
+            limiter = _BackgroundTaskLimiter()
+            _limiters[root] = limiter
+        return limiter
+
+
+@dataclass
+class _BackgroundTaskState(Generic[T]):
+    """
+    The latest finished run of a background task.
+    """
+
+    result: ValueWithLiveness[T | None]
+    """
+    The result of the run, and the liveness scope holding the objects it created.
+    """
+
+    error: Exception | None
+    """
+    The error raised by the run, if any.
+    """
+
+    dependencies: Dependencies | None
+    """
+    The dependencies of the run, or None if no run has finished yet.
+    """
+
+
+def _apply_result(
+    task: _BackgroundTask,
+    task_ref: Ref[_BackgroundTask | None],
+    set_task_state: Callable[[_BackgroundTaskState[Any]], None],
+    dependencies: Dependencies,
+    result: ValueWithLiveness[Any],
+    error: Exception | None,
+) -> None:
+    """
+    Set the result of a finished task on the render thread, unless it was superseded while running.
+
+    Args:
+        task: The task that finished.
+        task_ref: Ref to the latest task started.
+        set_task_state: Sets the latest finished run.
+        dependencies: The dependencies the task was started with.
+        result: The result of the task.
+        error: The error raised by the task, if any.
+    """
+    if task.is_cancelled or task is not task_ref.current:
+        logger.debug("Dropping result of superseded background task")
+        if result.liveness_scope is not None:
+            result.liveness_scope.release()
+        return
+    set_task_state(_BackgroundTaskState(result, error, dependencies))
+
+
+def use_background_task(
+    func: Callable[[], T], dependencies: Dependencies
+) -> Tuple[T | None, bool, Exception | None]:
+    """
+    Run a function on a background thread when the dependencies change, without blocking the render.
+    Use it for expensive work, such as building a derived table. Only a limited number of tasks run at once
+    for each rendered element, and the others wait for a running task to finish.
+    When the dependencies change, the previous task is cancelled if it has not started yet, and its result is
+    dropped if it is still running. Objects created by the function are kept alive while its result is current.
+
+    Args:
+        func: The function to run. It is called with no arguments, in the execution context of the component.
+        dependencies: The dependencies to check for changes.
+
+    Returns:
+        A tuple of the result of the latest finished run, whether a run for the current dependencies is still
+        loading, and the error raised by the latest finished run, if any.
+        The previous result is returned while loading, or None if no run has finished yet.
+    """
+    context = get_context()
+    exec_ctx = get_exec_ctx()
+    task_state, set_task_state = use_state(
+        lambda: _BackgroundTaskState(
+            ValueWithLiveness(value=None, liveness_scope=None), None, None
+        )
+    )
+    task_ref: Ref[_BackgroundTask | None] = use_ref(None)
+
+    # The context owns the objects of the current result, and releases them once it is replaced
+    if task_state.result.liveness_scope is not None:
+        context.manage(task_state.result.liveness_scope)
+
+    def start_task() -> Callable[[], None]:
+        queue_render: OnChangeCallable = context.queue_render
+
+        def on_done(result: ValueWithLiveness[Any], error: Exception | None) -> None:
+            queue_render(
+                partial(
+                    _apply_result,
+                    task,
+                    task_ref,
+                    set_task_state,
+                    dependencies,
+                    result,
+                    error,
+                )
+            )
+
+        task = _BackgroundTask(func, exec_ctx, on_done)
+        task_ref.current = task
+        _get_limiter(context.root).submit(task)
+        return task.cancel
+
+    use_effect(start_task, dependencies)
+
+    is_loading = (
+        task_state.dependencies is None or task_state.dependencies != dependencies
+    )
+    return task_state.result.value, is_loading, task_state.error
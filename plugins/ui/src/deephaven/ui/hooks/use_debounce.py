@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from .use_effect import use_effect
+from .use_ref import use_ref, Ref
+from .use_render_queue import use_render_queue
+from .._internal.RateLimitedCallable import RateLimitedCallable
+
+
+def _use_rate_limited_callable(
+    func: Callable[..., Any], wait_ms: float, leading: bool
+) -> Callable[..., Any]:
+    """
+    Create a rate limited callable that persists across renders, and always calls the latest function passed in.
+    Pending calls are cancelled when the component is unmounted.
+
+    Args:
+        func: The function to call.
+        wait_ms: Length of the window in milliseconds.
+        leading: True to throttle calls, False to debounce them.
+
+    Returns:
+        The rate limited callable.
+    """
+    queue_render = use_render_queue()
+    limited_ref: Ref[RateLimitedCallable | None] = use_ref(None)
+    limited = limited_ref.current
+    if limited is None:
+        limited = RateLimitedCallable(func, wait_ms, queue_render, leading)
+        limited_ref.current = limited
+    else:
+        limited.func = func
+        limited.wait = wait_ms / 1000
+
+    use_effect(lambda: limited.cancel, [])
+
+    return limited
+
+
+def use_debounce(func: Callable[..., Any], wait_ms: float) -> Callable[..., Any]:
+    """
+    Debounce a callback, such as the on_change of a text field. The function is only called once no calls have been
+    made for wait_ms milliseconds, with the arguments of the latest call.
+    Calls are coalesced on the server before they reach the function, so intermediate values do not cause renders.
+    The same callable is returned on every render, and it always calls the latest function passed in.
+
+    Args:
+        func: The function to debounce.
+        wait_ms: The number of milliseconds to wait after the latest call before calling the function.
+
+    Returns:
+        The debounced callable.
+    """
+    return _use_rate_limited_callable(func, wait_ms, leading=False)
@@ -1,14 +1,35 @@
 from __future__ import annotations
 
-from typing import Callable, Any, cast, Sequence, Union
+import inspect
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Any, cast, Sequence, Union
 from .use_callback import use_callback
 from .use_ref import use_ref, Ref
 from deephaven.liveness_scope import LivenessScope
-from .._internal import get_context
+from .._internal import get_context, run_coroutine
 from ..types import Dependencies
 
 CleanupFunction = Callable[[], None]
-EffectFunction = Callable[[], Union[CleanupFunction, None]]
+EffectFunction = Callable[
+    [], Union[CleanupFunction, None, Awaitable[Union[CleanupFunction, None]]]
+]
+
+
+def _cancel_on_cleanup(future: Future) -> CleanupFunction:
+    """
+    Create a cleanup function that cancels an async effect if it is still running.
+
+    Args:
+        future: The future of the running effect.
+
+    Returns:
+        The cleanup function.
+    """
+
+    def cleanup():
+        future.cancel()
+
+    return cleanup
 
 
 def use_effect(
@@ -18,6 +39,8 @@ def use_effect(
     Call a function when the dependencies change. Optionally return a cleanup function to be called when dependencies change again or component is unmounted.
     If no dependencies are passed in, the effect will be called on every render.
     If an empty list is passed in, the effect will only be called once when the component mounts.
+    The function can be async, in which case it runs without blocking rendering, and is cancelled if still running
+    when the dependencies change again or the component is unmounted. Cleanup functions returned by async effects are not called.
 
     Args:
         func: The function to call when the dependencies change.
@@ -44,7 +67,10 @@ def use_effect(
 
         with liveness_scope.open():
             effect_result = func()
-            cleanup_ref.current = effect_result
+            if inspect.iscoroutine(effect_result):
+                cleanup_ref.current = _cancel_on_cleanup(run_coroutine(effect_result))
+            else:
+                cleanup_ref.current = effect_result
 
         scope_ref.current = liveness_scope
 
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from .use_debounce import _use_rate_limited_callable
+
+
+def use_throttle(func: Callable[..., Any], wait_ms: float) -> Callable[..., Any]:
+    """
+    Throttle a callback, such as the on_change of a slider. The function is called at most once every wait_ms
+    milliseconds. The first call is applied immediately, and calls made within the window are coalesced
+    into a single call with the arguments of the latest call when the window ends.
+    The same callable is returned on every render, and it always calls the latest function passed in.
+
+    Args:
+        func: The function to throttle.
+        wait_ms: The minimum number of milliseconds between calls of the function.
+
+    Returns:
+        The throttled callable.
+    """
+    return _use_rate_limited_callable(func, wait_ms, leading=True)
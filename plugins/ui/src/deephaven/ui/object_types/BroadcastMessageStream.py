@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from jsonrpc import Dispatcher
+from deephaven.plugin.object_type import MessageStream
+from pyjsonpatch import generate_patch
+
+from .._internal import ExportedRenderState
+from ..elements import Element
+from ..renderer.NodeEncoder import OBJECT_KEY
+from .ElementBroadcast import ElementBroadcast
+
+logger = logging.getLogger(__name__)
+
+
+def _find_object_ids(value: Any, object_ids: set[int]) -> None:
+    """
+    Find all object IDs referenced in an encoded value.
+
+    Args:
+        value: The encoded value to search
+        object_ids: The set to add the object IDs to
+    """
+    if isinstance(value, dict):
+        if OBJECT_KEY in value:
+            object_ids.add(value[OBJECT_KEY])
+            return
+        for child in value.values():
+            _find_object_ids(child, object_ids)
+    elif isinstance(value, list):
+        for child in value:
+            _find_object_ids(child, object_ids)
+
+
+def _remap_object_ids(value: Any, object_ids: dict[int, int]) -> Any:
+    """
+    Replace the object IDs referenced in an encoded value.
+
+    Args:
+        value: The encoded value to remap
+        object_ids: Dictionary from the old object ID to the new object ID
+
+    Returns:
+        The remapped value
+    """
+    if isinstance(value, dict):
+        if OBJECT_KEY in value:
+            return {OBJECT_KEY: object_ids[value[OBJECT_KEY]]}
+        return {
+            key: _remap_object_ids(child, object_ids) for key, child in value.items()
+        }
+    if isinstance(value, list):
+        return [_remap_object_ids(child, object_ids) for child in value]
+    return value
+
+
+class BroadcastMessageStream(MessageStream):
+    """
+    Connection of a single client to an element that is broadcast to all of its viewers.
+    Documents are rendered and encoded once by the shared ElementBroadcast, and sent to this client as is.
+
+    The client numbers objects in the order they are received, so a client that is subscribed after objects have
+    been sent to other viewers can't use the object IDs of the shared document. The IDs of messages sent to
+    those clients are remapped to the IDs the client knows them by.
+    """
+
+    _connection: MessageStream
+    """
+    The connection to send the rendered element to.
+    """
+
+    _broadcast: ElementBroadcast
+    """
+    The broadcast rendering the element.
+    """
+
+    _dispatcher: Dispatcher
+    """
+    The dispatcher to use when the client calls methods. Handled by the broadcast, except for state updates.
+    """
+
+    _object_ids: dict[int, int] | None
+    """
+    Dictionary from the ID of an object in the shared document to the ID of the object on the client.
+    None if the IDs are the same.
+    """
+
+    _next_object_id: int
+    """
+    The ID the client will assign to the next object sent to it.
+    """
+
+    _is_closed: bool
+    """
+    Whether or not the stream is closed.
+    """
+
+    def __init__(self, element: Element, connection: MessageStream):
+        """
+        Create a new BroadcastMessageStream, viewing the shared broadcast of the element.
+
+        Args:
+            element: The element to view
+            connection: The connection to send the rendered element to
+        """
+        self._connection = connection
+        self._broadcast = ElementBroadcast.acquire(element)
+        self._dispatcher = self._broadcast.make_dispatcher()
+        # State is shared by every viewer, so state sent by this client is ignored
+        self._dispatcher["setState"] = self._set_state
+        self._dispatcher["setUrlState"] = self._set_url_state
+        self._object_ids = None
+        self._next_object_id = 0
+        self._is_closed = False
+
+    def start(self) -> None:
+        """
+        Start the message stream. All we do is send a blank message to start. Client will respond with the initial state.
+        """
+        self._connection.on_data(b"", [])
+
+    def on_data(self, payload: bytes, references: list[Any]) -> None:
+        """
+        Handle incoming data from the client. Dispatches commands on the render thread of the broadcast.
+
+        Args:
+            payload: The payload from the client
+            references: The references from the client
+        """
+        self._broadcast.queue_message(payload, self._dispatcher, self._connection)
+
+    def on_close(self) -> None:
+        assert not self._is_closed
+
+        logger.debug("Closing BroadcastMessageStream")
+        self._is_closed = True
+        self._broadcast.release(self)
+
+    def close(self) -> None:
+        """
+        Close the connection to the client.
+        """
+        self._connection.on_close()
+
+    def _set_state(
+        self, state: ExportedRenderState, app_state: dict[str, Any] | None = None
+    ) -> None:
+        """
+        Called by the client on initial load. The state is ignored, and the current document is sent to the client.
+
+        Args:
+            state: The component state from the client. Ignored.
+            app_state: Application-level state from the client. Ignored.
+        """
+        logger.debug("Ignoring state for broadcast element: %s", state)
+        # Queue it up so the document is sent after the response
+        self._broadcast.on_queue_render(lambda: self._broadcast.subscribe(self))
+
+    def _set_url_state(self, url: str) -> None:
+        """
+        Called by the client after a client-side navigation. The URL is shared by every viewer, so it is ignored.
+
+        Args:
+            url: The full URL string.
+        """
+        logger.debug("Ignoring URL state for broadcast element: %s", url)
+
+    def send_document(
+        self, document: dict[str, Any] | None, objects: dict[int, Any]
+    ) -> None:
+        """
+        Send the full document to the client. Updates are sent relative to this document after.
+
+        Args:
+            document: The encoded document, or None if nothing has been rendered yet
+            objects: Objects referenced by the document, by object ID
+        """
+        if document is None:
+            # Every object will be sent with the first document, so the IDs are the same as the shared IDs
+            # as long as the client hasn't been sent any objects yet.
+            if self._next_object_id > 0:
+                self._object_ids = {}
+            return
+
+        object_ids: dict[int, int] = {}
+        new_objects = []
+        for object_id in sorted(objects):
+            object_ids[object_id] = self._next_object_id
+            self._next_object_id += 1
+            new_objects.append(objects[object_id])
+        self._object_ids = object_ids
+
+        patch = generate_patch({}, _remap_object_ids(document, object_ids))
+        request = {
+            "jsonrpc": "2.0",
+            "method": "documentPatched",
+            "params": [patch],
+        }
+        self._connection.on_data(json.dumps(request).encode(), new_objects)
+
+    def send_shared(
+        self, payload: bytes, new_objects: list[Any], objects: dict[int, Any]
+    ) -> None:
+        """
+        Send a message from the broadcast to the client, remapping the object IDs if needed.
+
+        Args:
+            payload: The payload to send
+            new_objects: The new objects referenced by the payload, in the order of their IDs
+            objects: Objects referenced by the shared document after the message, by object ID
+        """
+        if self._is_closed:
+            return
+
+        object_ids = self._object_ids
+        if object_ids is not None:
+            if OBJECT_KEY.encode() in payload:
+                request = json.loads(payload.decode())
+
+                # New objects are assigned increasing IDs in the order they are sent
+                found_ids: set[int] = set()
+                _find_object_ids(request, found_ids)
+                new_ids = sorted(found_ids - object_ids.keys())
+                if len(new_ids) != len(new_objects):
+                    logger.error(
+                        "Expected %s new objects in broadcast message, found %s",
+                        len(new_objects),
+                        len(new_ids),
+                    )
+                for i, object_id in enumerate(new_ids):
+                    object_ids[object_id] = self._next_object_id + i
+
+                payload = json.dumps(_remap_object_ids(request, object_ids)).encode()
+
+            # Objects that left the document are never referenced again
+            self._object_ids = {
+                object_id: client_id
+                for object_id, client_id in object_ids.items()
+                if object_id in objects
+            }
+
+        # The client numbers every object it is sent, whatever the message
+        self._next_object_id += len(new_objects)
+        self._connection.on_data(payload, new_objects)
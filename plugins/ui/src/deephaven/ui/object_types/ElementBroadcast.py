@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import logging
+import threading
+from functools import partial
+from typing import Any, TYPE_CHECKING
+
+from jsonrpc import Dispatcher
+from deephaven.plugin.object_type import MessageStream
+
+from ..elements import Element
+from .ElementMessageStream import ElementMessageStream
+
+if TYPE_CHECKING:
+    from .BroadcastMessageStream import BroadcastMessageStream
+
+logger = logging.getLogger(__name__)
+
+
+class ElementBroadcast(MessageStream):
+    """
+    Renders an element once for every client viewing it. The element is rendered by a single ElementMessageStream,
+    and each encoded document patch, error and event is sent to every subscribed viewer.
+    Broadcasts are shared by all viewers of the same element, and closed when the last viewer is released.
+    """
+
+    _broadcasts: dict[int, ElementBroadcast] = {}
+    """
+    The open broadcasts, by the python ID of the element they render.
+    """
+
+    _broadcasts_lock: threading.Lock = threading.Lock()
+    """
+    Lock guarding the open broadcasts.
+    """
+
+    _element: Element
+    """
+    The element to render. Kept so the ID used as the key is not reused while the broadcast is open.
+    """
+
+    _stream: ElementMessageStream
+    """
+    The stream that renders the element and encodes the documents.
+    """
+
+    _viewers: list[BroadcastMessageStream]
+    """
+    Viewers that have been sent the document and are sent every update.
+    """
+
+    _acquired: int
+    """
+    Number of viewers that have acquired this broadcast and not released it yet.
+    """
+
+    _document: dict[str, Any] | None
+    """
+    The last document sent to the viewers, or None if nothing has been rendered yet.
+    """
+
+    _objects: dict[int, Any]
+    """
+    Objects referenced by the last document sent to the viewers, by object ID.
+    """
+
+    _lock: threading.Lock
+    """
+    Lock guarding the viewers and the last document.
+    """
+
+    def __init__(self, element: Element):
+        """
+        Create a new ElementBroadcast. The element is rendered as soon as possible.
+
+        Args:
+            element: The element to render
+        """
+        self._element = element
+        self._viewers = []
+        self._acquired = 0
+        self._document = None
+        self._objects = {}
+        self._lock = threading.Lock()
+        self._stream = ElementMessageStream(element, self)
+        # Nothing is rendered until the state is set. State from viewers is ignored, so start with empty state.
+        self._stream.on_queue_render(partial(self._stream._set_state, {}))
+
+    @classmethod
+    def acquire(cls, element: Element) -> ElementBroadcast:
+        """
+        Get the broadcast for an element, creating it if needed. Must be released by the viewer when closed.
+
+        Args:
+            element: The element to get the broadcast for
+
+        Returns:
+            The broadcast
+        """
+        with cls._broadcasts_lock:
+            broadcast = cls._broadcasts.get(id(element))
+            if broadcast is None:
+                broadcast = cls(element)
+                cls._broadcasts[id(element)] = broadcast
+            broadcast._acquired += 1
+            return broadcast
+
+    def release(self, viewer: BroadcastMessageStream) -> None:
+        """
+        Release the broadcast for a viewer, closing it if it was the last viewer.
+
+        Args:
+            viewer: The viewer to release
+        """
+        with ElementBroadcast._broadcasts_lock:
+            with self._lock:
+                if viewer in self._viewers:
+                    self._viewers.remove(viewer)
+            self._acquired -= 1
+            if self._acquired > 0:
+                return
+            if ElementBroadcast._broadcasts.get(id(self._element)) is self:
+                ElementBroadcast._broadcasts.pop(id(self._element))
+
+        logger.debug("Closing ElementBroadcast")
+        self._stream.on_close()
+
+    def subscribe(self, viewer: BroadcastMessageStream) -> None:
+        """
+        Send the last document to a viewer, and send it every update after. Must be called from the render thread.
+
+        Args:
+            viewer: The viewer to subscribe
+        """
+        with self._lock:
+            if viewer not in self._viewers:
+                self._viewers.append(viewer)
+            document, objects = self._document, self._objects
+
+        viewer.send_document(document, objects)
+
+    def make_dispatcher(self) -> Dispatcher:
+        """
+        Make a dispatcher that handles viewer messages with the shared stream.
+
+        Returns:
+            A new dispatcher
+        """
+        return self._stream.make_dispatcher()
+
+    def queue_message(
+        self, payload: bytes, dispatcher: Dispatcher, connection: MessageStream
+    ) -> None:
+        """
+        Queue handling of a message from a viewer on the render thread.
+
+        Args:
+            payload: The payload from the viewer
+            dispatcher: The dispatcher to handle the message with
+            connection: The connection to send the response to
+        """
+        self._stream.queue_message(payload, dispatcher, connection)
+
+    def on_queue_render(self, callable: Any) -> None:
+        """
+        Queue a callable on the render thread.
+
+        Args:
+            callable: The callable to queue
+        """
+        self._stream.on_queue_render(callable)
+
+    def on_data(self, payload: bytes, references: list[Any]) -> None:
+        """
+        Send a message from the shared stream to every subscribed viewer.
+
+        Args:
+            payload: The payload to send
+            references: The new objects referenced by the payload
+        """
+        with self._lock:
+            self._document, self._objects = self._stream.get_document()
+            objects = self._objects
+            viewers = list(self._viewers)
+
+        for viewer in viewers:
+            viewer.send_shared(payload, references, objects)
+
+    def on_close(self) -> None:
+        """
+        Close every viewer. Called by the shared stream if rendering failed catastrophically.
+        """
+        with ElementBroadcast._broadcasts_lock:
+            if ElementBroadcast._broadcasts.get(id(self._element)) is self:
+                ElementBroadcast._broadcasts.pop(id(self._element))
+            with self._lock:
+                viewers = list(self._viewers)
+
+        for viewer in viewers:
+            viewer.close()
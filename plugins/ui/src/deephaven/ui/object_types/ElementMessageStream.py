@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import concurrent.futures
+import inspect
 import io
 import json
 import sys
 
 from jsonrpc import JSONRPCResponseManager, Dispatcher
+from jsonrpc.jsonrpc2 import JSONRPC20BatchResponse
 import logging
 import threading
 import traceback
@@ -12,15 +15,15 @@ from enum import Enum
 from queue import Queue
 from typing import Any, Callable
 from deephaven.plugin.object_type import MessageStream
-from deephaven.server.executors import submit_task
 from deephaven.execution_context import ExecutionContext, get_exec_ctx
 from deephaven.liveness_scope import liveness_scope
 from pyjsonpatch import generate_patch
 
-from .._internal import wrap_callable
+from .._internal import wrap_callable, run_coroutine
 from ..elements import Element
 from ..renderer import NodeEncoder, Renderer, RenderedNode
 from ..renderer.NodeEncoder import CALLABLE_KEY
+from ..renderer.RenderScheduler import RenderScheduler
 from .._internal import (
     RenderContext,
     ExportedRenderState,
@@ -145,6 +148,16 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
     The state of the render loop.
     """
 
+    _scheduler: RenderScheduler
+    """
+    Schedules the render loop of this stream fairly with the other streams.
+    """
+
+    _has_interactive_work: bool
+    """
+    Whether a message from the client was queued since the render loop last started.
+    """
+
     _render_thread: threading.Thread | None
     """
     The thread the render loop is running on.
@@ -173,6 +186,27 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
     _url: str
     """The full URL."""
 
+    _is_state_requested: bool
+    """
+    Whether the full state should be sent with the next document, even if it has not changed.
+    """
+
+    _coroutines: dict[str, concurrent.futures.Future]
+    """
+    Running coroutines started by async callables, by callable ID.
+    """
+
+    _coroutine_lock: threading.Lock
+    """
+    Lock guarding the running coroutines.
+    """
+
+    _pending_responses: list[tuple[MessageStream, Any]]
+    """
+    Responses to messages handled in the current pass of the render loop, and the connection to send each to.
+    Sent together once all queued messages are handled, before the document they rendered.
+    """
+
     def __init__(self, element: Element, connection: MessageStream):
         """
         Create a new ElementMessageStream. Renders the element in a render context, and sends the rendered result to the
@@ -186,7 +220,7 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
         self._connection = connection
         self._message_id = 0
         self._manager = JSONRPCResponseManager()
-        self._dispatcher = self._make_dispatcher()
+        self._dispatcher = self.make_dispatcher()
         self._encoder = NodeEncoder()
         self._event_encoder = EventEncoder(self._serialize_callables)
         self._url = ""
@@ -201,9 +235,16 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
         self._render_lock = threading.Lock()
         self._is_dirty = False
         self._render_state = _RenderState.IDLE
+        self._has_interactive_work = False
+        self._scheduler = RenderScheduler.get_instance()
+        self._scheduler.register(self, self._get_queue_depth)
         self._exec_context = get_exec_ctx()
         self._is_closed = False
         self._last_document = {}
+        self._is_state_requested = False
+        self._coroutines = {}
+        self._coroutine_lock = threading.Lock()
+        self._pending_responses = []
 
     def _render(self) -> None:
         logger.debug("ElementMessageStream._render")
@@ -217,7 +258,11 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
 
         try:
             node = self._renderer.render(self._element)
-            state = self._context.export_state()
+            # Only send the state if it changed, the client keeps the last state it was sent
+            state = None
+            if self._is_state_requested or self._context.is_state_dirty:
+                state = self._context.export_state()
+                self._is_state_requested = False
             self._send_document_patch(node, state)
         except Exception as e:
             # Send the error to the client for displaying to the user
@@ -237,15 +282,20 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
                 with self._render_lock:
                     self._render_thread = threading.current_thread()
                     self._render_state = _RenderState.RENDERING
+                    self._has_interactive_work = False
 
                 while not self._callable_queue.empty():
                     item = self._callable_queue.get()
                     with liveness_scope():
                         try:
-                            item()
+                            result = item()
+                            if inspect.iscoroutine(result):
+                                run_coroutine(result)
                         except Exception as e:
                             logger.exception(e)
 
+                self._send_pending_responses()
+
                 if self._is_dirty:
                     self._render()
 
@@ -254,7 +304,11 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
                     if not self._callable_queue.empty() or self._is_dirty:
                         # There are still callables to process, so queue up another render
                         self._render_state = _RenderState.QUEUED
-                        submit_task("concurrent", self._process_callable_queue)
+                        self._scheduler.schedule(
+                            self,
+                            self._process_callable_queue,
+                            self._has_interactive_work,
+                        )
                     else:
                         self._render_state = _RenderState.IDLE
         except Exception as e:
@@ -273,11 +327,35 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
         self._is_dirty = True
         self._queue_render()
 
-    def _queue_render(self) -> None:
+    def _queue_render(self, interactive: bool = False) -> None:
+        """
+        Queue the render loop if it is not queued or running already.
+
+        Args:
+            interactive: Whether the render was triggered by a message from the client.
+                Interactive renders are scheduled before renders triggered by background updates.
+        """
         with self._render_lock:
+            if interactive:
+                self._has_interactive_work = True
             if self._render_state is _RenderState.IDLE:
                 self._render_state = _RenderState.QUEUED
-                submit_task("concurrent", self._process_callable_queue)
+                self._scheduler.schedule(
+                    self, self._process_callable_queue, self._has_interactive_work
+                )
+            elif self._render_state is _RenderState.QUEUED and interactive:
+                # Promote the queued render loop. It may have been dispatched already and not be rendering yet,
+                # in which case it picks up the message when it starts, so no other loop may be scheduled.
+                self._scheduler.promote(self)
+
+    def _get_queue_depth(self) -> int:
+        """
+        Get the number of callables and state updates waiting to be processed.
+
+        Returns:
+            The queue depth
+        """
+        return self._callable_queue.qsize() + self._update_queue.qsize()
 
     def on_change(self, state_update: StateUpdateCallable) -> None:
         """
@@ -329,6 +407,13 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
         assert not self._is_closed
 
         logger.debug("Closing ElementMessageStream")
+        self._scheduler.unregister(self)
+
+        with self._coroutine_lock:
+            coroutines = list(self._coroutines.values())
+            self._coroutines.clear()
+        for future in coroutines:
+            future.cancel()
 
         # The connection is closed, so this component will not update anymore
         # delete the context so the objects in the collected scope are released
@@ -344,21 +429,72 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
             payload: The payload from the client
             references: The references from the client
         """
+        self.queue_message(payload, self._dispatcher, self._connection)
+
+    def queue_message(
+        self, payload: bytes, dispatcher: Dispatcher, connection: MessageStream
+    ) -> None:
+        """
+        Queue handling of a message from a client on the render thread.
+
+        Args:
+            payload: The payload from the client
+            dispatcher: The dispatcher to handle the message with
+            connection: The connection to send the response to
+        """
         decoded_payload = io.BytesIO(payload).read().decode()
         logger.debug("Payload received: %s", decoded_payload)
 
         def handle_message():
-            response = self._manager.handle(decoded_payload, self._dispatcher)
+            # Batch requests are dispatched in order by the manager, and answered with a single batch response
+            response = self._manager.handle(decoded_payload, dispatcher)
 
             if response is None:
                 return
 
-            response_payload = response.json
-            logger.debug("Response: %s, %s", type(response_payload), response_payload)
-            self._connection.on_data(response_payload.encode(), [])
+            if isinstance(response, JSONRPC20BatchResponse):
+                for batch_response in response:
+                    self._pending_responses.append((connection, batch_response))
+            else:
+                self._pending_responses.append((connection, response))
 
         # Queue up handling of all incoming messages from the client onto the render thread
-        self.on_queue_render(handle_message)
+        self._callable_queue.put(handle_message)
+        self._queue_render(interactive=True)
+
+    def _send_pending_responses(self) -> None:
+        """
+        Send the responses to the messages handled since the last call. Responses to the same connection are
+        sent in a single batch response, so a burst of messages is answered with one frame.
+        Should only be called from the render thread.
+        """
+        if len(self._pending_responses) == 0:
+            return
+
+        responses_by_connection: dict[int, tuple[MessageStream, list[Any]]] = {}
+        for connection, response in self._pending_responses:
+            _, responses = responses_by_connection.setdefault(
+                id(connection), (connection, [])
+            )
+            responses.append(response)
+        self._pending_responses = []
+
+        for connection, responses in responses_by_connection.values():
+            if len(responses) == 1:
+                response_payload = responses[0].json
+            else:
+                response_payload = json.dumps([response.data for response in responses])
+            logger.debug("Response: %s", response_payload)
+            connection.on_data(response_payload.encode(), [])
+
+    def get_document(self) -> tuple[dict[str, Any], dict[int, Any]]:
+        """
+        Get the last document sent to the client. Should only be called from the render thread.
+
+        Returns:
+            The encoded document, and a dictionary from object ID to the objects it references
+        """
+        return self._last_document, self._encoder.get_objects()
 
     def _get_next_message_id(self) -> int:
         """
@@ -399,9 +535,16 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
             "id": self._get_next_message_id(),
         }
 
-    def _make_dispatcher(self) -> Dispatcher:
+    def make_dispatcher(self) -> Dispatcher:
+        """
+        Make a dispatcher that handles client messages with this stream.
+
+        Returns:
+            A new dispatcher
+        """
         dispatcher = Dispatcher()
         dispatcher["setState"] = self._set_state
+        dispatcher["getState"] = self._get_state
         dispatcher["setUrlState"] = self._set_url_state
         dispatcher["callCallable"] = self._call_callable
         dispatcher["closeCallable"] = self._close_callable
@@ -424,8 +567,18 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
             if url is not None:
                 self.set_url(url)
         self._context.import_state(state)
+        self._is_state_requested = True
         self._mark_dirty()
 
+    def _get_state(self) -> str:
+        """
+        Get the full state of the element. Can be called by the client if it lost track of the state.
+
+        Returns:
+            The encoded state of the element.
+        """
+        return json.dumps(self._context.export_state())
+
     def _set_url_state(self, url: str) -> None:
         """
         Update the URL state. Called by the client after a client-side
@@ -477,6 +630,11 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
             return
         result = fn(*args)
 
+        if inspect.iscoroutine(result):
+            # Run async callables without blocking the render thread, the result is not sent to the client
+            self._run_callable_coroutine(callable_id, result)
+            result = None
+
         try:
             return json.dumps(result, default=self._serialize_callables)
         except Exception as e:
@@ -488,6 +646,30 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
                 "serialization_error": f"Cannot serialize callable {callable_id} result"
             }
 
+    def _run_callable_coroutine(self, callable_id: str, coroutine: Any) -> None:
+        """
+        Run the coroutine returned by an async callable. If the callable is still running from a previous call,
+        the previous call is superseded and cancelled.
+
+        Args:
+            callable_id: The ID of the callable that returned the coroutine
+            coroutine: The coroutine to run
+        """
+        future = run_coroutine(coroutine)
+
+        def on_done(done_future: concurrent.futures.Future) -> None:
+            with self._coroutine_lock:
+                if self._coroutines.get(callable_id) is done_future:
+                    del self._coroutines[callable_id]
+
+        with self._coroutine_lock:
+            previous = self._coroutines.get(callable_id)
+            self._coroutines[callable_id] = future
+        if previous is not None:
+            logger.debug("Cancelling superseded call of %s", callable_id)
+            previous.cancel()
+        future.add_done_callback(on_done)
+
     def _close_callable(self, callable_id: str) -> None:
         """
         Close a callable by its ID. Used to close a temporary callable that is outside of the render cycle.
@@ -499,14 +681,14 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
         self._temp_callable_dict.pop(callable_id, None)
 
     def _send_document_patch(
-        self, root: RenderedNode, state: ExportedRenderState
+        self, root: RenderedNode, state: ExportedRenderState | None
     ) -> None:
         """
         Send a document update to the client in the form of a JSON Patch (RFC 6902).
 
         Args:
             root: The root node of the document to send
-            state: The state of the node to preserve
+            state: The state of the node to preserve, or None if it has not changed since it was last sent
         """
         if self._is_closed:
             logger.error("Stream is closed, cannot render document")
@@ -520,10 +702,12 @@ class ElementMessageStream(MessageStream, RootRenderContextProtocol):
         patch = generate_patch(self._last_document, document)
         self._last_document = document
 
-        logger.debug("Exported state: %s", state)
-        encoded_state = json.dumps(state)
-
-        request = self._make_notification("documentPatched", patch, encoded_state)
+        if state is not None:
+            logger.debug("Exported state: %s", state)
+            encoded_state = json.dumps(state)
+            request = self._make_notification("documentPatched", patch, encoded_state)
+        else:
+            request = self._make_notification("documentPatched", patch)
         payload = json.dumps(request)
         logger.debug(f"Sending payload: {payload}")
 
@@ -3,6 +3,7 @@ from typing import Any, Literal
 from deephaven.plugin.object_type import BidirectionalObjectType, MessageStream
 from ..elements import Element
 from .ElementMessageStream import ElementMessageStream
+from .BroadcastMessageStream import BroadcastMessageStream
 
 # Escape-hatch configuration property. When set to true, deephaven.ui declares no authorization export behavior
 # ("unset"), deferring to the server's default policy instead of enforcing the transform.
@@ -52,6 +53,10 @@ class ElementType(BidirectionalObjectType):
     ) -> MessageStream:
         if not isinstance(obj, Element):
             raise TypeError(f"Expected Element, got {type(obj)}")
-        client_connection = ElementMessageStream(obj, connection)
+        if obj.broadcast:
+            # Rendered once and shared by every client viewing the element
+            client_connection = BroadcastMessageStream(obj, connection)
+        else:
+            client_connection = ElementMessageStream(obj, connection)
         client_connection.start()
         return client_connection
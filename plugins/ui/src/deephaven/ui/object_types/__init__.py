@@ -1,3 +1,5 @@
 from .DashboardType import DashboardType
 from .ElementMessageStream import ElementMessageStream
+from .ElementBroadcast import ElementBroadcast
+from .BroadcastMessageStream import BroadcastMessageStream
 from .ElementType import ElementType
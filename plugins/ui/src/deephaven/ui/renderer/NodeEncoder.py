@@ -132,6 +132,15 @@ class NodeEncoder:
             "callable_id_dict": self._callable_dict,
         }
 
+    def get_objects(self) -> dict[ObjectId, Any]:
+        """
+        Get the objects in the most recently encoded document.
+
+        Returns:
+            Dictionary from the ID assigned to each object to the object.
+        """
+        return {object_id: obj for object_id, obj in self._object_id_dict.values()}
+
     def _transform_node(self, key: str, value: Any):
         if isinstance(value, RenderedNode):
             return self._convert_rendered_node(value)
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Hashable, Optional
+
+from deephaven.server.executors import submit_task
+
+logger = logging.getLogger(__name__)
+
+_BACKGROUND_INTERVAL = 4
+"""
+While interactive renders are waiting, one background render is dispatched after this many interactive renders,
+so busy sessions can't starve ticking components entirely.
+"""
+
+
+@dataclass
+class RenderQueueMetrics:
+    """
+    Metrics of the render queue of a single stream.
+    """
+
+    queue_depth: int
+    """
+    The number of callables waiting to be processed by the stream.
+    """
+
+    is_queued: bool
+    """
+    Whether the stream is waiting to be dispatched.
+    """
+
+    is_interactive: bool
+    """
+    Whether the stream is waiting with an interactive (user event triggered) render.
+    """
+
+    wait_time: float
+    """
+    Seconds the stream has been waiting to be dispatched, or 0 if it is not queued.
+    """
+
+    render_count: int
+    """
+    The number of times the stream has been dispatched.
+    """
+
+    total_wait_time: float
+    """
+    Total seconds the stream waited to be dispatched.
+    """
+
+    max_wait_time: float
+    """
+    The longest the stream waited to be dispatched, in seconds.
+    """
+
+
+class _ScheduledStream:
+    """
+    A stream registered with the scheduler.
+    """
+
+    __slots__ = (
+        "get_queue_depth",
+        "task",
+        "is_interactive",
+        "queued_at",
+        "render_count",
+        "total_wait_time",
+        "max_wait_time",
+    )
+
+    get_queue_depth: Callable[[], int]
+    task: Optional[Callable[[], None]]
+    is_interactive: bool
+    queued_at: float
+    render_count: int
+    total_wait_time: float
+    max_wait_time: float
+
+    def __init__(self, get_queue_depth: Callable[[], int]):
+        self.get_queue_depth = get_queue_depth
+        self.task = None
+        self.is_interactive = False
+        self.queued_at = 0.0
+        self.render_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+
+class RenderScheduler:
+    """
+    Dispatches the render loops of all streams on the concurrent executor. Each stream has at most one render
+    loop waiting, and waiting streams are dispatched in the order they were queued, so each stream gets a turn.
+    Renders triggered by a user event are dispatched before renders triggered by background updates such as
+    table ticks, so a component re-rendering on every tick doesn't delay interactive renders in other sessions.
+    A limited number of render loops run at once, each on its own executor thread.
+    """
+
+    _instance: Optional[RenderScheduler] = None
+    """
+    The scheduler shared by all streams.
+    """
+
+    _instance_lock: threading.Lock = threading.Lock()
+    """
+    Lock guarding creation of the shared scheduler.
+    """
+
+    _max_workers: int
+    """
+    Maximum number of render loops running at once.
+    """
+
+    _worker_count: int
+    """
+    Number of render loops running.
+    """
+
+    _streams: Dict[Hashable, _ScheduledStream]
+    """
+    The registered streams, by key.
+    """
+
+    _interactive: Deque[Hashable]
+    """
+    Keys of streams waiting with an interactive render, in the order they were queued.
+    """
+
+    _background: Deque[Hashable]
+    """
+    Keys of streams waiting with a background render, in the order they were queued.
+    """
+
+    _interactive_streak: int
+    """
+    Number of interactive renders dispatched in a row while background renders were waiting.
+    """
+
+    _lock: threading.Lock
+    """
+    Lock guarding the queues and metrics.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        """
+        Create a new RenderScheduler.
+
+        Args:
+            max_workers: Maximum number of render loops running at once. Defaults to the number of CPUs.
+        """
+        self._max_workers = max_workers or os.cpu_count() or 4
+        self._worker_count = 0
+        self._streams = {}
+        self._interactive = deque()
+        self._background = deque()
+        self._interactive_streak = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> RenderScheduler:
+        """
+        Get the scheduler shared by all streams, creating it if needed.
+
+        Returns:
+            The shared scheduler
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def register(self, key: Hashable, get_queue_depth: Callable[[], int]) -> None:
+        """
+        Register a stream with the scheduler.
+
+        Args:
+            key: The key of the stream
+            get_queue_depth: Returns the number of callables waiting to be processed by the stream, for metrics
+        """
+        with self._lock:
+            self._streams[key] = _ScheduledStream(get_queue_depth)
+
+    def unregister(self, key: Hashable) -> None:
+        """
+        Unregister a stream. A render loop still waiting for the stream is dropped.
+
+        Args:
+            key: The key of the stream
+        """
+        with self._lock:
+            stream = self._streams.pop(key, None)
+            if stream is not None and stream.task is not None:
+                queue = self._interactive if stream.is_interactive else self._background
+                queue.remove(key)
+
+    def schedule(
+        self, key: Hashable, task: Callable[[], None], interactive: bool = False
+    ) -> None:
+        """
+        Queue the render loop of a stream. If the stream is already waiting, it is only promoted if the new render
+        is interactive. Streams must not schedule a render loop while one is running, use promote instead.
+
+        Args:
+            key: The key of the stream
+            task: The render loop to run
+            interactive: Whether the render was triggered by a user event
+        """
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None:
+                logger.warning("Scheduling render for unregistered stream %s", key)
+                return
+            if stream.task is not None:
+                if interactive:
+                    self._promote(stream, key)
+                return
+
+            stream.task = task
+            stream.is_interactive = interactive
+            stream.queued_at = time.monotonic()
+            (self._interactive if interactive else self._background).append(key)
+
+            start_worker = self._worker_count < self._max_workers
+            if start_worker:
+                self._worker_count += 1
+
+        if start_worker:
+            submit_task("concurrent", self._run_worker)
+
+    def promote(self, key: Hashable) -> None:
+        """
+        Promote the waiting render loop of a stream to an interactive render. Nothing is done if the stream is not
+        waiting, such as when its render loop was dispatched and is about to run.
+
+        Args:
+            key: The key of the stream
+        """
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is not None and stream.task is not None:
+                self._promote(stream, key)
+
+    def _promote(self, stream: _ScheduledStream, key: Hashable) -> None:
+        """
+        Move a waiting stream to the interactive queue. Must be called with the lock held.
+
+        Args:
+            stream: The waiting stream
+            key: The key of the stream
+        """
+        if not stream.is_interactive:
+            self._background.remove(key)
+            self._interactive.append(key)
+            stream.is_interactive = True
+
+    def get_metrics(self) -> Dict[Hashable, RenderQueueMetrics]:
+        """
+        Get the metrics of the render queue of each registered stream.
+
+        Returns:
+            The metrics, by the key of the stream
+        """
+        now = time.monotonic()
+        with self._lock:
+            streams = list(self._streams.items())
+            return {
+                key: RenderQueueMetrics(
+                    queue_depth=stream.get_queue_depth(),
+                    is_queued=stream.task is not None,
+                    is_interactive=stream.task is not None and stream.is_interactive,
+                    wait_time=now - stream.queued_at if stream.task is not None else 0,
+                    render_count=stream.render_count,
+                    total_wait_time=stream.total_wait_time,
+                    max_wait_time=stream.max_wait_time,
+                )
+                for key, stream in streams
+            }
+
+    def _next_key(self) -> Hashable | None:
+        """
+        Get the key of the next stream to dispatch. Must be called with the lock held.
+
+        Returns:
+            The key, or None if no stream is waiting
+        """
+        if self._interactive and (
+            not self._background or self._interactive_streak < _BACKGROUND_INTERVAL
+        ):
+            self._interactive_streak += 1 if self._background else 0
+            return self._interactive.popleft()
+        self._interactive_streak = 0
+        if self._background:
+            return self._background.popleft()
+        return None
+
+    def _run_worker(self) -> None:
+        """
+        Run waiting render loops until no stream is waiting.
+        """
+        while True:
+            with self._lock:
+                key = self._next_key()
+                if key is None:
+                    self._worker_count -= 1
+                    return
+                stream = self._streams[key]
+                task = stream.task
+                stream.task = None
+                wait_time = time.monotonic() - stream.queued_at
+                stream.render_count += 1
+                stream.total_wait_time += wait_time
+                stream.max_wait_time = max(stream.max_wait_time, wait_time)
+
+            if task is not None:
+                try:
+                    task()
+                except Exception as e:
+                    logger.exception(e)
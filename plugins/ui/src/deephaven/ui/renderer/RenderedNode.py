@@ -8,6 +8,8 @@ class RenderedNode:
     Represents the result of rendering a node.
     """
 
+    __slots__ = ("_name", "_props")
+
     _name: str
     _props: Optional[PropsType]
 
@@ -5,7 +5,7 @@ import logging
 from typing import Any, Union
 
 from .._internal import RenderContext, remove_empty_keys
-from ..elements import Element, MemoizedElement, PropsType
+from ..elements import BaseElement, Element, MemoizedElement, PropsType
 from .RenderedNode import RenderedNode
 
 logger = logging.getLogger(__name__)
@@ -92,7 +92,8 @@ def _render_list(
     """
     logger.debug("_render_list %s", item)
 
-    with context.open() if is_dirty_render else nullcontext():
+    # No user code runs in this context, so there is nothing for a liveness scope to capture
+    with context.open(capture_liveness=False) if is_dirty_render else nullcontext():
         return _render_list_contents(item, context, is_dirty_render)
 
 
@@ -134,7 +135,8 @@ def _render_dict(
         The rendered dictionary.
     """
     logger.debug("_render_dict %s", item)
-    with context.open() if is_dirty_render else nullcontext():
+    # No user code runs in this context, so there is nothing for a liveness scope to capture
+    with context.open(capture_liveness=False) if is_dirty_render else nullcontext():
         return _render_dict_contents(item, context, is_dirty_render)
 
 
@@ -213,7 +215,8 @@ def _render_element(
             )
             return RenderedNode(element.name, rendered_props)
 
-    with context.open():
+    # BaseElements only return their props, so only other elements can create objects that need to be captured
+    with context.open(capture_liveness=not isinstance(element, BaseElement)):
         logger.debug("Rendering element %s", element.name)
 
         rendered_element_props = element.render()
@@ -1,3 +1,4 @@
 from .NodeEncoder import NodeEncoder
 from .Renderer import Renderer
 from .RenderedNode import RenderedNode
+from .RenderScheduler import RenderScheduler, RenderQueueMetrics
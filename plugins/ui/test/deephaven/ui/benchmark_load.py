@@ -0,0 +1,41 @@
+"""
+Benchmarks are not run as part of the regular test suite. Run them with
+python -m unittest discover -p "benchmark_*.py"
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from .BaseTest import BaseTestCase
+
+EVENTS = 20
+
+
+class LoadBenchmark(BaseTestCase):
+    def test_load_counter_list(self):
+        from deephaven import ui
+        from .fake_client import FakeClient, run_load_test
+
+        @ui.component
+        def counter(index: int):
+            count, set_count = ui.use_state(0)
+            return ui.button(
+                f"Counter {index}: {count}", on_press=lambda: set_count(count + 1)
+            )
+
+        @ui.component
+        def counter_list():
+            return ui.flex([counter(i) for i in range(100)], direction="column")
+
+        def script(client: FakeClient):
+            for _ in range(EVENTS):
+                client.call_callable("onPress", {})
+
+        for clients in [1, 10, 50]:
+            result = run_load_test(counter_list, script, clients=clients)
+            print(result.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Benchmarks are not run as part of the regular test suite. Run them with
+python -m unittest discover -p "benchmark_*.py"
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+import unittest
+from typing import Any, Callable
+
+from .BaseTest import BaseTestCase
+from .test_utils_root import TestRoot
+
+ITEMS = 50_000
+
+
+def measure_retained_bytes(create: Callable[[], Any]) -> tuple[Any, int]:
+    """
+    Measure the memory retained by the result of a function
+
+    Args:
+        create: The function to call
+
+    Returns:
+        The result of the function, and the number of bytes allocated by it that are still in use
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = create()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+class MemoryBenchmark(BaseTestCase):
+    def test_bytes_per_element(self):
+        from deephaven import ui
+
+        elements, retained = measure_retained_bytes(
+            lambda: [ui.text(f"Item {i}", key=str(i)) for i in range(ITEMS)]
+        )
+        print(f"elements: {retained / ITEMS:.0f} bytes per element")
+        self.assertEqual(len(elements), ITEMS)
+
+    def test_bytes_per_rendered_element(self):
+        from deephaven import ui
+        from deephaven.ui._internal.RenderContext import RenderContext
+        from deephaven.ui.renderer.Renderer import Renderer
+
+        @ui.component
+        def item(index: int):
+            return ui.text(f"Item {index}")
+
+        @ui.component
+        def item_list():
+            return ui.flex([item(i, key=str(i)) for i in range(ITEMS)])
+
+        context = RenderContext(TestRoot())
+        renderer = Renderer(context)
+        element = item_list()
+
+        node, retained = measure_retained_bytes(lambda: renderer.render(element))
+        print(
+            f"rendered elements: {retained / ITEMS:.0f} bytes per element, including contexts"
+        )
+        self.assertIsNotNone(node)
+
+        context.unmount()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Benchmarks are not run as part of the regular test suite. Run them with
+python -m unittest discover -p "benchmark_*.py"
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from .BaseTest import BaseTestCase
+from .test_utils_root import TestRoot
+
+ROWS = 500
+RENDERS = 20
+
+
+class RenderBenchmark(BaseTestCase):
+    def measure_render_time(self) -> list[float]:
+        """
+        Measure the time to render a table-free tree of about 2k components,
+        then re-render it from the root
+
+        Returns:
+            The time of each render in seconds
+        """
+        from deephaven import ui
+        from deephaven.ui._internal.RenderContext import RenderContext
+        from deephaven.ui.renderer.Renderer import Renderer
+
+        @ui.component
+        def row(index: int):
+            count, set_count = ui.use_state(index)
+            return ui.flex(
+                ui.text(f"Row {index}"),
+                ui.button("Increment", on_press=lambda: set_count(count + 1)),
+                ui.text(f"Count {count}"),
+            )
+
+        @ui.component
+        def dashboard():
+            return ui.flex([row(i) for i in range(ROWS)], direction="column")
+
+        context = RenderContext(TestRoot())
+        renderer = Renderer(context)
+        element = dashboard()
+
+        times = []
+        for _ in range(RENDERS):
+            start = time.perf_counter()
+            renderer.render(element)
+            times.append(time.perf_counter() - start)
+            context.mark_dirty()
+
+        context.unmount()
+        return times
+
+    def test_render_time_table_free_tree(self):
+        from deephaven.ui._internal.RenderContext import RenderContext
+
+        open_lazy = RenderContext.open
+
+        @contextmanager
+        def open_eager(self, capture_liveness: bool = True):
+            # Always create a liveness scope, as every context did before scopes were created lazily
+            with open_lazy(self, capture_liveness=True) as context:
+                yield context
+
+        with patch.object(RenderContext, "open", open_eager):
+            eager = self.measure_render_time()
+        lazy = self.measure_render_time()
+
+        print(
+            f"eager scopes: median {statistics.median(eager) * 1000:.2f} ms, "
+            f"lazy scopes: median {statistics.median(lazy) * 1000:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
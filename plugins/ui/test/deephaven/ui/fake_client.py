@@ -0,0 +1,367 @@
+"""
+Simulated clients for load testing ElementMessageStream without a browser.
+
+A FakeClient speaks the same JSON-RPC protocol as the web UI's WidgetHandler: it sends `setState` to start
+rendering, applies `documentPatched` notifications to its copy of the document, and calls callables found in
+the document with `callCallable`. run_load_test drives many clients concurrently with a scripted sequence of
+events, and records render latency, patch sizes and CPU time per event.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generator, List, Optional
+from unittest.mock import patch
+
+from deephaven.plugin.object_type import MessageStream
+from pyjsonpatch import apply_patch
+
+CALLABLE_KEY = "__dhCbid"
+
+DEFAULT_TIMEOUT = 30
+"""
+Seconds to wait for a render before giving up on an event.
+"""
+
+
+@dataclass
+class ClientMetrics:
+    """
+    Metrics recorded by a single client.
+    """
+
+    latencies: List[float] = field(default_factory=list)
+    """
+    Seconds from sending each event to receiving the document it rendered.
+    """
+
+    patch_sizes: List[int] = field(default_factory=list)
+    """
+    Size in bytes of each document patch received.
+    """
+
+    timeouts: int = 0
+    """
+    Number of events that did not render a document in time.
+    """
+
+    errors: List[str] = field(default_factory=list)
+    """
+    Document errors received.
+    """
+
+
+@dataclass
+class LoadTestResult:
+    """
+    Metrics of a load test, across all clients.
+    """
+
+    clients: List[ClientMetrics]
+    """
+    The metrics of each client.
+    """
+
+    wall_time: float
+    """
+    Seconds from the first client connecting to the last client finishing its script.
+    """
+
+    cpu_time: float
+    """
+    CPU seconds used by the process during the test.
+    """
+
+    @property
+    def latencies(self) -> List[float]:
+        return [latency for client in self.clients for latency in client.latencies]
+
+    @property
+    def patch_sizes(self) -> List[int]:
+        return [size for client in self.clients for size in client.patch_sizes]
+
+    @property
+    def event_count(self) -> int:
+        return len(self.latencies) + sum(client.timeouts for client in self.clients)
+
+    def latency_percentile(self, percentile: int) -> float:
+        """
+        Get a percentile of the render latency.
+
+        Args:
+            percentile: The percentile to get, from 1 to 99
+
+        Returns:
+            The latency in seconds
+        """
+        latencies = self.latencies
+        if len(latencies) < 2:
+            return latencies[0] if latencies else 0.0
+        return statistics.quantiles(latencies, n=100)[percentile - 1]
+
+    @property
+    def cpu_time_per_event(self) -> float:
+        return self.cpu_time / max(self.event_count, 1)
+
+    def summary(self) -> str:
+        """
+        Get a summary of the result to print.
+
+        Returns:
+            The summary
+        """
+        patch_sizes = self.patch_sizes
+        return (
+            f"{len(self.clients)} clients, {self.event_count} events in {self.wall_time:.2f}s: "
+            f"latency p50 {self.latency_percentile(50) * 1000:.2f} ms, "
+            f"p90 {self.latency_percentile(90) * 1000:.2f} ms, "
+            f"p99 {self.latency_percentile(99) * 1000:.2f} ms, "
+            f"mean patch {statistics.mean(patch_sizes) if patch_sizes else 0:.0f} bytes, "
+            f"cpu {self.cpu_time_per_event * 1000:.2f} ms per event"
+        )
+
+
+def _find_callable(value: Any, prop: str) -> Optional[str]:
+    """
+    Find the ID of the first callable passed as a prop with the given name, depth first.
+
+    Args:
+        value: The encoded document to search
+        prop: The name of the prop, e.g. "onPress"
+
+    Returns:
+        The callable ID, or None if not found
+    """
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if key == prop and isinstance(child, dict) and CALLABLE_KEY in child:
+                return child[CALLABLE_KEY]
+            found = _find_callable(child, prop)
+            if found is not None:
+                return found
+    elif isinstance(value, list):
+        for child in value:
+            found = _find_callable(child, prop)
+            if found is not None:
+                return found
+    return None
+
+
+class FakeClient(MessageStream):
+    """
+    A client connected to an ElementMessageStream, acting like the web UI.
+    """
+
+    document: Any
+    """
+    The client's copy of the rendered document.
+    """
+
+    metrics: ClientMetrics
+    """
+    The metrics recorded by this client.
+    """
+
+    _stream: MessageStream
+    """
+    The stream rendering the element.
+    """
+
+    _document_count: int
+    """
+    Number of documents received.
+    """
+
+    _next_id: int
+    """
+    The ID of the next request sent.
+    """
+
+    _condition: threading.Condition
+    """
+    Notified when a document is received.
+    """
+
+    def __init__(self, element: Any):
+        """
+        Create a client, and the stream rendering the element for it.
+
+        Args:
+            element: The element to render
+        """
+        from deephaven.ui.object_types import ElementMessageStream
+
+        self.document = {}
+        self.metrics = ClientMetrics()
+        self._document_count = 0
+        self._next_id = 0
+        self._condition = threading.Condition()
+        self._stream = ElementMessageStream(element, self)
+
+    def on_data(self, payload: bytes, references: list[Any]) -> None:
+        """
+        Handle a message from the stream.
+
+        Args:
+            payload: The payload from the stream
+            references: The objects exported with the payload
+        """
+        if len(payload) == 0:
+            return
+        message = json.loads(payload.decode())
+        method = message.get("method") if isinstance(message, dict) else None
+        if method == "documentPatched":
+            patch = message["params"][0]
+            with self._condition:
+                self.document = apply_patch(self.document, patch).obj
+                self.metrics.patch_sizes.append(len(payload))
+                self._document_count += 1
+                self._condition.notify_all()
+        elif method == "documentError":
+            with self._condition:
+                self.metrics.errors.append(message["params"][0])
+                self._document_count += 1
+                self._condition.notify_all()
+
+    def on_close(self) -> None:
+        pass
+
+    def connect(self, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """
+        Start the stream and send the initial state, then wait for the first document.
+
+        Args:
+            timeout: Seconds to wait for the document
+        """
+        self._stream.start()
+        self._send_and_wait("setState", [{}], timeout)
+
+    def close(self) -> None:
+        """
+        Close the stream.
+        """
+        self._stream.on_close()
+
+    def call_callable(
+        self, prop: str, *args: Any, timeout: float = DEFAULT_TIMEOUT
+    ) -> None:
+        """
+        Call the first callable passed as the prop in the document, and wait for the document it renders.
+
+        Args:
+            prop: The name of the prop in the encoded document, e.g. "onPress"
+            args: The arguments to call the callable with
+            timeout: Seconds to wait for the document
+        """
+        with self._condition:
+            callable_id = _find_callable(self.document, prop)
+        if callable_id is None:
+            raise ValueError(f"No callable found for prop {prop}")
+        self._send_and_wait("callCallable", [callable_id, list(args)], timeout)
+
+    def _send_and_wait(self, method: str, params: list[Any], timeout: float) -> None:
+        """
+        Send a request, and wait for the next document.
+
+        Args:
+            method: The method to call
+            params: The params to call it with
+            timeout: Seconds to wait for the document
+        """
+        self._next_id += 1
+        request = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": self._next_id,
+        }
+        with self._condition:
+            document_count = self._document_count
+        start = time.perf_counter()
+        self._stream.on_data(json.dumps(request).encode(), [])
+        with self._condition:
+            rendered = self._condition.wait_for(
+                lambda: self._document_count > document_count, timeout
+            )
+        if rendered:
+            self.metrics.latencies.append(time.perf_counter() - start)
+        else:
+            self.metrics.timeouts += 1
+
+
+@contextmanager
+def executor(max_workers: int) -> Generator[None, None, None]:
+    """
+    Run renders on a thread pool instead of the server's concurrent executor, so streams can render headless.
+    Streams created within use a new render scheduler dispatching to the pool.
+
+    Args:
+        max_workers: The number of render threads
+    """
+    from deephaven.ui.renderer.RenderScheduler import RenderScheduler
+
+    module = sys.modules[RenderScheduler.__module__]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+
+        def submit_task(executor_name: str, task: Callable[[], None]) -> None:
+            pool.submit(task)
+
+        with patch.object(module, "submit_task", submit_task), patch.object(
+            RenderScheduler, "_instance", RenderScheduler(max_workers)
+        ):
+            yield
+
+
+def run_load_test(
+    make_element: Callable[[], Any],
+    script: Callable[[FakeClient], None],
+    clients: int,
+    max_workers: int = 8,
+) -> LoadTestResult:
+    """
+    Connect clients concurrently, each with its own instance of an element, and run a script on each.
+
+    Args:
+        make_element: Creates the element for each client
+        script: The events to send from each client once connected, e.g. calling `client.call_callable`
+        clients: The number of clients
+        max_workers: The number of render threads
+
+    Returns:
+        The metrics of the test
+    """
+
+    def run_client(client: FakeClient) -> None:
+        client.connect()
+        script(client)
+
+    with executor(max_workers):
+        fake_clients = [FakeClient(make_element()) for _ in range(clients)]
+        start_cpu = time.process_time()
+        start = time.perf_counter()
+        threads = [
+            threading.Thread(target=run_client, args=(client,))
+            for client in fake_clients
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall_time = time.perf_counter() - start
+        cpu_time = time.process_time() - start_cpu
+
+        for client in fake_clients:
+            client.close()
+
+    return LoadTestResult(
+        clients=[client.metrics for client in fake_clients],
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+    )
@@ -0,0 +1,139 @@
+import sys
+import threading
+from typing import Any, Callable
+from unittest.mock import Mock, patch
+from ..BaseTest import BaseTestCase
+from .render_utils import render_hook
+
+
+class UseBackgroundTaskTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven.ui.hooks import use_background_task
+
+        module = sys.modules[use_background_task.__module__]
+        self.submitted: list[Callable[[], None]] = []
+        patcher = patch.object(module, "submit_task", side_effect=self.submit)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    def submit(self, executor_name: str, task: Callable[[], None]) -> None:
+        self.assertEqual(executor_name, "concurrent")
+        self.submitted.append(task)
+
+    def run_submitted(self):
+        while self.submitted:
+            self.submitted.pop(0)()
+
+    def _test_background_task(self, func: Callable[[], Any], dependencies: Any):
+        from deephaven.ui.hooks import use_background_task
+
+        return use_background_task(func, dependencies)
+
+    def test_result(self):
+        func = Mock(return_value="result")
+        render_result = render_hook(
+            self._test_background_task, func=func, dependencies=[1]
+        )
+        self.assertEqual(render_result["result"], (None, True, None))
+
+        self.run_submitted()
+        func.assert_called_once()
+        render_result["rerender"](func=func, dependencies=[1])
+        self.assertEqual(render_result["result"], ("result", False, None))
+
+        # Same dependencies don't run the function again
+        render_result["rerender"](func=func, dependencies=[1])
+        self.assertEqual(self.submitted, [])
+        self.assertEqual(func.call_count, 1)
+
+    def test_error(self):
+        error = ValueError("failed")
+        func = Mock(side_effect=error)
+        render_result = render_hook(
+            self._test_background_task, func=func, dependencies=[1]
+        )
+        self.run_submitted()
+        render_result["rerender"](func=func, dependencies=[1])
+        self.assertEqual(render_result["result"], (None, False, error))
+
+    def test_superseded(self):
+        func1 = Mock(return_value="result1")
+        func2 = Mock(return_value="result2")
+        render_result = render_hook(
+            self._test_background_task, func=func1, dependencies=[1]
+        )
+
+        # The first task hasn't started when the dependencies change, so it is skipped
+        render_result["rerender"](func=func2, dependencies=[2])
+        self.assertEqual(render_result["result"], (None, True, None))
+        self.run_submitted()
+        func1.assert_not_called()
+        func2.assert_called_once()
+
+        render_result["rerender"](func=func2, dependencies=[2])
+        self.assertEqual(render_result["result"], ("result2", False, None))
+
+        # The previous result is returned while loading
+        started = threading.Event()
+        finish = threading.Event()
+
+        def slow():
+            started.set()
+            finish.wait(5)
+            return "result3"
+
+        func3 = Mock(side_effect=slow)
+        func4 = Mock(return_value="result4")
+        render_result["rerender"](func=func3, dependencies=[3])
+        self.assertEqual(render_result["result"], ("result2", True, None))
+        thread = threading.Thread(target=self.submitted.pop(0))
+        thread.start()
+        self.assertTrue(started.wait(5))
+
+        # The result of a task superseded while running is dropped
+        render_result["rerender"](func=func4, dependencies=[4])
+        finish.set()
+        thread.join()
+        self.run_submitted()
+        render_result["rerender"](func=func4, dependencies=[4])
+        func3.assert_called_once()
+        func4.assert_called_once()
+        self.assertEqual(render_result["result"], ("result4", False, None))
+
+    def test_max_concurrent(self):
+        from deephaven.ui.hooks import use_background_task
+        from deephaven.ui.hooks.use_background_task import MAX_CONCURRENT_TASKS
+
+        def _test_many(funcs: list[Mock]):
+            return [use_background_task(func, []) for func in funcs]
+
+        funcs = [Mock(return_value=i) for i in range(MAX_CONCURRENT_TASKS + 1)]
+        render_hook(_test_many, funcs=funcs)
+
+        # The last task waits for a running task to finish
+        self.assertEqual(len(self.submitted), MAX_CONCURRENT_TASKS)
+        self.submitted.pop(0)()
+        funcs[0].assert_called_once()
+        funcs[-1].assert_called_once()
+        self.run_submitted()
+        for func in funcs:
+            func.assert_called_once()
+
+    def test_failed_task_starts_next(self):
+        from deephaven.ui.hooks.use_background_task import _BackgroundTaskLimiter
+
+        limiter = _BackgroundTaskLimiter(max_concurrent=1)
+        failed = Mock(is_cancelled=False)
+        failed.run.side_effect = RuntimeError("on_done failed")
+        pending = Mock(is_cancelled=False)
+
+        limiter.submit(failed)
+        limiter.submit(pending)
+        self.assertEqual(len(self.submitted), 1)
+
+        # The pending task still runs, and the running slot is released after
+        self.run_submitted()
+        failed.run.assert_called_once()
+        pending.run.assert_called_once()
+        self.assertEqual(limiter._running_count, 0)
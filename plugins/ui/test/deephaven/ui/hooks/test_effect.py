@@ -188,3 +188,37 @@ class UseEffectTestCase(BaseTestCase):
         self.assertEqual(effect2.call_count, 0)
         self.assertEqual(cleanup2.call_count, 1)
         self.assertEqual(self.called_funcs, ["cleanup2"])
+
+    def test_async_effect(self) -> None:
+        """
+        Test the use_effect hook with an async effect.
+        It should run the effect without blocking the render, and cancel it when the dependencies change.
+        """
+        import asyncio
+        import threading
+
+        started = threading.Event()
+        cancelled = threading.Event()
+
+        async def effect():
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        result = render_hook(self._test_use_effect, effect=effect, dependencies=[1])
+        self.assertTrue(started.wait(5))
+        self.assertFalse(cancelled.is_set())
+
+        result["rerender"](effect=effect, dependencies=[1])
+        self.assertFalse(cancelled.is_set())
+
+        # Changing the dependencies cancels the running effect
+        result["rerender"](effect=self.effect, dependencies=[2])
+        self.assertTrue(cancelled.wait(5))
+        self.assertEqual(self.effect.call_count, 1)
+
+        result["unmount"]()
+        self.assertEqual(self.cleanup.call_count, 1)
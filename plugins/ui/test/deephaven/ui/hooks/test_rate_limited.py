@@ -0,0 +1,71 @@
+from queue import Queue
+from typing import Any, Callable
+from unittest.mock import Mock
+from ..BaseTest import BaseTestCase
+from .render_utils import render_hook
+
+
+class UseRateLimitedTestCase(BaseTestCase):
+    def _render(self, hook: Callable[..., Any], func: Mock):
+        queue: Queue[Any] = Queue()
+
+        def _test_rate_limited(func: Callable[..., Any] = func, wait_ms: float = 50):
+            return hook(func, wait_ms)
+
+        return render_hook(_test_rate_limited, queue=queue), queue
+
+    def test_debounce(self):
+        from deephaven.ui.hooks import use_debounce
+
+        func = Mock()
+        render_result, queue = self._render(use_debounce, func)
+        debounced = render_result["result"]
+
+        debounced(1)
+        debounced(2)
+        debounced(3)
+        func.assert_not_called()
+
+        # Only the latest call is queued once the window ends
+        queue.get(timeout=5)()
+        func.assert_called_once_with(3)
+        self.assertTrue(queue.empty())
+
+        # The same callable is returned on every render, and calls the latest function
+        func2 = Mock()
+        render_result["rerender"](func=func2)
+        self.assertIs(render_result["result"], debounced)
+        debounced(4)
+        queue.get(timeout=5)()
+        func2.assert_called_once_with(4)
+        self.assertEqual(func.call_count, 1)
+
+    def test_throttle(self):
+        from deephaven.ui.hooks import use_throttle
+
+        func = Mock(return_value="result")
+        render_result, queue = self._render(use_throttle, func)
+        throttled = render_result["result"]
+
+        # The first call is applied immediately, the rest are coalesced
+        self.assertEqual(throttled(1), "result")
+        self.assertEqual(throttled(2), None)
+        self.assertEqual(throttled(3), None)
+        func.assert_called_once_with(1)
+
+        queue.get(timeout=5)()
+        self.assertEqual(func.call_count, 2)
+        func.assert_called_with(3)
+
+    def test_cancel_on_unmount(self):
+        from deephaven.ui.hooks import use_debounce
+
+        func = Mock()
+        render_result, queue = self._render(use_debounce, func)
+        debounced = render_result["result"]
+
+        debounced(1)
+        render_result["unmount"]()
+        self.assertIsNone(debounced._pending_args)
+        self.assertIsNone(debounced._timer)
+        func.assert_not_called()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+import json
+from unittest.mock import Mock, patch
+from .BaseTest import BaseTestCase
+
+OBJECT_KEY = "__dhObid"
+
+
+def make_patch_payload(patch: list) -> bytes:
+    return json.dumps(
+        {"jsonrpc": "2.0", "method": "documentPatched", "params": [patch]}
+    ).encode()
+
+
+class BroadcastTestCase(BaseTestCase):
+    def test_broadcast_component(self):
+        from deephaven import ui
+
+        @ui.component
+        def regular():
+            return ui.text("regular")
+
+        @ui.component(broadcast=True)
+        def shared():
+            return ui.text("shared")
+
+        @ui.component(memo=True, broadcast=True)
+        def memo_shared():
+            return ui.text("memo shared")
+
+        self.assertEqual(regular().broadcast, False)
+        self.assertEqual(shared().broadcast, True)
+        self.assertEqual(memo_shared().broadcast, True)
+
+    def make_viewer(self):
+        from deephaven.ui.object_types.BroadcastMessageStream import (
+            BroadcastMessageStream,
+        )
+
+        connection = Mock()
+        with patch(
+            "deephaven.ui.object_types.BroadcastMessageStream.ElementBroadcast"
+        ) as broadcast:
+            broadcast.acquire.return_value.make_dispatcher.return_value = {}
+            viewer = BroadcastMessageStream(Mock(), connection)
+        return viewer, connection
+
+    def test_viewer_subscribed_before_render(self):
+        viewer, connection = self.make_viewer()
+        viewer.send_document(None, {})
+
+        # Object IDs are the same as the shared IDs, so messages are sent as is
+        payload = make_patch_payload(
+            [{"op": "add", "path": "/props", "value": {OBJECT_KEY: 0}}]
+        )
+        table = object()
+        viewer.send_shared(payload, [table], {0: table})
+        connection.on_data.assert_called_once_with(payload, [table])
+
+    def test_viewer_subscribed_after_render(self):
+        viewer, connection = self.make_viewer()
+
+        table0 = object()
+        table2 = object()
+        # Object 1 was sent to other viewers, but is no longer in the document
+        document = {
+            "__dhElemName": "deephaven.ui.components.Flex",
+            "props": {"children": [{OBJECT_KEY: 0}, {OBJECT_KEY: 2}]},
+        }
+        viewer.send_document(document, {0: table0, 2: table2})
+
+        payload, objects = connection.on_data.call_args[0]
+        self.assertEqual(objects, [table0, table2])
+        sent_patch = json.loads(payload.decode())["params"][0]
+        self.assertIn(
+            {
+                "op": "add",
+                "path": "/props",
+                "value": {"children": [{OBJECT_KEY: 0}, {OBJECT_KEY: 1}]},
+            },
+            sent_patch,
+        )
+
+        # New objects from the shared document get the next IDs of the viewer
+        table3 = object()
+        viewer.send_shared(
+            make_patch_payload(
+                [
+                    {
+                        "op": "replace",
+                        "path": "/props/children",
+                        "value": [{OBJECT_KEY: 3}, {OBJECT_KEY: 2}],
+                    }
+                ]
+            ),
+            [table3],
+            {2: table2, 3: table3},
+        )
+
+        payload, objects = connection.on_data.call_args[0]
+        self.assertEqual(objects, [table3])
+        self.assertEqual(
+            json.loads(payload.decode())["params"][0],
+            [
+                {
+                    "op": "replace",
+                    "path": "/props/children",
+                    "value": [{OBJECT_KEY: 2}, {OBJECT_KEY: 1}],
+                }
+            ],
+        )
+        # Object 0 left the document, so it is forgotten
+        self.assertEqual(viewer._object_ids, {2: 1, 3: 2})
+
+        # Messages without objects are sent as is
+        event = json.dumps(
+            {"jsonrpc": "2.0", "method": "event", "params": ["toast", "{}"]}
+        ).encode()
+        viewer.send_shared(event, [], {2: table2, 3: table3})
+        connection.on_data.assert_called_with(event, [])
+
+    def test_viewer_remaps_every_message(self):
+        viewer, connection = self.make_viewer()
+
+        # Object 0 was sent to other viewers, but is no longer in the document
+        table1 = object()
+        document = {
+            "__dhElemName": "deephaven.ui.components.Flex",
+            "props": {"child": {OBJECT_KEY: 1}},
+        }
+        viewer.send_document(document, {1: table1})
+
+        # Objects sent with messages other than patches are remapped and numbered too
+        table2 = object()
+        event = json.dumps(
+            {"jsonrpc": "2.0", "method": "event", "params": [{OBJECT_KEY: 2}]}
+        ).encode()
+        viewer.send_shared(event, [table2], {1: table1})
+
+        payload, objects = connection.on_data.call_args[0]
+        self.assertEqual(objects, [table2])
+        self.assertEqual(json.loads(payload.decode())["params"], [{OBJECT_KEY: 1}])
+
+        table3 = object()
+        viewer.send_shared(
+            make_patch_payload(
+                [{"op": "add", "path": "/props/child", "value": {OBJECT_KEY: 3}}]
+            ),
+            [table3],
+            {3: table3},
+        )
+
+        payload, _ = connection.on_data.call_args[0]
+        self.assertEqual(
+            json.loads(payload.decode())["params"][0][0]["value"], {OBJECT_KEY: 2}
+        )
+        self.assertEqual(viewer._object_ids, {3: 2})
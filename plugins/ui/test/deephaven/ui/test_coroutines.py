@@ -0,0 +1,69 @@
+from __future__ import annotations
+import asyncio
+import threading
+from unittest.mock import Mock
+from .BaseTest import BaseTestCase
+
+
+class CoroutinesTestCase(BaseTestCase):
+    def test_run_coroutine(self):
+        from deephaven.ui._internal import run_coroutine
+
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        self.assertEqual(run_coroutine(add(1, 2)).result(5), 3)
+
+    def test_run_coroutine_cancel(self):
+        from deephaven.ui._internal import run_coroutine
+
+        started = threading.Event()
+        cancelled = threading.Event()
+
+        async def wait():
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        future = run_coroutine(wait())
+        self.assertTrue(started.wait(5))
+        future.cancel()
+        self.assertTrue(cancelled.wait(5))
+
+    def test_superseded_call_cancelled(self):
+        from concurrent.futures import wait
+        from deephaven.ui.object_types.ElementMessageStream import (
+            ElementMessageStream,
+        )
+
+        stream = ElementMessageStream(Mock(), Mock())
+
+        async def handler():
+            await asyncio.sleep(60)
+
+        stream._run_callable_coroutine("cb0", handler())
+        first = stream._coroutines["cb0"]
+        stream._run_callable_coroutine("cb0", handler())
+        second = stream._coroutines["cb0"]
+        stream._run_callable_coroutine("cb1", handler())
+        other = stream._coroutines["cb1"]
+
+        # Only the previous call of the same callable is cancelled
+        wait([first], timeout=5)
+        self.assertTrue(first.cancelled())
+        self.assertFalse(second.done())
+        self.assertFalse(other.done())
+        self.assertEqual(len(stream._coroutines), 2)
+
+        # Finished calls are removed
+        second.cancel()
+        wait([second], timeout=5)
+        self.assertNotIn("cb0", stream._coroutines)
+
+        stream.on_close()
+        self.assertTrue(other.cancelled())
+        self.assertEqual(stream._coroutines, {})
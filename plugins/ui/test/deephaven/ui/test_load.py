@@ -0,0 +1,31 @@
+from __future__ import annotations
+from .BaseTest import BaseTestCase
+
+CLIENTS = 4
+EVENTS = 5
+
+
+class LoadTestCase(BaseTestCase):
+    def test_load(self):
+        from deephaven import ui
+        from .fake_client import FakeClient, run_load_test
+
+        @ui.component
+        def counter():
+            count, set_count = ui.use_state(0)
+            return ui.button(f"Count {count}", on_press=lambda: set_count(count + 1))
+
+        def script(client: FakeClient):
+            for _ in range(EVENTS):
+                client.call_callable("onPress", {})
+
+        result = run_load_test(counter, script, clients=CLIENTS)
+
+        for client in result.clients:
+            self.assertEqual(client.timeouts, 0)
+            self.assertEqual(client.errors, [])
+            # The initial render, plus one render per event
+            self.assertEqual(len(client.latencies), EVENTS + 1)
+            self.assertEqual(len(client.patch_sizes), EVENTS + 1)
+        self.assertEqual(result.event_count, CLIENTS * (EVENTS + 1))
+        self.assertGreater(result.latency_percentile(99), 0)
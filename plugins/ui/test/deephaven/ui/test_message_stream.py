@@ -0,0 +1,116 @@
+from __future__ import annotations
+import json
+import sys
+from unittest.mock import Mock, patch
+from .BaseTest import BaseTestCase
+
+
+def make_request(id: int, method: str, params: list) -> dict:
+    return {"jsonrpc": "2.0", "id": id, "method": method, "params": params}
+
+
+class ElementMessageStreamTestCase(BaseTestCase):
+    def make_stream(self):
+        from deephaven.ui.object_types import ElementMessageStream
+        from deephaven.ui.renderer.RenderScheduler import RenderScheduler
+
+        # The render loop is run by the test instead of the scheduler
+        module = sys.modules[RenderScheduler.__module__]
+        for patcher in [
+            patch.object(module, "submit_task"),
+            patch.object(RenderScheduler, "_instance", RenderScheduler()),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        connection = Mock()
+        stream = ElementMessageStream(Mock(), connection)
+        stream._callable_dict = {
+            "cb0": lambda value: value + 1,
+            "cb1": lambda value: value * 2,
+        }
+        return stream, connection
+
+    def test_responses_sent_together(self):
+        stream, connection = self.make_stream()
+
+        stream.on_data(
+            json.dumps(make_request(1, "callCallable", ["cb0", [1]])).encode(), []
+        )
+        stream.on_data(
+            json.dumps(make_request(2, "callCallable", ["cb1", [2]])).encode(), []
+        )
+        connection.on_data.assert_not_called()
+
+        stream._process_callable_queue()
+
+        connection.on_data.assert_called_once()
+        payload, references = connection.on_data.call_args[0]
+        self.assertEqual(references, [])
+        responses = json.loads(payload.decode())
+        self.assertEqual(
+            [(response["id"], response["result"]) for response in responses],
+            [(1, "2"), (2, "4")],
+        )
+
+    def test_message_while_dispatching(self):
+        from deephaven.ui.renderer.RenderScheduler import RenderScheduler
+
+        stream, connection = self.make_stream()
+        scheduler = RenderScheduler.get_instance()
+        render_loop = stream._process_callable_queue
+        queued_while_dispatching = []
+
+        def dispatched_loop():
+            if not queued_while_dispatching:
+                # A message arrives after the loop is dispatched, before it starts rendering
+                stream.on_data(
+                    json.dumps(make_request(1, "callCallable", ["cb0", [1]])).encode(),
+                    [],
+                )
+                queued_while_dispatching.append(
+                    scheduler.get_metrics()[stream].is_queued
+                )
+            render_loop()
+
+        stream._process_callable_queue = dispatched_loop
+        stream._queue_render()
+        scheduler._run_worker()
+
+        # The dispatched loop handles the message, and no other loop is queued to run alongside it
+        self.assertEqual(queued_while_dispatching, [False])
+        self.assertEqual(scheduler.get_metrics()[stream].render_count, 1)
+        connection.on_data.assert_called_once()
+
+    def test_batch_request(self):
+        stream, connection = self.make_stream()
+
+        stream.on_data(
+            json.dumps(
+                [
+                    make_request(1, "callCallable", ["cb0", [1]]),
+                    make_request(2, "callCallable", ["cb1", [2]]),
+                ]
+            ).encode(),
+            [],
+        )
+        stream._process_callable_queue()
+
+        connection.on_data.assert_called_once()
+        responses = json.loads(connection.on_data.call_args[0][0].decode())
+        self.assertEqual(
+            [(response["id"], response["result"]) for response in responses],
+            [(1, "2"), (2, "4")],
+        )
+
+    def test_single_response(self):
+        stream, connection = self.make_stream()
+
+        stream.on_data(
+            json.dumps(make_request(1, "callCallable", ["cb0", [1]])).encode(), []
+        )
+        stream._process_callable_queue()
+
+        response = json.loads(connection.on_data.call_args[0][0].decode())
+        self.assertEqual(response["id"], 1)
+        self.assertEqual(response["result"], "2")
@@ -72,6 +72,31 @@ class RenderTestCase(BaseTestCase):
             self.assertRaises(KeyError, rc.init_state, 0, 3)
             self.assertEqual(on_change.call_count, 0)
 
+    def test_lazy_liveness_scope(self):
+        from deephaven import new_table
+        from deephaven.column import int_col
+
+        rc = make_render_context()
+
+        with rc.open(capture_liveness=False):
+            rc.init_state(0, 2)
+            rc.init_state(1, new_table([int_col("X", [1])]))
+
+        # Plain values don't need a scope
+        with rc.open(capture_liveness=False):
+            self.assertEqual(rc.get_state(0), 2)
+            self.assertIsNone(rc._top_level_scope)
+        self.assertEqual(rc._collected_scopes, set())
+
+        # Managing a liveness referent creates the scope on demand
+        with rc.open(capture_liveness=False):
+            rc.get_state(1)
+            self.assertIsNotNone(rc._top_level_scope)
+        self.assertEqual(len(rc._collected_scopes), 1)
+
+        with rc.open():
+            self.assertIsNotNone(rc._top_level_scope)
+
     def test_context(self):
         on_change = Mock(side_effect=run_on_change)
         rc = make_render_context(on_change)
@@ -193,6 +218,60 @@ class RenderExportTestCase(BaseTestCase):
         state = rc.export_state()
         self.assertEqual(state, {})
 
+    def test_export_changed_state(self):
+        rc = make_render_context()
+
+        with rc.open():
+            rc.init_state(0, 1)
+            child_context0 = rc.get_child_context("0")
+            with child_context0.open():
+                child_context0.init_state(0, 2)
+                child_context0.init_state(1, [])
+            child_context1 = rc.get_child_context("1")
+            with child_context1.open():
+                child_context1.init_state(0, 3)
+
+        self.assertEqual(rc.is_state_dirty, True)
+        state = rc.export_state()
+        self.assertEqual(rc.is_state_dirty, False)
+        child1_state = child_context1.export_state()
+
+        # Nothing changed, so the last export is reused
+        self.assertIs(rc.export_state(), state)
+
+        # Values that are not exported do not change the exported state
+        child_context0.set_state(1, [1])
+        self.assertEqual(rc.is_state_dirty, False)
+
+        # Setting the same value does not change the exported state
+        child_context0.set_state(0, 2)
+        self.assertEqual(rc.is_state_dirty, False)
+
+        child_context0.set_state(0, 4)
+        self.assertEqual(rc.is_state_dirty, True)
+        self.assertEqual(child_context1.is_state_dirty, False)
+
+        state = rc.export_state()
+        self.assertEqual(
+            state,
+            {
+                "state": {0: 1},
+                "children": {"0": {"state": {0: 4}}, "1": {"state": {0: 3}}},
+            },
+        )
+        # Contexts that did not change are not exported again
+        self.assertIs(state["children"]["1"], child1_state)
+
+        # Removing a child with state changes the exported state
+        with rc.open():
+            rc.get_child_context("0")
+
+        self.assertEqual(rc.is_state_dirty, True)
+        self.assertEqual(
+            rc.export_state(),
+            {"state": {0: 1}, "children": {"0": {"state": {0: 4}}}},
+        )
+
 
 class RenderImportTestCase(BaseTestCase):
     def test_import_empty_context(self):
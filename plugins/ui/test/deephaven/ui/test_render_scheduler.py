@@ -0,0 +1,106 @@
+from __future__ import annotations
+import sys
+from typing import Callable
+from unittest.mock import patch
+from .BaseTest import BaseTestCase
+
+
+class RenderSchedulerTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        from deephaven.ui.renderer.RenderScheduler import RenderScheduler
+
+        module = sys.modules[RenderScheduler.__module__]
+        self.workers: list[Callable[[], None]] = []
+        patcher = patch.object(
+            module,
+            "submit_task",
+            side_effect=lambda name, task: self.workers.append(task),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.scheduler = RenderScheduler(max_workers=1)
+        self.rendered: list[str] = []
+        return super().setUp()
+
+    def schedule(self, key: str, interactive: bool = False):
+        self.scheduler.schedule(
+            key, lambda: self.rendered.append(key), interactive=interactive
+        )
+
+    def run_workers(self):
+        while self.workers:
+            self.workers.pop(0)()
+
+    def test_round_robin(self):
+        for key in ["a", "b", "c"]:
+            self.scheduler.register(key, lambda: 0)
+        self.schedule("a")
+        self.schedule("b")
+        # Already queued, so it keeps its place
+        self.schedule("a")
+        self.schedule("c")
+
+        self.assertEqual(len(self.workers), 1)
+        self.run_workers()
+        self.assertEqual(self.rendered, ["a", "b", "c"])
+
+    def test_interactive_first(self):
+        from deephaven.ui.renderer.RenderScheduler import _BACKGROUND_INTERVAL
+
+        keys = [f"interactive{i}" for i in range(_BACKGROUND_INTERVAL + 1)]
+        for key in ["tick", "promoted", *keys]:
+            self.scheduler.register(key, lambda: 0)
+
+        self.schedule("tick")
+        self.schedule("promoted")
+        for key in keys:
+            self.schedule(key, interactive=True)
+        self.schedule("promoted", interactive=True)
+        self.run_workers()
+
+        # Background renders still get a turn after a streak of interactive renders
+        self.assertEqual(
+            self.rendered,
+            [*keys[:_BACKGROUND_INTERVAL], "tick", keys[-1], "promoted"],
+        )
+
+    def test_promote(self):
+        for key in ["a", "b", "idle"]:
+            self.scheduler.register(key, lambda: 0)
+        self.schedule("a")
+        self.schedule("b")
+        self.scheduler.promote("b")
+        # Streams that are not waiting are not queued by promoting them
+        self.scheduler.promote("idle")
+        self.run_workers()
+        self.assertEqual(self.rendered, ["b", "a"])
+        self.assertFalse(self.scheduler.get_metrics()["idle"].is_queued)
+
+        # Once dispatched, a render loop can no longer be promoted or queued again
+        self.scheduler.register("running", lambda: 0)
+        self.scheduler.schedule("running", lambda: self.scheduler.promote("running"))
+        self.run_workers()
+        self.assertFalse(self.scheduler.get_metrics()["running"].is_queued)
+        self.assertEqual(self.scheduler.get_metrics()["running"].render_count, 1)
+
+    def test_metrics(self):
+        self.scheduler.register("a", lambda: 3)
+        self.scheduler.register("b", lambda: 0)
+        self.schedule("a", interactive=True)
+
+        metrics = self.scheduler.get_metrics()
+        self.assertEqual(metrics["a"].queue_depth, 3)
+        self.assertTrue(metrics["a"].is_queued)
+        self.assertTrue(metrics["a"].is_interactive)
+        self.assertFalse(metrics["b"].is_queued)
+
+        self.run_workers()
+        metrics = self.scheduler.get_metrics()
+        self.assertFalse(metrics["a"].is_queued)
+        self.assertEqual(metrics["a"].render_count, 1)
+        self.assertEqual(metrics["a"].wait_time, 0)
+        self.assertGreaterEqual(metrics["a"].max_wait_time, 0)
+
+        self.scheduler.unregister("a")
+        self.assertNotIn("a", self.scheduler.get_metrics())